@@ -1,24 +1,45 @@
+import os
 import posixpath
+import shlex
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from subprocess import Popen
 
 import fs as fs2
+from fs.copy import copy_file
+from fs.move import move_file
 from fs.tempfs import TempFS
 
 from powersimdata.data_access.profile_helper import (
     get_profile_version_cloud,
     get_profile_version_local,
 )
-from powersimdata.data_access.ssh_fs import WrapSSHFS
+from powersimdata.data_access.ssh_fs import SSHConnectionPool, WrapSSHFS, _is_active
 from powersimdata.utility import server_setup
 
+_pools = {}
 
-def get_ssh_fs(root=""):
+
+def get_ssh_pool():
+    """Return the pool of connections to the server, creating it on first use.
+
+    :return: (*powersimdata.data_access.ssh_fs.SSHConnectionPool*) -- the pool
+    """
     host = server_setup.SERVER_ADDRESS
     port = server_setup.SERVER_SSH_PORT
     username = server_setup.get_server_user()
-    base_fs = fs2.open_fs(f"ssh://{username}@{host}:{port}")
-    return WrapSSHFS(base_fs, root)
+    key = (username, host, port)
+    if key not in _pools:
+        _pools[key] = SSHConnectionPool(
+            lambda: fs2.open_fs(f"ssh://{username}@{host}:{port}"),
+            max_size=SSHDataAccess.max_connections,
+        )
+    return _pools[key]
+
+
+def get_ssh_fs(root=""):
+    return WrapSSHFS(get_ssh_pool().get(), root)
 
 
 class DataAccess:
@@ -46,6 +67,24 @@ class DataAccess:
         """
         raise NotImplementedError
 
+    def copy_from_many(self, file_names, from_dir=None):
+        """Copy files from data store to userspace.
+
+        :param list file_names: file names to copy.
+        :param str from_dir: data store directory to copy files from.
+        """
+        for file_name in file_names:
+            self.copy_from(file_name, from_dir)
+
+    def move_to_many(self, file_names, to_dir=None):
+        """Copy files from userspace to data store.
+
+        :param list file_names: file names to copy.
+        :param str to_dir: data store directory to copy files to.
+        """
+        for file_name in file_names:
+            self.move_to(file_name, to_dir)
+
     def tmp_folder(self, scenario_id):
         """Get path to temporary scenario folder
 
@@ -65,6 +104,14 @@ class DataAccess:
 
         self.fs.copy(src, dest)
 
+    def link(self, src, dest):
+        """Hard link a file to a new path, or copy it if links are not supported.
+
+        :param str src: path to file
+        :param str dest: path to new file
+        """
+        self.fs.copy(src, dest)
+
     def remove(self, pattern, confirm=True):
         """Delete files in current environment
 
@@ -79,14 +126,16 @@ class DataAccess:
         self.fs.glob(pattern).remove()
         print("--> Done!")
 
-    def _check_file_exists(self, path, should_exist=True):
+    def _check_file_exists(self, path, should_exist=True, filesystem=None):
         """Check that file exists (or not) at the given path
 
         :param str path: the relative path to the file
         :param bool should_exist: whether the file is expected to exist
+        :param fs.base.FS filesystem: filesystem to check, defaults to the data store.
         :raises OSError: if the expected condition is not met
         """
-        exists = self.fs.exists(path)
+        filesystem = self.fs if filesystem is None else filesystem
+        exists = filesystem.exists(path)
         if should_exist and not exists:
             raise OSError(f"{path} not found on {self.description}")
         if not should_exist and exists:
@@ -151,6 +200,17 @@ class LocalDataAccess(DataAccess):
         """
         pass
 
+    def link(self, src, dest):
+        """Hard link a file to a new path, or copy it if links are not supported.
+
+        :param str src: path to file
+        :param str dest: path to new file
+        """
+        try:
+            os.link(self.fs.getsyspath(src), self.fs.getsyspath(dest))
+        except OSError:
+            super().link(src, dest)
+
     def push(self, file_name, checksum, change_name_to=None):
         """Nothing to be done due to symlink
 
@@ -176,9 +236,12 @@ class LocalDataAccess(DataAccess):
 
 
 class SSHDataAccess(DataAccess):
-    """Interface to a remote data store, accessed via SSH."""
+    """Interface to a remote data store, accessed via SSH. Connections are pooled
+    and shared by all instances."""
 
     _last_attempt = 0
+    #: maximum number of connections used by bulk transfers.
+    max_connections = 4
 
     def __init__(self, root=server_setup.DATA_ROOT_DIR):
         """Constructor"""
@@ -191,11 +254,14 @@ class SSHDataAccess(DataAccess):
 
     @property
     def fs(self):
-        """Get or create the filesystem object, with attempts rate limited.
+        """Get or create the filesystem object, with attempts rate limited. The
+        filesystem is created again from the pool when its connection was dropped.
 
         :raises IOError: if connection failed or still within retry window
         :return: (*powersimdata.data_access.ssh_fs.WrapSSHFS) -- filesystem instance
         """
+        if isinstance(self._fs, WrapSSHFS) and not _is_active(self._fs.delegate_fs()):
+            self._fs = None
         if self._fs is None:
             should_attempt = (
                 time.time() - SSHDataAccess._last_attempt > self._retry_after
@@ -211,26 +277,54 @@ class SSHDataAccess(DataAccess):
 
         return self._fs
 
-    def copy_from(self, file_name, from_dir=None):
-        """Copy a file from data store to userspace.
+    @contextmanager
+    def _connection(self):
+        """Get a filesystem on a connection used by no other thread.
+
+        :return: (*powersimdata.data_access.ssh_fs.WrapSSHFS*) -- filesystem instance
+        """
+        with get_ssh_pool().connection() as conn:
+            yield WrapSSHFS(conn, self.root)
+
+    def _run_parallel(self, func, file_names, *args):
+        """Apply a transfer function to files in parallel, each thread using its own
+        connection.
+
+        :param callable func: function taking a filesystem, a file name and args.
+        :param list file_names: file names to transfer.
+        :param \\*args: additional arguments passed to func.
+        """
+
+        def transfer(file_name):
+            with self._connection() as remote_fs:
+                func(remote_fs, file_name, *args)
+
+        with ThreadPoolExecutor(max_workers=self.max_connections) as executor:
+            for _ in executor.map(transfer, file_names):
+                pass
 
+    def _copy_from(self, remote_fs, file_name, from_dir):
+        """Copy a file from the given remote filesystem to userspace.
+
+        :param fs.base.FS remote_fs: remote filesystem.
         :param str file_name: file name to copy.
         :param str from_dir: data store directory to copy file from.
         """
         from_dir = "" if from_dir is None else from_dir
         from_path = self.join(from_dir, file_name)
-        self._check_file_exists(from_path, should_exist=True)
+        self._check_file_exists(from_path, should_exist=True, filesystem=remote_fs)
 
         print(f"Transferring {file_name} from server")
         with TempFS() as tmp_fs:
             self.local_fs.makedirs(from_dir, recreate=True)
             tmp_fs.makedirs(from_dir, recreate=True)
-            fs2.copy.copy_file(self.fs, from_path, tmp_fs, from_path)
-            fs2.move.move_file(tmp_fs, from_path, self.local_fs, from_path)
+            copy_file(remote_fs, from_path, tmp_fs, from_path)
+            move_file(tmp_fs, from_path, self.local_fs, from_path)
 
-    def move_to(self, file_name, to_dir=None, change_name_to=None):
-        """Copy a file from userspace to data store.
+    def _move_to(self, remote_fs, file_name, to_dir, change_name_to=None):
+        """Copy a file from userspace to the given remote filesystem.
 
+        :param fs.base.FS remote_fs: remote filesystem.
         :param str file_name: file name to copy.
         :param str to_dir: data store directory to copy file to.
         :param str change_name_to: new name for file when copied to data store.
@@ -243,13 +337,50 @@ class SSHDataAccess(DataAccess):
 
         change_name_to = file_name if change_name_to is None else change_name_to
         to_dir = "" if to_dir is None else to_dir
-        self.makedir(to_dir)
+        remote_fs.makedirs(to_dir, recreate=True)
 
         to_path = self.join(to_dir, change_name_to)
-        self._check_file_exists(to_path, should_exist=False)
+        self._check_file_exists(to_path, should_exist=False, filesystem=remote_fs)
 
         print(f"Transferring {change_name_to} to server")
-        fs2.move.move_file(self.local_fs, file_name, self.fs, to_path)
+        move_file(self.local_fs, file_name, remote_fs, to_path)
+
+    def copy_from(self, file_name, from_dir=None):
+        """Copy a file from data store to userspace.
+
+        :param str file_name: file name to copy.
+        :param str from_dir: data store directory to copy file from.
+        """
+        self._copy_from(self.fs, file_name, from_dir)
+
+    def copy_from_many(self, file_names, from_dir=None):
+        """Copy files from data store to userspace, in parallel over pooled
+        connections.
+
+        :param list file_names: file names to copy.
+        :param str from_dir: data store directory to copy files from.
+        """
+        self._run_parallel(self._copy_from, file_names, from_dir)
+
+    def move_to(self, file_name, to_dir=None, change_name_to=None):
+        """Copy a file from userspace to data store.
+
+        :param str file_name: file name to copy.
+        :param str to_dir: data store directory to copy file to.
+        :param str change_name_to: new name for file when copied to data store.
+        :raises FileNotFoundError: if specified file does not exist
+        """
+        self._move_to(self.fs, file_name, to_dir, change_name_to)
+
+    def move_to_many(self, file_names, to_dir=None):
+        """Copy files from userspace to data store, in parallel over pooled
+        connections.
+
+        :param list file_names: file names to copy.
+        :param str to_dir: data store directory to copy files to.
+        :raises FileNotFoundError: if one of the files does not exist
+        """
+        self._run_parallel(self._move_to, file_names, to_dir)
 
     def execute_command_async(self, command):
         """Execute a command via ssh, without waiting for completion.
@@ -258,7 +389,19 @@ class SSHDataAccess(DataAccess):
         :return: (*subprocess.Popen*) -- the local ssh process
         """
         username = server_setup.get_server_user()
-        cmd_ssh = ["ssh", username + "@" + server_setup.SERVER_ADDRESS]
+        control_path = os.path.join(os.path.expanduser("~"), ".ssh", "psd-%r@%h:%p")
+        cmd_ssh = [
+            "ssh",
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            f"ControlPath={control_path}",
+            "-o",
+            "ControlPersist=600",
+            "-p",
+            str(server_setup.SERVER_SSH_PORT),
+            username + "@" + server_setup.SERVER_ADDRESS,
+        ]
         full_command = cmd_ssh + command
         process = Popen(full_command)
         return process
@@ -274,6 +417,22 @@ class SSHDataAccess(DataAccess):
 
         return self.fs.checksum(full_path)
 
+    def link(self, src, dest):
+        """Hard link a file to a new path on the server.
+
+        :param str src: path to file
+        :param str dest: path to new file
+        :raises IOError: if command generated stderr
+        """
+        command = "ln -f {} {}".format(
+            shlex.quote(posixpath.join(self.root, src)),
+            shlex.quote(posixpath.join(self.root, dest)),
+        )
+        _, _, stderr = self.fs.exec_command(command)
+        errors = stderr.readlines()
+        if len(errors) > 0:
+            raise IOError(f"Failed to link {src} to {dest}: {''.join(errors)}")
+
     def push(self, file_name, checksum, change_name_to=None):
         """Push file to server and verify the checksum matches a prior value
 
@@ -287,9 +446,9 @@ class SSHDataAccess(DataAccess):
         self.move_to(file_name, change_name_to=backup)
 
         values = {
-            "original": posixpath.join(self.root, new_name),
-            "updated": posixpath.join(self.root, backup),
-            "lockfile": posixpath.join(self.root, "scenario.lockfile"),
+            "original": shlex.quote(posixpath.join(self.root, new_name)),
+            "updated": shlex.quote(posixpath.join(self.root, backup)),
+            "lockfile": shlex.quote(posixpath.join(self.root, "scenario.lockfile")),
             "checksum": checksum,
         }
 
@@ -320,6 +479,22 @@ class MemoryDataAccess(SSHDataAccess):
         self.local_root = self.root = "dummy"
         self.join = fs2.path.join
 
+    @contextmanager
+    def _connection(self):
+        """Get the in-memory remote filesystem, which is thread safe.
+
+        :return: (*fs.memoryfs.MemoryFS*) -- filesystem instance
+        """
+        yield self._fs
+
+    def link(self, src, dest):
+        """Copy a file to a new path, links are not supported in memory.
+
+        :param str src: path to file
+        :param str dest: path to new file
+        """
+        self.fs.copy(src, dest)
+
     def push(self, file_name, checksum, change_name_to=None):
         """Push file from local to remote filesystem, bypassing checksum since this is
         in memory.
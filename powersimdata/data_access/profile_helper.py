@@ -1,7 +1,13 @@
+import base64
+import hashlib
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import fs
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm.auto import tqdm
 
 from powersimdata.utility import server_setup
@@ -42,6 +48,10 @@ def get_profile_version_local(grid_model, kind):
 
 class ProfileHelper:
     BASE_URL = "https://besciences.blob.core.windows.net/profiles"
+    #: number of concurrent connections used by downloads.
+    MAX_WORKERS = 8
+    #: size in bytes of the ranges large files are split into.
+    CHUNK_SIZE = 32 * 1024**2
 
     @staticmethod
     def get_file_components(scenario_info, field_name):
@@ -65,23 +75,220 @@ class ProfileHelper:
         :param tuple from_dir: tuple of path components.
         :return: (*str*) -- path to downloaded file.
         """
-        print(f"--> Downloading {file_name} from blob storage.")
-        url_path = "/".join(from_dir)
-        url = f"{ProfileHelper.BASE_URL}/{url_path}/{file_name}"
-        dest = os.path.join(server_setup.LOCAL_DIR, *from_dir, file_name)
+        return ProfileHelper.download_files([(file_name, from_dir)])[0]
+
+    @staticmethod
+    def download_files(files):
+        """Download profiles from blob storage concurrently. Large files are split in
+        byte ranges fetched in parallel over a shared pool of connections. Partial
+        downloads are resumed, checksums are verified when advertised by the server
+        and files are only moved to their destination once complete. If a download
+        fails, the byte ranges not fetched yet are cancelled.
+
+        :param list files: list of (file name, tuple of path components) tuples.
+        :return: (*list*) -- paths to downloaded files.
+        :raises ValueError: if the checksum or size of a download is invalid.
+        """
+        with requests.Session() as session:
+            adapter = HTTPAdapter(
+                pool_connections=len(files), pool_maxsize=ProfileHelper.MAX_WORKERS
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+            downloads = []
+            try:
+                for file_name, from_dir in files:
+                    print(f"--> Downloading {file_name} from blob storage.")
+                    url_path = "/".join(from_dir)
+                    url = f"{ProfileHelper.BASE_URL}/{url_path}/{file_name}"
+                    dest = os.path.join(server_setup.LOCAL_DIR, *from_dir, file_name)
+                    downloads.append(
+                        _Download(session, url, dest, ProfileHelper.CHUNK_SIZE)
+                    )
+
+                with ThreadPoolExecutor(max_workers=ProfileHelper.MAX_WORKERS) as pool:
+                    futures = [
+                        [pool.submit(d.fetch, r) for r in d.get_pending_ranges()]
+                        for d in downloads
+                    ]
+                    try:
+                        for d, pending in zip(downloads, futures):
+                            for f in pending:
+                                f.result()
+                            d.finalize()
+                    except BaseException:
+                        for pending in futures:
+                            for f in pending:
+                                f.cancel()
+                        raise
+            finally:
+                for d in downloads:
+                    d.close()
+
+        return [d.dest for d in downloads]
+
+
+class _Download:
+    """Download of a single file, possibly split in byte ranges.
+
+    Data is written in a *.part* file next to the destination. When byte ranges are
+    used, completed ranges are recorded in a *.part.json* file, so that an
+    interrupted download can be resumed as long as the remote file is unchanged.
+
+    :param requests.Session session: session used for all requests.
+    :param str url: url of the file.
+    :param str dest: path to downloaded file.
+    :param int chunk_size: size of the byte ranges.
+    """
+
+    def __init__(self, session, url, dest, chunk_size):
+        """Constructor"""
+        self.session = session
+        self.url = url
+        self.dest = dest
+        self.tmp_path = dest + ".part"
+        self.state_path = dest + ".part.json"
+        self._lock = threading.Lock()
+
+        resp = session.head(url, allow_redirects=True)
+        resp.raise_for_status()
+        self.size = int(resp.headers.get("Content-Length", 0))
+        self.etag = resp.headers.get("ETag")
+        self.md5 = resp.headers.get("Content-MD5")
+        if resp.headers.get("Accept-Ranges") == "bytes" and self.size > 0:
+            self.ranges = [
+                (start, min(start + chunk_size, self.size) - 1)
+                for start in range(0, self.size, chunk_size)
+            ]
+        else:
+            self.ranges = [None]
+
         os.makedirs(os.path.dirname(dest), exist_ok=True)
-        resp = requests.get(url, stream=True)
-        content_length = int(resp.headers.get("content-length", 0))
-        with open(dest, "wb") as f:
-            with tqdm(
-                unit="B",
-                unit_scale=True,
-                unit_divisor=1024,
-                miniters=1,
-                total=content_length,
-            ) as pbar:
-                for chunk in resp.iter_content(chunk_size=4096):
+        self.completed = self._load_state()
+        initial = sum(r[1] - r[0] + 1 for r in self.ranges if r in self.completed)
+        self.pbar = tqdm(
+            desc=os.path.basename(dest),
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            miniters=1,
+            total=self.size,
+            initial=initial,
+        )
+
+    def _get_state(self):
+        """Returns the description of the remote file and of the completed ranges.
+
+        :return: (*dict*) -- download state.
+        """
+        return {
+            "url": self.url,
+            "size": self.size,
+            "etag": self.etag,
+            "completed": sorted(self.completed),
+        }
+
+    def _load_state(self):
+        """Loads the completed ranges of a previous download of the same file and
+        prepares the temporary file.
+
+        :return: (*set*) -- completed ranges.
+        """
+        if self.ranges == [None]:
+            return set()
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+            if (state["url"], state["size"], state["etag"]) == (
+                self.url,
+                self.size,
+                self.etag,
+            ) and os.path.getsize(self.tmp_path) == self.size:
+                return {tuple(r) for r in state["completed"]} & set(self.ranges)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        with open(self.tmp_path, "wb") as f:
+            f.truncate(self.size)
+        return set()
+
+    def _save_state(self):
+        """Records completed ranges."""
+        with open(self.state_path + ".tmp", "w") as f:
+            json.dump(self._get_state(), f)
+        os.replace(self.state_path + ".tmp", self.state_path)
+
+    def get_pending_ranges(self):
+        """Returns the byte ranges still to be downloaded.
+
+        :return: (*list*) -- list of (start, end) tuples, or [None] if the file
+            is downloaded in a single request.
+        """
+        return [r for r in self.ranges if r not in self.completed]
+
+    def fetch(self, byte_range):
+        """Downloads a byte range, or the whole file.
+
+        :param tuple byte_range: first and last byte, inclusive, or None.
+        :raises ValueError: if the server does not honor the range request.
+        """
+        headers = {}
+        if byte_range is not None:
+            headers["Range"] = "bytes=%d-%d" % byte_range
+            if self.etag is not None:
+                headers["If-Match"] = self.etag
+        with self.session.get(self.url, headers=headers, stream=True) as resp:
+            resp.raise_for_status()
+            if byte_range is not None and resp.status_code != 206:
+                raise ValueError(f"Range request not honored for {self.url}")
+            with open(self.tmp_path, "wb" if byte_range is None else "r+b") as f:
+                if byte_range is not None:
+                    f.seek(byte_range[0])
+                for chunk in resp.iter_content(chunk_size=1 << 16):
                     f.write(chunk)
-                    pbar.update(len(chunk))
+                    self.pbar.update(len(chunk))
+        if byte_range is not None:
+            with self._lock:
+                self.completed.add(byte_range)
+                self._save_state()
+
+    def _get_md5(self):
+        """Computes the base64 encoded MD5 digest of the downloaded data.
+
+        :return: (*str*) -- digest, as advertised in the Content-MD5 header.
+        """
+        md5 = hashlib.md5()
+        with open(self.tmp_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                md5.update(chunk)
+        return base64.b64encode(md5.digest()).decode()
+
+    def finalize(self):
+        """Verifies the downloaded data and moves it to its destination.
+
+        :raises ValueError: if the size or the checksum of the file is invalid.
+        """
+        try:
+            if self.size > 0 and os.path.getsize(self.tmp_path) != self.size:
+                raise ValueError(f"Incomplete download of {self.url}")
+            if self.md5 is not None and self._get_md5() != self.md5:
+                raise ValueError(f"Checksum mismatch for {self.url}")
+        except ValueError:
+            self._remove(self.tmp_path, self.state_path)
+            raise
+        os.replace(self.tmp_path, self.dest)
+        self._remove(self.state_path)
+
+    @staticmethod
+    def _remove(*paths):
+        """Removes files, ignoring missing ones.
+
+        :param str paths: paths to files.
+        """
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
 
-        return dest
+    def close(self):
+        """Closes the progress bar."""
+        self.pbar.close()
@@ -1,3 +1,6 @@
+import threading
+from contextlib import contextmanager
+
 from fs.subfs import SubFS
 from tqdm import tqdm
 
@@ -56,3 +59,73 @@ class WrapSSHFS(SubFS):
         _, stdout, _ = self.exec_command(command)
         lines = stdout.readlines()
         return lines[0].strip()
+
+
+def _is_active(base_fs):
+    """Check whether the SSH transport of a filesystem is still usable.
+
+    :param fs.sshfs.SSHFS base_fs: the filesystem instance
+    :return: (*bool*) -- whether the connection is active.
+    """
+    transport = base_fs._client.get_transport()
+    return transport is not None and transport.is_active()
+
+
+class SSHConnectionPool:
+    """Pool of SSH filesystems connected to the same server. A primary connection is
+    shared by all users for sequential operations, while additional connections are
+    lent exclusively to threads running transfers in parallel and kept alive for
+    reuse afterwards.
+
+    :param callable connect: function with no argument opening a new connection.
+    :param int max_size: maximum number of connections lent at the same time.
+    """
+
+    def __init__(self, connect, max_size=4):
+        self._connect = connect
+        self.max_size = max_size
+        self._primary = None
+        self._idle = []
+        self._lock = threading.Lock()
+        self._available = threading.BoundedSemaphore(max_size)
+
+    def get(self):
+        """Return the shared connection, reconnecting if it was dropped.
+
+        :return: (*fs.sshfs.SSHFS*) -- filesystem instance
+        """
+        with self._lock:
+            if self._primary is None or not _is_active(self._primary):
+                self._primary = self._connect()
+            return self._primary
+
+    @contextmanager
+    def connection(self):
+        """Lend a connection used by no other thread, blocking while all
+        connections are in use.
+
+        :return: (*fs.sshfs.SSHFS*) -- filesystem instance
+        """
+        with self._available:
+            with self._lock:
+                conn = self._idle.pop() if len(self._idle) > 0 else None
+            while conn is not None and not _is_active(conn):
+                conn.close()
+                with self._lock:
+                    conn = self._idle.pop() if len(self._idle) > 0 else None
+            if conn is None:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                with self._lock:
+                    self._idle.append(conn)
+
+    def close(self):
+        """Close all connections."""
+        with self._lock:
+            conns = self._idle + ([] if self._primary is None else [self._primary])
+            self._idle = []
+            self._primary = None
+        for conn in conns:
+            conn.close()
@@ -1,7 +1,18 @@
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import fs as fs2
 import pytest
 
-from powersimdata.data_access.data_access import MemoryDataAccess, SSHDataAccess
+from powersimdata.data_access import data_access as data_access_module
+from powersimdata.data_access.data_access import (
+    LocalDataAccess,
+    MemoryDataAccess,
+    SSHDataAccess,
+)
+from powersimdata.data_access.ssh_fs import SSHConnectionPool
 from powersimdata.utility import server_setup
 
 FILE_NAME = "test.txt"
@@ -80,3 +91,139 @@ def test_move_to_rename(data_access):
     new_fname = "foo.txt"
     data_access.move_to(FILE_NAME, change_name_to=new_fname)
     _check_content(data_access.fs, new_fname)
+
+
+def test_link(data_access):
+    make_temp(data_access.fs, _join("foo", FILE_NAME))
+    data_access.link(_join("foo", FILE_NAME), "bar.txt")
+    _check_content(data_access.fs, "bar.txt")
+
+
+def test_link_local(tmp_path):
+    data_access = LocalDataAccess(str(tmp_path))
+    make_temp(data_access.fs, _join("foo", FILE_NAME))
+    data_access.link(_join("foo", FILE_NAME), "bar.txt")
+    _check_content(data_access.fs, "bar.txt")
+    assert (tmp_path / "bar.txt").samefile(tmp_path / "foo" / FILE_NAME)
+
+
+def test_copy_from_many(data_access):
+    file_names = [f"{i}.txt" for i in range(10)]
+    for f in file_names:
+        make_temp(data_access.fs, _join("foo", f))
+    data_access.copy_from_many(file_names, "foo")
+    for f in file_names:
+        _check_content(data_access.local_fs, _join("foo", f))
+
+
+def test_move_to_many(data_access):
+    file_names = [f"{i}.txt" for i in range(10)]
+    for f in file_names:
+        make_temp(data_access.local_fs, f)
+    data_access.move_to_many(file_names, "foo")
+    for f in file_names:
+        _check_content(data_access.fs, _join("foo", f))
+        assert not data_access.local_fs.exists(f)
+
+
+def test_move_to_many_missing_file(data_access):
+    with pytest.raises(FileNotFoundError):
+        data_access.move_to_many(["missing.txt"])
+
+
+class FakeConnection:
+    """Stand-in for an SSH filesystem"""
+
+    def __init__(self):
+        self.active = True
+        self.closed = False
+        self._client = self
+
+    def get_transport(self):
+        return self
+
+    def is_active(self):
+        return self.active
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnector:
+    def __init__(self):
+        self.connections = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.connections.append(FakeConnection())
+            return self.connections[-1]
+
+
+def test_pool_reuses_primary_connection():
+    connect = FakeConnector()
+    pool = SSHConnectionPool(connect)
+    assert pool.get() is pool.get()
+    connect.connections[0].active = False
+    assert pool.get() is connect.connections[1]
+
+
+def test_pool_lends_connections_exclusively():
+    connect = FakeConnector()
+    pool = SSHConnectionPool(connect, max_size=2)
+    in_use = set()
+    max_in_use = [0]
+    lock = threading.Lock()
+
+    def work(_):
+        with pool.connection() as conn:
+            with lock:
+                assert conn not in in_use
+                in_use.add(conn)
+                max_in_use[0] = max(max_in_use[0], len(in_use))
+            time.sleep(0.01)
+            with lock:
+                in_use.remove(conn)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(20)))
+    assert max_in_use[0] == 2
+    assert len(connect.connections) == 2
+
+
+def test_pool_replaces_dropped_connection():
+    connect = FakeConnector()
+    pool = SSHConnectionPool(connect)
+    with pool.connection() as conn:
+        pass
+    conn.active = False
+    with pool.connection() as new_conn:
+        assert new_conn is not conn
+    assert conn.closed
+    pool.close()
+    assert new_conn.closed
+
+
+def test_ssh_data_access_reconnects(ssh_data_access, monkeypatch):
+    connect = FakeConnector()
+    pool = SSHConnectionPool(connect)
+    monkeypatch.setattr(data_access_module, "get_ssh_pool", lambda: pool)
+    monkeypatch.setattr(SSHDataAccess, "_last_attempt", 0)
+    assert ssh_data_access.fs.delegate_fs() is connect.connections[0]
+    assert ssh_data_access.fs is ssh_data_access.fs
+    connect.connections[0].active = False
+    assert ssh_data_access.fs.delegate_fs() is connect.connections[1]
+
+
+def test_ssh_link_quotes_paths(ssh_data_access, monkeypatch):
+    commands = []
+
+    class FakeFS:
+        def exec_command(self, command):
+            commands.append(command)
+            return None, None, io.StringIO()
+
+    ssh_data_access.root = "/data"
+    monkeypatch.setattr(SSHDataAccess, "fs", FakeFS())
+    ssh_data_access.link("profiles/solar 1.csv", "tmp/x;rm -rf y.csv")
+    assert commands == ["ln -f '/data/profiles/solar 1.csv' '/data/tmp/x;rm -rf y.csv'"]
@@ -1,6 +1,75 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
 from fs.tempfs import TempFS
 
-from powersimdata.data_access.profile_helper import ProfileHelper, _get_profile_version
+from powersimdata.data_access.profile_helper import (
+    ProfileHelper,
+    _Download,
+    _get_profile_version,
+)
+from powersimdata.utility import server_setup
+
+BLOBS = {
+    "/raw/usa_tamu/demand_vTest.csv": os.urandom(1000),
+    "/raw/usa_tamu/solar_vTest.csv": os.urandom(2500),
+}
+
+
+class BlobHandler(BaseHTTPRequestHandler):
+    md5 = {}
+    requests = []
+
+    def _send_headers(self, status, body, length):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"etag"')
+        md5 = self.md5.get(self.path, hashlib.md5(body).digest())
+        self.send_header("Content-MD5", base64.b64encode(md5).decode())
+        self.end_headers()
+
+    def do_HEAD(self):  # noqa: N802
+        body = BLOBS[self.path]
+        self._send_headers(200, body, len(body))
+
+    def do_GET(self):  # noqa: N802
+        body = BLOBS[self.path]
+        self.requests.append((self.path, self.headers.get("Range")))
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if match is None:
+            self._send_headers(200, body, len(body))
+            self.wfile.write(body)
+        else:
+            start, end = int(match.group(1)), int(match.group(2))
+            self._send_headers(206, body, end - start + 1)
+            self.wfile.write(body[start : end + 1])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def blob_server(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BlobHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        ProfileHelper, "BASE_URL", f"http://127.0.0.1:{server.server_port}"
+    )
+    monkeypatch.setattr(ProfileHelper, "CHUNK_SIZE", 256)
+    monkeypatch.setattr(server_setup, "LOCAL_DIR", str(tmp_path))
+    BlobHandler.md5 = {}
+    BlobHandler.requests = []
+    yield BlobHandler
+    server.shutdown()
+    server.server_close()
 
 
 def test_get_profile_version():
@@ -21,3 +90,64 @@ def test_get_file_components():
     file_name, from_dir = ProfileHelper.get_file_components(s_info, "wind")
     assert "wind_v8.csv" == file_name
     assert ("raw", "europe") == from_dir
+
+
+def test_download_files(blob_server, tmp_path):
+    files = [(f, ("raw", "usa_tamu")) for f in ["demand_vTest.csv", "solar_vTest.csv"]]
+    paths = ProfileHelper.download_files(files)
+    for path, (file_name, _) in zip(paths, files):
+        with open(path, "rb") as f:
+            assert f.read() == BLOBS[f"/raw/usa_tamu/{file_name}"]
+    assert len(blob_server.requests) == 4 + 10
+    assert sorted(os.listdir(tmp_path / "raw" / "usa_tamu")) == [
+        "demand_vTest.csv",
+        "solar_vTest.csv",
+    ]
+
+
+def test_download_file_resume(blob_server, tmp_path):
+    body = BLOBS["/raw/usa_tamu/demand_vTest.csv"]
+    dest = tmp_path / "raw" / "usa_tamu" / "demand_vTest.csv"
+    os.makedirs(dest.parent)
+    with open(f"{dest}.part", "wb") as f:
+        f.write(body[:512] + bytes(488))
+    state = {
+        "url": f"{ProfileHelper.BASE_URL}/raw/usa_tamu/demand_vTest.csv",
+        "size": 1000,
+        "etag": '"etag"',
+        "completed": [[0, 255], [256, 511]],
+    }
+    with open(f"{dest}.part.json", "w") as f:
+        json.dump(state, f)
+
+    ProfileHelper.download_file("demand_vTest.csv", ("raw", "usa_tamu"))
+    with open(dest, "rb") as f:
+        assert f.read() == body
+    assert sorted(r for _, r in blob_server.requests) == [
+        "bytes=512-767",
+        "bytes=768-999",
+    ]
+    assert os.listdir(dest.parent) == ["demand_vTest.csv"]
+
+
+def test_download_file_checksum_mismatch(blob_server, tmp_path):
+    blob_server.md5 = {"/raw/usa_tamu/demand_vTest.csv": b"0" * 16}
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        ProfileHelper.download_file("demand_vTest.csv", ("raw", "usa_tamu"))
+    assert os.listdir(tmp_path / "raw" / "usa_tamu") == []
+
+
+def test_download_files_failure_closes_downloads(blob_server, monkeypatch):
+    closed = []
+    close = _Download.close
+
+    def record_close(self):
+        closed.append(os.path.basename(self.dest))
+        close(self)
+
+    monkeypatch.setattr(_Download, "close", record_close)
+    blob_server.md5 = {"/raw/usa_tamu/demand_vTest.csv": b"0" * 16}
+    files = [(f, ("raw", "usa_tamu")) for f in ["demand_vTest.csv", "solar_vTest.csv"]]
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        ProfileHelper.download_files(files)
+    assert sorted(closed) == ["demand_vTest.csv", "solar_vTest.csv"]
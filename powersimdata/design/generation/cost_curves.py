@@ -1,5 +1,3 @@
-import copy
-
 import numpy as np
 import pandas as pd
 
@@ -8,6 +6,42 @@ from powersimdata.network.model import area_to_loadzone
 from powersimdata.utility.helpers import _check_import
 
 
+def _linearize(grid, num_segments):
+    """Evaluates the piecewise linear cost curves of all generators at once.
+
+    :param powersimdata.input.grid.Grid grid: Grid object.
+    :param int num_segments: The number of segments into which the piecewise linear
+        cost curve will be split.
+    :return: (*tuple*) -- capacity and cost at the breakpoints of the cost curves,
+        as arrays with one row per generator and one column per breakpoint, and
+        whether each generator is dispatchable. Breakpoints of non-dispatchable
+        generators are NaN.
+    :raises ValueError: if the generator cost curve is not of an acceptable form.
+    """
+    gencost_before = grid.gencost["before"]
+
+    # Raise errors if the provided cost curves are not in a form that can be handled
+    if (gencost_before.type != 2).any():
+        raise ValueError("gencost currently limited to polynomial")
+    if (gencost_before.n != 3).any():
+        raise ValueError("gencost currently limited to quadratic")
+
+    plant = grid.plant.reindex(gencost_before.index)
+    p_min = plant.Pmin.to_numpy(dtype=float)[:, None]
+    p_max = plant.Pmax.to_numpy(dtype=float)[:, None]
+    quad_term, lin_term, const_term = (
+        gencost_before[c].to_numpy(dtype=float)[:, None] for c in ("c2", "c1", "c0")
+    )
+
+    power_step = (p_max - p_min) / num_segments
+    capacity = p_min + power_step * np.arange(num_segments + 1)
+    cost = quad_term * capacity**2 + lin_term * capacity + const_term
+    dispatchable = (p_min != p_max).ravel()
+    capacity[~dispatchable] = np.nan
+    cost[~dispatchable] = np.nan
+    return capacity, cost, dispatchable
+
+
 def linearize_gencost(input_grid, num_segments=1):
     """Updates the generator cost information to include piecewise linear cost curve
     information. Allows the user to specify the number of piecewise segments into which
@@ -20,65 +54,32 @@ def linearize_gencost(input_grid, num_segments=1):
         linear cost curve parameters.
     :raises ValueError: if the generator cost curve is not of an acceptable form.
     """
-
-    # Access the generator cost and plant information components
-    grid = copy.deepcopy(input_grid)
-    gencost_before = grid.gencost["before"]
-    plant = grid.plant
-
-    # Raise errors if the provided cost curves are not in a form that can be handled
-    if len(gencost_before[gencost_before.type != 2]):
-        raise ValueError("gencost currently limited to polynomial")
-    if len(gencost_before[gencost_before.n != 3]):
-        raise ValueError("gencost currently limited to quadratic")
-
-    # Access the quadratic cost curve information
-    quad_term = gencost_before.c2
-    lin_term = gencost_before.c1
-    const_term = gencost_before.c0
-
-    # Convert dispatchable generators to piecewise segments
-    dispatchable_gens = plant.Pmin != plant.Pmax
-    if sum(dispatchable_gens) > 0:
-        gencost_after = pd.DataFrame(
-            index=gencost_before.index,
-            columns=["type", "startup", "shutdown", "n", "c2", "c1", "c0"],
-        )
-        gencost_after.loc[dispatchable_gens, "type"] = 1
-        gencost_after[["startup", "shutdown", "c2", "c1", "c0"]] = gencost_before[
-            ["startup", "shutdown", "c2", "c1", "c0"]
-        ]
-        gencost_after.loc[dispatchable_gens, "n"] = num_segments + 1
-        power_step = (plant.Pmax - plant.Pmin) / num_segments
-        for i in range(num_segments + 1):
-            capacity_label = "p" + str(i + 1)
-            price_label = "f" + str(i + 1)
-            capacity_data = plant.Pmin + power_step * i
-            price_data = (
-                quad_term * capacity_data ** 2 + lin_term * capacity_data + const_term
-            )
-            gencost_after.loc[dispatchable_gens, capacity_label] = capacity_data[
-                dispatchable_gens
-            ]
-            gencost_after.loc[dispatchable_gens, price_label] = price_data[
-                dispatchable_gens
-            ]
-    else:
-        grid.gencost["after"] = gencost_before.copy()
-
-    # Convert non-dispatchable gens to fixed values
-    nondispatchable_gens = ~dispatchable_gens
-    if sum(nondispatchable_gens) > 0:
-        gencost_after.loc[nondispatchable_gens, "type"] = gencost_before.loc[
-            nondispatchable_gens, "type"
-        ]
-        gencost_after.loc[nondispatchable_gens, "n"] = gencost_before.loc[
-            nondispatchable_gens, "n"
-        ]
-        power = plant.Pmax
-        price_data = quad_term * power ** 2 + lin_term * power + const_term
-        gencost_after.loc[nondispatchable_gens, ["c2", "c1"]] = 0
-        gencost_after.loc[nondispatchable_gens, "c0"] = price_data[nondispatchable_gens]
+    capacity, cost, dispatchable = _linearize(input_grid, num_segments)
+    gencost_before = input_grid.gencost["before"]
+    plant = input_grid.plant.reindex(gencost_before.index)
+
+    # Dispatchable generators are converted to piecewise segments, non-dispatchable
+    # generators to fixed values
+    power = plant.Pmax.to_numpy(dtype=float)
+    columns = {
+        "type": np.where(dispatchable, 1, gencost_before.type),
+        "startup": gencost_before.startup.to_numpy(dtype=float),
+        "shutdown": gencost_before.shutdown.to_numpy(dtype=float),
+        "n": np.where(dispatchable, num_segments + 1, gencost_before.n),
+    }
+    for c in ("c2", "c1", "c0"):
+        columns[c] = gencost_before[c].to_numpy(dtype=float)
+    columns["c0"] = np.where(
+        dispatchable,
+        columns["c0"],
+        columns["c2"] * power**2 + columns["c1"] * power + columns["c0"],
+    )
+    columns["c2"] = np.where(dispatchable, columns["c2"], 0)
+    columns["c1"] = np.where(dispatchable, columns["c1"], 0)
+    for i in range(num_segments + 1):
+        columns["p" + str(i + 1)] = capacity[:, i]
+        columns["f" + str(i + 1)] = cost[:, i]
+    gencost_after = pd.DataFrame(columns, index=gencost_before.index)
 
     gencost_after["interconnect"] = gencost_before["interconnect"]
 
@@ -105,13 +106,20 @@ def get_supply_data(grid, num_segments=1, save=None):
     if not isinstance(grid, Grid):
         raise TypeError("A Grid object must be input.")
 
-    # Obtain a copy of the Grid object
-    grid = copy.deepcopy(grid)
-
     # Access the generator cost and plant information data
     gencost_df = linearize_gencost(grid, num_segments)
     plant_df = grid.plant
 
+    # Add p_diff and slope according to the number of cost curve segments
+    capacity = gencost_df[[f"p{i + 1}" for i in range(num_segments + 1)]].to_numpy()
+    cost = gencost_df[[f"f{i + 1}" for i in range(num_segments + 1)]].to_numpy()
+    p_diff = np.diff(capacity, axis=1)
+    slope = np.diff(cost, axis=1) / p_diff
+    segments = {}
+    for i in range(num_segments):
+        segments["p_diff" + str(i + 1)] = p_diff[:, i]
+        segments["slope" + str(i + 1)] = slope[:, i]
+
     # Create a new DataFrame with the desired columns
     supply_df = pd.concat(
         [
@@ -121,19 +129,11 @@ def get_supply_data(grid, num_segments=1, save=None):
                     ["type", "startup", "shutdown", "n", "interconnect"], sort=False
                 )
             ],
+            pd.DataFrame(segments, index=gencost_df.index),
         ],
         axis=1,
     )
 
-    # Add p_diff and slope according to the number of cost curve segments
-    for i in range(num_segments):
-        supply_df["p_diff" + str(i + 1)] = (
-            supply_df["p" + str(i + 2)] - supply_df["p" + str(i + 1)]
-        )
-        supply_df["slope" + str(i + 1)] = (
-            supply_df["f" + str(i + 2)] - supply_df["f" + str(i + 1)]
-        ) / supply_df["p_diff" + str(i + 1)]
-
     # Save the supply data to a .csv file if desired
     if save is not None:
         if not isinstance(save, str):
@@ -186,6 +186,51 @@ def check_supply_data(supply_data, num_segments=1):
         raise ValueError(f'Missing columns: {", ".join(miss_cols)}')
 
 
+def _get_segments(supply_data, num_segments, zones, gen_type):
+    """Selects the cost curve segments of generators of given types in given load
+    zones.
+
+    :param pandas.DataFrame supply_data: supply information, as returned by
+        :func:`get_supply_data`.
+    :param int num_segments: The number of segments into which the piecewise linear
+        cost curve is split.
+    :param iterable zones: load zone names.
+    :param iterable gen_type: generation types.
+    :return: (*tuple*) -- capacity and price of the segments, as arrays ordered by
+        segment and then by generator. Generators that have no capacity are left out.
+    """
+    selected = supply_data.zone_name.isin(zones) & supply_data.type.isin(gen_type)
+    segments = [str(i + 1) for i in range(num_segments)]
+    p_diff = supply_data.loc[selected, ["p_diff" + i for i in segments]]
+    slope = supply_data.loc[selected, ["slope" + i for i in segments]]
+    p_diff, slope = p_diff.to_numpy(dtype=float), slope.to_numpy(dtype=float)
+
+    # Remove generators that have no capacity (e.g., Maine coal generators)
+    has_capacity = ~np.isnan(slope[:, 0])
+    return p_diff[has_capacity].ravel(order="F"), slope[has_capacity].ravel(order="F")
+
+
+def _get_supply_curve(supply_data, num_segments, zones, gen_type):
+    """Builds the supply curve of generators of given types in given load zones.
+
+    :param pandas.DataFrame supply_data: supply information, as returned by
+        :func:`get_supply_data`.
+    :param int num_segments: The number of segments into which the piecewise linear
+        cost curve is split.
+    :param iterable zones: load zone names.
+    :param iterable gen_type: generation types.
+    :return: (*tuple*) -- capacity and price of the points of the supply curve, as
+        arrays. Each segment, sorted by price, gives a point at its start and its end.
+    """
+    p_diff, slope = _get_segments(supply_data, num_segments, zones, gen_type)
+    order = np.argsort(slope, kind="stable")
+    p_diff, slope = p_diff[order], slope[order]
+    end = np.cumsum(p_diff)
+    start = np.zeros_like(end)
+    start[1:] = end[:-1]
+    return np.column_stack([start, end]).ravel(), np.repeat(slope, 2)
+
+
 def build_supply_curve(grid, num_segments, area, gen_type, area_type=None, plot=True):
     """Builds a supply curve for a specified area and generation type.
 
@@ -234,44 +279,11 @@ def build_supply_curve(grid, num_segments, area, gen_type, area_type=None, plot=
     # Identify the load zones that correspond to the specified area and area_type
     returned_zones = area_to_loadzone(grid.grid_model, area, area_type)
 
-    # Trim the DataFrame to only be of the desired area and generation type
-    supply_data = supply_data.loc[supply_data.zone_name.isin(returned_zones)]
-    supply_data = supply_data.loc[supply_data.type.isin(gen_type)]
-
-    # Remove generators that have no capacity (e.g., Maine coal generators)
-    if supply_data["slope1"].isnull().values.any():
-        supply_data.dropna(subset=["slope1"], inplace=True)
-
-    # Check if the area contains generators of the specified type
-    if supply_data.empty:
-        return [], []
-
-    # Combine the p_diff and slope information for each cost segment
-    supply_df_cols = []
-    for i in range(num_segments):
-        supply_df_cols.append(
-            supply_data.loc[:, ("p_diff" + str(i + 1), "slope" + str(i + 1))]
-        )
-        supply_df_cols[i].rename(
-            columns={"p_diff" + str(i + 1): "p_diff", "slope" + str(i + 1): "slope"},
-            inplace=True,
-        )
-    supply_df = pd.concat(supply_df_cols, axis=0)
-
-    # Sort the trimmed DataFrame by slope
-    supply_df = supply_df.sort_values(by="slope")
-    supply_df = supply_df.reset_index(drop=True)
-
     # Determine the points that comprise the supply curve
-    capacity_data = []
-    price_data = []
-    capacity_diff_sum = 0
-    for i in supply_df.index:
-        capacity_data.append(capacity_diff_sum)
-        price_data.append(supply_df["slope"][i])
-        capacity_data.append(supply_df["p_diff"][i] + capacity_diff_sum)
-        price_data.append(supply_df["slope"][i])
-        capacity_diff_sum += supply_df["p_diff"][i]
+    capacity_data, price_data = _get_supply_curve(
+        supply_data, num_segments, returned_zones, gen_type
+    )
+    capacity_data, price_data = capacity_data.tolist(), price_data.tolist()
 
     # Plot the curve
     if plot:
@@ -309,9 +321,33 @@ def lower_bound_index(desired_capacity, capacity_data):
         return None
 
     # Get the index of the capacity that is immediately less than the desired capacity
-    for i, j in enumerate(capacity_data):
-        if j > desired_capacity:
-            return i - 1
+    i = np.searchsorted(capacity_data, desired_capacity, side="right")
+    if i < len(capacity_data):
+        return int(i) - 1
+
+
+def _ks_statistic(capacity_data1, price_data1, capacity_data2, price_data2):
+    """Computes the greatest difference in price between two supply curves, over the
+    capacity offered by both.
+
+    :param numpy.ndarray capacity_data1: capacity values for the first supply curve.
+    :param numpy.ndarray price_data1: price values for the first supply curve.
+    :param numpy.ndarray capacity_data2: capacity values for the second supply curve.
+    :param numpy.ndarray price_data2: price values for the second supply curve.
+    :return: (*float*) -- The maximum price difference between the two supply curves,
+        NaN if one of them is empty.
+    """
+    if len(capacity_data1) == 0 or len(capacity_data2) == 0:
+        return np.nan
+
+    # Every capacity value in which either supply curve steps up
+    capacity = np.union1d(capacity_data1, capacity_data2)
+    capacity = capacity[capacity <= min(capacity_data1[-1], capacity_data2[-1])]
+
+    # The price at a capacity value is the one of the segment starting there
+    f1 = price_data1[np.searchsorted(capacity_data1, capacity, side="right") - 1]
+    f2 = price_data2[np.searchsorted(capacity_data2, capacity, side="right") - 1]
+    return float(np.abs(f1 - f2).max())
 
 
 def ks_test(
@@ -355,36 +391,13 @@ def ks_test(
             "The two supply curves do not offer the same amount of capacity (MW)."
         )
 
-    # Create a list that has every capacity value in which either supply curve steps up
-    capacity_data_all = list(set(capacity_data1) | set(capacity_data2))
-    capacity_data_all.sort()
-
-    # For each capacity value, associate the two corresponding price values
-    price_data_all = []
-    for i in range(len(capacity_data_all)):
-        # Determine the correpsonding price from the first supply curve
-        if capacity_data_all[i] == capacity_data1[-1]:
-            f1 = price_data1[-1]
-        else:
-            f1 = price_data1[lower_bound_index(capacity_data_all[i], capacity_data1)]
-
-        # Determine the correpsonding price from the second supply curve
-        if capacity_data_all[i] == capacity_data2[-1]:
-            f2 = price_data2[-1]
-        else:
-            f2 = price_data2[lower_bound_index(capacity_data_all[i], capacity_data2)]
-
-        # Pair the two price values
-        price_data_all.append([f1, f2])
-
-    # Determine the price differences for each capacity value
-    price_data_diff = [
-        abs(price_data_all[i][0] - price_data_all[i][1])
-        for i in range(len(price_data_all))
-    ]
-
     # Determine the maximum price difference
-    max_diff = max(price_data_diff)
+    max_diff = _ks_statistic(
+        np.asarray(capacity_data1),
+        np.asarray(price_data1),
+        np.asarray(capacity_data2),
+        np.asarray(price_data2),
+    )
 
     # Plot the two supply curves overlaid
     if plot:
@@ -409,6 +422,85 @@ def ks_test(
     return max_diff
 
 
+def compare_supply_curves(grids, areas, gen_types, num_segments=1, area_type=None):
+    """Compares the supply curves of several grids to the ones of a reference grid,
+    for all pairs of area and generation type. Supply data of each grid is computed
+    once. Supply curves are compared with the test implemented in :func:`ks_test`,
+    over the capacity offered by both curves.
+
+    :param dict/list grids: Grid objects, keyed by label. The first one is the
+        reference. A list is keyed by position.
+    :param str/iterable areas: Either load zone(s), state name(s), state
+        abbreviation(s), or interconnect(s).
+    :param str/iterable gen_types: Generation type(s), each compared separately.
+    :param int num_segments: The number of segments into which the piecewise linear
+        cost curve is split.
+    :param str area_type: one of: *'loadzone'*, *'state'*, *'state_abbr'*,
+        *'interconnect'*. Defaults to None, which allows
+        :func:`powersimdata.network.model.area_to_loadzone` to infer the type.
+    :return: (*pandas.DataFrame*) -- one row per area, generation type and grid other
+        than the reference, with the capacity (MW) of both supply curves and the
+        maximum price difference ($/MW) between them. The difference is NaN if one of
+        the curves is empty.
+    :raises TypeError: if grids are not powersimdata.input.grid.Grid objects or if the
+        number of segments is not an int.
+    :raises ValueError: if less than two grids are input.
+    """
+    if not isinstance(grids, dict):
+        grids = dict(enumerate(grids))
+    if len(grids) < 2:
+        raise ValueError("At least two grids must be input.")
+    if not all(isinstance(g, Grid) for g in grids.values()):
+        raise TypeError("Grid objects must be input.")
+    if not isinstance(num_segments, int):
+        raise TypeError(
+            "The number of linearized cost curve segments must be input as an int."
+        )
+    areas = [areas] if isinstance(areas, str) else list(areas)
+    gen_types = [gen_types] if isinstance(gen_types, str) else list(gen_types)
+
+    supply_data = {
+        label: get_supply_data(g, num_segments) for label, g in grids.items()
+    }
+    reference, *others = grids
+    grid_model = grids[reference].grid_model
+    zones = {area: area_to_loadzone(grid_model, area, area_type) for area in areas}
+
+    rows = []
+    for area in areas:
+        for gen_type in gen_types:
+            curves = {
+                label: _get_supply_curve(data, num_segments, zones[area], [gen_type])
+                for label, data in supply_data.items()
+            }
+            capacity_data1, price_data1 = curves[reference]
+            for label in others:
+                capacity_data2, price_data2 = curves[label]
+                rows.append(
+                    [
+                        area,
+                        gen_type,
+                        label,
+                        capacity_data1[-1] if len(capacity_data1) > 0 else 0,
+                        capacity_data2[-1] if len(capacity_data2) > 0 else 0,
+                        _ks_statistic(
+                            capacity_data1, price_data1, capacity_data2, price_data2
+                        ),
+                    ]
+                )
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "area",
+            "gen_type",
+            "grid",
+            "reference_capacity",
+            "capacity",
+            "max_diff",
+        ],
+    )
+
+
 def plot_linear_vs_quadratic_terms(
     grid,
     area,
@@ -449,9 +541,6 @@ def plot_linear_vs_quadratic_terms(
     if not isinstance(grid, Grid):
         raise TypeError("A Grid object must be input.")
 
-    # Obtain a copy of the Grid object
-    grid = copy.deepcopy(grid)
-
     # Access the generator cost and plant information data
     gencost_df = grid.gencost["before"]
     plant_df = grid.plant
@@ -583,30 +672,13 @@ def plot_capacity_vs_price(
     # Identify the load zones that correspond to the specified area and area_type
     returned_zones = area_to_loadzone(grid.grid_model, area, area_type)
 
-    # Trim the DataFrame to only be of the desired area and generation type
-    supply_data = supply_data.loc[supply_data.zone_name.isin(returned_zones)]
-    supply_data = supply_data.loc[supply_data["type"] == gen_type]
-
-    # Remove generators that have no capacity (e.g., Maine coal generators)
-    if supply_data["slope1"].isnull().values.any():
-        supply_data.dropna(subset=["slope1"], inplace=True)
+    # Select the cost curve segments of the desired area and generation type
+    p_diff, slope = _get_segments(supply_data, num_segments, returned_zones, [gen_type])
 
     # Check if the area contains generators of the specified type
-    if supply_data.empty:
+    if len(p_diff) == 0:
         return
-
-    # Combine the p_diff and slope information for each cost segment
-    supply_df_cols = []
-    for i in range(num_segments):
-        supply_df_cols.append(
-            supply_data.loc[:, ("p_diff" + str(i + 1), "slope" + str(i + 1))]
-        )
-        supply_df_cols[i].rename(
-            columns={"p_diff" + str(i + 1): "p_diff", "slope" + str(i + 1): "slope"},
-            inplace=True,
-        )
-    supply_df = pd.concat(supply_df_cols, axis=0)
-    supply_df = supply_df.reset_index(drop=True)
+    supply_df = pd.DataFrame({"p_diff": p_diff, "slope": slope})
 
     # Determine the average price
     total_capacity = supply_df["p_diff"].sum()
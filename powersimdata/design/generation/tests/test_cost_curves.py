@@ -1,10 +1,14 @@
+import numpy as np
 import pandas as pd
+import pytest
 from pandas.testing import assert_series_equal
 
 from powersimdata.design.generation.cost_curves import (
     build_supply_curve,
+    compare_supply_curves,
     get_supply_data,
     ks_test,
+    linearize_gencost,
     lower_bound_index,
 )
 from powersimdata.tests.mock_grid import MockGrid
@@ -174,6 +178,37 @@ def test_get_supply_data():
     assert_series_equal(test_slope, exp_slope)
 
 
+def test_linearize_gencost():
+    plant = {**mock_plant, "Pmin": [0] * 19 + [100]}
+    nondispatchable_grid = MockGrid({"plant": plant, "gencost_before": mock_gencost})
+    gencost = linearize_gencost(nondispatchable_grid, 2)
+    assert list(gencost.columns) == [
+        "type",
+        "startup",
+        "shutdown",
+        "n",
+        "c2",
+        "c1",
+        "c0",
+        "p1",
+        "f1",
+        "p2",
+        "f2",
+        "p3",
+        "f3",
+        "interconnect",
+    ]
+    assert gencost["type"].tolist() == [1] * 19 + [2]
+    assert gencost["n"].tolist() == [3] * 20
+    dtypes = gencost.dtypes.drop(["type", "n", "interconnect"])
+    assert (dtypes == np.float64).all()
+    assert (gencost.dtypes[["type", "n"]] == np.int64).all()
+    assert gencost.loc[0, ["p1", "p2", "p3"]].tolist() == [0, 25, 50]
+    assert gencost.loc[0, ["f1", "f2", "f3"]].tolist() == [1300, 2065.625, 2862.5]
+    assert gencost.loc[19, ["c2", "c1", "c0"]].tolist() == [0, 0, 5900]
+    assert gencost.loc[19, ["p1", "f1", "p3", "f3"]].isna().all()
+
+
 def test_build_supply_curve_1seg():
     capacity_test, price_test = build_supply_curve(
         grid, 1, "Colorado", "ng", "loadzone", plot=False
@@ -195,6 +230,12 @@ def test_build_supply_curve_1seg():
     assert all([price_test[i] == price_exp[i] for i in range(len(capacity_test))])
 
 
+def test_build_supply_curve_no_generator():
+    plant = {**mock_plant, "Pmax": [0] * 20}
+    empty_grid = MockGrid({"plant": plant, "gencost_before": mock_gencost})
+    assert build_supply_curve(empty_grid, 1, "Utah", "ng", plot=False) == ([], [])
+
+
 def test_build_supply_curve_2seg():
     capacity_test, price_test = build_supply_curve(
         grid, 2, "Utah", "coal", "loadzone", plot=False
@@ -267,3 +308,52 @@ def test_lower_bound_index():
     ind_test = lower_bound_index(desired_capacity, capacity_data)
     ind_exp = 4
     assert ind_test == ind_exp
+
+
+def test_compare_supply_curves():
+    other_gencost = {**mock_gencost, "c1": [c + 1 for c in mock_gencost["c1"]]}
+    other_grid = MockGrid({"plant": mock_plant, "gencost_before": other_gencost})
+    comparison = compare_supply_curves(
+        {"base": grid, "other": other_grid, "same": grid},
+        ["Utah", "Colorado"],
+        ["coal", "ng", "hydro"],
+        area_type="loadzone",
+    )
+    assert list(comparison.columns) == [
+        "area",
+        "gen_type",
+        "grid",
+        "reference_capacity",
+        "capacity",
+        "max_diff",
+    ]
+    assert len(comparison) == 12
+    row = comparison.query("area == 'Colorado' and gen_type == 'ng'")
+    assert row["grid"].tolist() == ["other", "same"]
+    assert row["reference_capacity"].tolist() == [200, 200]
+    assert row["max_diff"].tolist() == pytest.approx([1, 0])
+    row = comparison.query("area == 'Colorado' and gen_type == 'hydro'")
+    assert row["capacity"].tolist() == [0, 0]
+    assert row["max_diff"].isna().all()
+
+
+def test_compare_supply_curves_matches_ks_test():
+    other_gencost = {**mock_gencost, "c2": mock_gencost["c2"][::-1]}
+    other_grid = MockGrid({"plant": mock_plant, "gencost_before": other_gencost})
+    comparison = compare_supply_curves(
+        [grid, other_grid], "Washington", "coal", num_segments=2, area_type="loadzone"
+    )
+    curves = [
+        build_supply_curve(g, 2, "Washington", "coal", "loadzone", plot=False)
+        for g in (grid, other_grid)
+    ]
+    expected = ks_test(*curves[0], *curves[1], plot=False)
+    assert comparison["grid"].tolist() == [1]
+    assert comparison["max_diff"].tolist() == [expected]
+
+
+def test_compare_supply_curves_argument():
+    with pytest.raises(ValueError):
+        compare_supply_curves([grid], "Utah", "coal")
+    with pytest.raises(TypeError):
+        compare_supply_curves([grid, "grid"], "Utah", "coal")
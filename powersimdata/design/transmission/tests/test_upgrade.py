@@ -5,15 +5,14 @@ import pandas as pd
 
 from powersimdata.design.transmission.upgrade import (
     _construct_composite_allow_list,
-    _find_branches_connected_to_bus,
     _find_capacity_at_bus,
-    _find_first_degree_branches,
-    _find_stub_degree,
     _identify_mesh_branch_upgrades,
     _increment_branch_scaling,
+    find_stub_branches,
     get_branches_by_area,
     scale_renewable_stubs,
 )
+from powersimdata.input.topology import Topology
 from powersimdata.tests.mock_change_table import MockChangeTable
 from powersimdata.tests.mock_grid import MockGrid
 from powersimdata.tests.mock_scenario import MockScenario
@@ -67,41 +66,27 @@ class TestStubTopologyHelpers(unittest.TestCase):
     def setUp(self):
         self.branch = mock_grid.branch
         self.plant = mock_grid.plant
+        self.topology = Topology(self.branch)
 
-    def test_find_branches_connected_to_bus_1(self):
-        branches_connected = _find_branches_connected_to_bus(self.branch, 1)
-        self.assertEqual(branches_connected, {101, 106})
+    def test_branches_at_bus_1(self):
+        self.assertEqual(set(self.topology.branches_at(1)), {101, 106})
 
-    def test_find_branches_connected_to_bus_4(self):
-        branches_connected = _find_branches_connected_to_bus(self.branch, 4)
-        self.assertEqual(branches_connected, {105, 106, 107})
+    def test_branches_at_bus_4(self):
+        self.assertEqual(set(self.topology.branches_at(4)), {105, 106, 107})
 
-    def test_find_branches_connected_to_bus_5(self):
-        branches_connected = _find_branches_connected_to_bus(self.branch, 5)
-        self.assertEqual(branches_connected, {103})
+    def test_branches_at_bus_5(self):
+        self.assertEqual(set(self.topology.branches_at(5)), {103})
 
-    def test_find_first_degree_branches_101(self):
-        branches_connected = _find_first_degree_branches(self.branch, 101)
-        self.assertEqual(branches_connected, {101, 102, 103, 106})
+    def test_stub_branches_is_cached(self):
+        stubs = self.topology.stub_branches()
+        stubs.drop(index=stubs.index, inplace=True)
+        self.assertEqual(len(self.topology.stub_branches()), 4)
 
-    def test_find_first_degree_branches_108(self):
-        branches_connected = _find_first_degree_branches(self.branch, 108)
-        self.assertEqual(branches_connected, {107, 108})
-
-    def test_find_stub_degree_1(self):
-        stub_degree, stubs = _find_stub_degree(self.branch, 1)
-        self.assertEqual(stub_degree, 0)
-        self.assertEqual(stubs, set())
-
-    def test_find_stub_degree_5(self):
-        stub_degree, stubs = _find_stub_degree(self.branch, 5)
-        self.assertEqual(stub_degree, 1)
-        self.assertEqual(stubs, {103})
-
-    def test_find_stub_degree_7(self):
-        stub_degree, stubs = _find_stub_degree(self.branch, 7)
-        self.assertEqual(stub_degree, 2)
-        self.assertEqual(stubs, {107, 108})
+    def test_find_stub_branches(self):
+        stubs = find_stub_branches(self.branch).sort_values(["bus_id", "branch_id"])
+        self.assertEqual(stubs["bus_id"].tolist(), [5, 7, 7, 8])
+        self.assertEqual(stubs["branch_id"].tolist(), [103, 107, 108, 104])
+        self.assertEqual(stubs["stub_degree"].tolist(), [1, 2, 2, 1])
 
     def test_find_capacity_at_bus_1_solar_tuple(self):
         gen_capacity = _find_capacity_at_bus(self.plant, 1, ("solar",))
@@ -545,6 +530,13 @@ class TestScaleRenewableStubs(unittest.TestCase):
         self.assertEqual(change_table.ct, {})
         self.assertEqual(returned, expected_ct)
 
+    def test_empty_ct_precomputed_stubs(self):
+        expected_ct = {"branch": {"branch_id": {103: (11 / 8), 107: (21 / 15)}}}
+        stubs = find_stub_branches(mock_grid.branch)
+        change_table = MockChangeTable(mock_grid)
+        scale_renewable_stubs(change_table, verbose=False, stubs=stubs)
+        self.assertEqual(change_table.ct, expected_ct)
+
     def test_empty_ct_no_fuzz(self):
         expected_ct = {"branch": {"branch_id": {103: (10 / 8), 107: (20 / 15)}}}
         change_table = MockChangeTable(mock_grid)
@@ -2,63 +2,21 @@ import pandas as pd
 
 from powersimdata.design.investment.investment_costs import _calculate_ac_inv_costs
 from powersimdata.input.grid import Grid
+from powersimdata.input.topology import Topology, get_topology
 from powersimdata.network.model import area_to_loadzone
 from powersimdata.utility.distance import haversine
 
 
-def _find_branches_connected_to_bus(branch, bus_id):
-    """Find all branches connected to a given bus.
+def find_stub_branches(branch):
+    """Find stub branches of all buses at once. See
+    :meth:`powersimdata.input.topology.Topology.stub_branches`.
 
     :param pandas.DataFrame branch: branch DataFrame from Grid object.
-    :param int bus_id: index of bus to find neighbors of.
-    :return: (*set*) -- set of bus indexes (integers).
+    :return: (*pandas.DataFrame*) -- one row per bus and stub branch, with
+        *'bus_id'*, *'branch_id'* and *'stub_degree'* columns. Buses that are not
+        stubs are left out.
     """
-    branches_from = branch.index[branch["from_bus_id"] == bus_id].tolist()
-    branches_to = branch.index[branch["to_bus_id"] == bus_id].tolist()
-
-    branches_connected = set(branches_from) | set(branches_to)
-
-    return branches_connected
-
-
-def _find_first_degree_branches(branch, branch_id):
-    """Find all branches connected to a given branch.
-
-    :param pandas.DataFrame branch: branch DataFrame from Grid object.
-    :param int branch_id: index of branches to find neighbors of.
-    :return: (*set*) -- set of branch indexes (integers).
-    """
-    from_bus = branch.loc[branch_id, "from_bus_id"]
-    to_bus = branch.loc[branch_id, "to_bus_id"]
-    endpoints = (from_bus, to_bus)
-    to_endpoints = branch.index[branch["to_bus_id"].isin(endpoints)]
-    from_endpoints = branch.index[branch["from_bus_id"].isin(endpoints)]
-    first_degree_branch_idxs = set(to_endpoints) | set(from_endpoints)
-
-    return first_degree_branch_idxs
-
-
-def _find_stub_degree(branch, bus_id):
-    """Find degree of stubbiness, and stub branches.
-
-    :param pandas.DataFrame branch: branch DataFrame from Grid object.
-    :param int bus_id: index of bus to find subbiness of.
-    :return: (*tuple*) -- tuple containing:
-        stub_degree (*int*) -- How stubby (non-negative integer).
-        connected_branches (*set*) -- set of branch indexes (integers).
-    """
-    connected_branch_idxs = _find_branches_connected_to_bus(branch, bus_id)
-    if len(connected_branch_idxs) == 1:
-        second_degree_branch_idxs = _find_first_degree_branches(
-            branch, tuple(connected_branch_idxs)[0]
-        )
-        if len(second_degree_branch_idxs) == 2:
-            # We could keep going recursively, but this is the max in Western.
-            return 2, second_degree_branch_idxs
-        else:
-            return 1, connected_branch_idxs
-    else:
-        return 0, set()
+    return Topology(branch).stub_branches()
 
 
 def _find_capacity_at_bus(plant, bus_id, gentypes):
@@ -81,7 +39,9 @@ def _find_capacity_at_bus(plant, bus_id, gentypes):
     return gentype_capacity
 
 
-def scale_renewable_stubs(change_table, fuzz=1, inplace=True, verbose=False):
+def scale_renewable_stubs(
+    change_table, fuzz=1, inplace=True, verbose=False, stubs=None
+):
     """Identify renewable gens behind 'stub' branches, scale up branch capacity
         (via change_table entries) to match generator capacity.
 
@@ -91,6 +51,9 @@ def scale_renewable_stubs(change_table, fuzz=1, inplace=True, verbose=False):
     :param bool inplace: if True, modify ct inplace and return None. If False,
         copy ct and return modified copy.
     :param bool verbose: if True, print info for each unscaled plant.
+    :param pandas.DataFrame stubs: stub branches of the grid of the change table, as
+        returned by :func:`find_stub_branches`. Taken from the topology of the grid,
+        which is cached, if None.
     :return: (*None*/*dict*) -- if inplace == True, return modified ct dict.
     """
 
@@ -101,45 +64,53 @@ def scale_renewable_stubs(change_table, fuzz=1, inplace=True, verbose=False):
     ref_plant = change_table.grid.plant
     ref_branch = change_table.grid.branch
     ref_bus = change_table.grid.bus
+    if stubs is None:
+        stubs = get_topology(change_table.grid).stub_branches()
     if "branch" not in ct:
         ct["branch"] = {}
     if "branch_id" not in ct["branch"]:
         ct["branch"]["branch_id"] = {}
     branch_id_ct = ct["branch"]["branch_id"]
 
+    stub_bus = stubs["bus_id"].unique()
     ren_types = ("hydro", "solar", "wind", "wind_offshore")
     for r in ren_types:
         ren_plants = ref_plant[ref_plant["type"] == r]
-        for p in ren_plants.index:
-            bus_id = ref_plant.loc[p, "bus_id"]
-            stub_degree, stub_branches = _find_stub_degree(ref_branch, bus_id)
-            if stub_degree > 0:
-                ren_capacity = _find_capacity_at_bus(ref_plant, bus_id, r)
-                if ren_capacity <= 0:
-                    print("%s plant %s at bus %s has 0 Pmax!" % (r, p, bus_id))
-                    continue
-                # Calculate total scaling factor (zone * plant)
-                gen_scale_factor = 1
-                # First scale by zone_id
-                zone_id = ref_bus.loc[bus_id, "zone_id"]
-                try:
-                    gen_scale_factor *= ct[r]["zone_id"][zone_id]
-                except KeyError:
-                    pass
-                # Then scale by plant_id
-                try:
-                    gen_scale_factor *= ct[r]["plant_id"][p]
-                except KeyError:
-                    pass
-                if verbose and gen_scale_factor == 1:
-                    print(f"no scaling factor for {r}, {zone_id}, plant {p}")
-                for b in stub_branches:
-                    if ref_branch.loc[b, "rateA"] == 0:
-                        continue
-                    old_branch_cap = ref_branch.loc[b, "rateA"]
-                    if old_branch_cap < ren_capacity * gen_scale_factor:
-                        new_branch_cap = ren_capacity * gen_scale_factor + fuzz
-                        branch_id_ct[b] = new_branch_cap / old_branch_cap
+        capacity = ren_plants.groupby("bus_id")["Pmax"].sum()
+        ren_plants = ren_plants[ren_plants["bus_id"].isin(stub_bus)]
+        if len(ren_plants) == 0:
+            continue
+        plant = pd.DataFrame(
+            {
+                "plant_id": ren_plants.index,
+                "bus_id": ren_plants["bus_id"].to_numpy(),
+                "capacity": capacity.loc[ren_plants["bus_id"]].to_numpy(),
+                "zone_id": ref_bus.loc[ren_plants["bus_id"], "zone_id"].to_numpy(),
+            }
+        )
+        for p in plant.query("capacity <= 0").itertuples():
+            print("%s plant %s at bus %s has 0 Pmax!" % (r, p.plant_id, p.bus_id))
+        plant = plant.query("capacity > 0")
+
+        # Calculate total scaling factor (zone * plant)
+        scaling = ct.get(r, {})
+        zone_factor = plant["zone_id"].map(scaling.get("zone_id", {})).fillna(1)
+        plant_factor = plant["plant_id"].map(scaling.get("plant_id", {})).fillna(1)
+        plant = plant.assign(factor=zone_factor.to_numpy() * plant_factor.to_numpy())
+        if verbose:
+            for p in plant.query("factor == 1").itertuples():
+                print(f"no scaling factor for {r}, {p.zone_id}, plant {p.plant_id}")
+
+        upgrade = plant.merge(stubs[["bus_id", "branch_id"]], on="bus_id", sort=False)
+        old_branch_cap = ref_branch.loc[upgrade["branch_id"], "rateA"].to_numpy()
+        new_capacity = upgrade["capacity"].to_numpy() * upgrade["factor"].to_numpy()
+        scaled = (old_branch_cap != 0) & (old_branch_cap < new_capacity)
+        branch_id_ct.update(
+            zip(
+                upgrade["branch_id"][scaled],
+                (new_capacity[scaled] + fuzz) / old_branch_cap[scaled],
+            )
+        )
 
     if not inplace:
         return ct
@@ -1,12 +1,14 @@
 import datetime
 import sys
 
-import networkx as nx
 import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 
 # Importing the module, not anything in it, to avid a circular import
 import powersimdata.input.grid as _grid
+from powersimdata.input.topology import get_topology
 from powersimdata.network.model import ModelImmutables
 
 
@@ -76,24 +78,69 @@ def _check_attributes(grid, error_messages):
             error_messages.append(f"grid object must have attribute {r}.")
 
 
+def _find_islands(grid):
+    """Find groups of buses cut off from the rest of their interconnect. Buses
+    connected through branches and DC lines within their interconnect form components
+    and the largest component of each interconnect is its main network. All the other
+    components are islands, unless a DC line ties them to another interconnect.
+
+    :param powersimdata.input.grid.Grid grid: grid or grid-like object to check.
+    :return: (*list*) -- interconnect and sorted bus ids of each island, largest
+        islands first.
+    """
+    bus = grid.bus
+    interconnect = (
+        bus["interconnect"].astype(str).to_numpy()
+        if "interconnect" in bus.columns
+        else np.full(len(bus), "")
+    )
+    dc_from = bus.index.get_indexer(grid.dcline["from_bus_id"])
+    dc_to = bus.index.get_indexer(grid.dcline["to_bus_id"])
+    dc_valid = (dc_from >= 0) & (dc_to >= 0)
+    dc_tie = dc_valid & (interconnect[dc_from] != interconnect[dc_to])
+    dc_internal = dc_valid & ~dc_tie
+
+    from_bus = np.concatenate(
+        [bus.index.get_indexer(grid.branch["from_bus_id"]), dc_from[dc_internal]]
+    )
+    to_bus = np.concatenate(
+        [bus.index.get_indexer(grid.branch["to_bus_id"]), dc_to[dc_internal]]
+    )
+    valid = (from_bus >= 0) & (to_bus >= 0)
+    adjacency = csr_matrix(
+        (np.ones(valid.sum()), (from_bus[valid], to_bus[valid])),
+        shape=(len(bus), len(bus)),
+    )
+    _, component = connected_components(adjacency, directed=False)
+    tied = set(component[np.concatenate([dc_from[dc_tie], dc_to[dc_tie]])])
+
+    groups = bus.index.to_series().groupby([interconnect, component])
+    size = groups.size().sort_values(ascending=False, kind="stable")
+    islands = size.index[
+        size.index.get_level_values(0).duplicated()
+        & ~size.index.get_level_values(1).isin(tied)
+    ]
+    members = groups.groups
+    return [(key[0], sorted(members[key])) for key in islands]
+
+
 def _check_for_islanded_buses(grid, error_messages):
     """Check whether a transmission network (AC & DC) does not connect to one or more
-    buses.
+    buses. Islanded buses are reported per connected component.
 
     :param powersimdata.input.grid.Grid grid: grid or grid-like object to check.
     :param list error_messages: list, to be appended to with a str if:
-        branches/DC lines exist in the ``grid``, but one or more buses are islanded.
+        branches/DC lines exist in the ``grid``, but one or more buses are cut off
+        from the rest of their interconnect.
     """
     if len(grid.branch) + len(grid.dcline) > 0:
-        connected_buses = set().union(
-            set(grid.branch.from_bus_id),
-            set(grid.branch.to_bus_id),
-            set(grid.dcline.from_bus_id),
-            set(grid.dcline.to_bus_id),
-        )
-        isolated_buses = set(grid.bus.index) - connected_buses
-        if len(isolated_buses) > 0:
-            error_messages.append(f"islanded buses detected: {isolated_buses}.")
+        islands = _find_islands(grid)
+        if len(islands) > 0:
+            description = "; ".join(f"{i}: {b}" for i, b in islands)
+            error_messages.append(
+                f"islanded buses detected in {len(islands)} component(s): "
+                f"{description}."
+            )
 
 
 def _check_for_undescribed_buses(grid, error_messages):
@@ -206,8 +253,8 @@ def _check_connected_components(grid, error_messages):
     :param list error_messages: list, to be appended to with a str if:
         connected components and listed interconnects of a ``grid`` don't match.
     """
-    g = nx.from_pandas_edgelist(grid.branch, "from_bus_id", "to_bus_id")
-    num_connected_components = len([c for c in nx.connected_components(g)])
+    topology = get_topology(grid)
+    num_connected_components = topology.component[topology.degree > 0].nunique()
     if len(grid.interconnect) == 1:
         # Check for e.g. ['USA'] interconnect, which is really three interconnects
         interconnect_aliases = grid.model_immutables.zones["interconnect_combinations"]
@@ -1,4 +1,4 @@
-import copy
+import time
 
 import numpy as np
 from scipy.io import savemat
@@ -6,47 +6,92 @@ from scipy.io import savemat
 from powersimdata.input.transform_profile import TransformProfile
 
 
-def export_case_mat(grid, filepath, storage_filepath=None):
+def _stack_columns(df, drop=(), index=False, dtype=None):
+    """Builds a 2D array from the columns of a data frame, without copying the data
+    frame first.
+
+    :param pandas.DataFrame df: data frame.
+    :param iterable drop: columns to leave out.
+    :param bool index: whether the index is the first column of the array.
+    :param numpy.dtype dtype: data type of the array. Inferred from the columns if
+        None.
+    :return: (*numpy.ndarray*) -- array.
+    """
+    columns = [df[c].to_numpy() for c in df.columns if c not in set(drop)]
+    if index:
+        columns.insert(0, df.index.to_numpy())
+    if len(columns) == 0:
+        return np.empty((len(df), 0), dtype=dtype)
+    array = np.column_stack(columns)
+    return array if dtype is None else array.astype(dtype, copy=False)
+
+
+def _column(values):
+    """Reshapes values in a column vector.
+
+    :param array-like values: values.
+    :return: (*numpy.ndarray*) -- array with one column.
+    """
+    return np.asarray(values).reshape(-1, 1)
+
+
+class _Timer:
+    """Records the time spent building each table."""
+
+    def __init__(self):
+        self.timings = {}
+        self._last = time.perf_counter()
+
+    def lap(self, name):
+        """Records the time elapsed since the previous lap.
+
+        :param str name: name of the table built during the lap.
+        """
+        now = time.perf_counter()
+        self.timings[name] = now - self._last
+        self._last = now
+
+
+def export_case_mat(grid, filepath, storage_filepath=None, do_compression=False):
     """Export a grid to a format suitable for loading into simulation engine.
+    Matrices are assembled from the columns of the grid tables.
 
     :param powersimdata.input.grid.Grid grid: Grid instance.
     :param str filepath: path where main grid file will be saved.
     :param str storage_filepath: path where storage data file will be saved, if present.
+    :param bool do_compression: whether to compress the matrices.
+    :return: (*dict*) -- time spent in seconds building each table and writing the
+        files.
     """
-    grid = copy.deepcopy(grid)
-
-    mpc = {"mpc": {"version": "2", "baseMVA": 100.0}}
+    grid = grid.view()
+    timer = _Timer()
+    mpc = {"version": "2", "baseMVA": 100.0}
 
     # zone
-    mpc["mpc"]["zone"] = np.array(list(grid.id2zone.items()), dtype=object)
+    mpc["zone"] = np.array(list(grid.id2zone.items()), dtype=object)
+    timer.lap("zone")
 
     # sub
-    sub = grid.sub.copy()
-    subid = sub.index.values[np.newaxis].T
-    mpc["mpc"]["sub"] = sub.values
-    mpc["mpc"]["subid"] = subid
+    sub = grid.sub
+    mpc["sub"] = _stack_columns(sub)
+    mpc["subid"] = _column(sub.index)
+    timer.lap("sub")
 
     # bus
-    bus = grid.bus.copy()
-    busid = bus.index.values[np.newaxis].T
-    bus.reset_index(level=0, inplace=True)
-    bus.drop(columns=["interconnect", "lat", "lon"], inplace=True)
-    mpc["mpc"]["bus"] = bus.values
-    mpc["mpc"]["busid"] = busid
+    bus = grid.bus
+    mpc["bus"] = _stack_columns(bus, drop=["interconnect", "lat", "lon"], index=True)
+    mpc["busid"] = _column(bus.index)
+    timer.lap("bus")
 
     # bus2sub
-    bus2sub = grid.bus2sub.copy()
-    mpc["mpc"]["bus2sub"] = bus2sub.values
+    mpc["bus2sub"] = _stack_columns(grid.bus2sub)
+    timer.lap("bus2sub")
 
     # plant
-    gen = grid.plant.copy()
-    genid = gen.index.values[np.newaxis].T
-    genfuel = gen.type.values[np.newaxis].T
-    genfuelcost = gen.GenFuelCost.values[np.newaxis].T
-    heatratecurve = gen[["GenIOB", "GenIOC", "GenIOD"]].values
-    gen.reset_index(inplace=True, drop=True)
-    gen.drop(
-        columns=[
+    gen = grid.plant
+    mpc["gen"] = _stack_columns(
+        gen,
+        drop=[
             "type",
             "interconnect",
             "lat",
@@ -58,20 +103,18 @@ def export_case_mat(grid, filepath, storage_filepath=None):
             "GenIOC",
             "GenIOD",
         ],
-        inplace=True,
     )
-    mpc["mpc"]["gen"] = gen.values
-    mpc["mpc"]["genid"] = genid
-    mpc["mpc"]["genfuel"] = genfuel
-    mpc["mpc"]["genfuelcost"] = genfuelcost
-    mpc["mpc"]["heatratecurve"] = heatratecurve
+    mpc["genid"] = _column(gen.index)
+    mpc["genfuel"] = _column(gen["type"].to_numpy(dtype=object))
+    mpc["genfuelcost"] = _column(gen["GenFuelCost"])
+    mpc["heatratecurve"] = _stack_columns(gen[["GenIOB", "GenIOC", "GenIOD"]])
+    timer.lap("plant")
+
     # branch
-    branch = grid.branch.copy()
-    branchid = branch.index.values[np.newaxis].T
-    branchdevicetype = branch.branch_device_type.values[np.newaxis].T
-    branch.reset_index(inplace=True, drop=True)
-    branch.drop(
-        columns=[
+    branch = grid.branch
+    mpc["branch"] = _stack_columns(
+        branch,
+        drop=[
             "interconnect",
             "from_lat",
             "from_lon",
@@ -83,60 +126,86 @@ def export_case_mat(grid, filepath, storage_filepath=None):
             "to_zone_name",
             "branch_device_type",
         ],
-        inplace=True,
     )
-    mpc["mpc"]["branch"] = branch.values
-    mpc["mpc"]["branchid"] = branchid
-    mpc["mpc"]["branchdevicetype"] = branchdevicetype
+    mpc["branchid"] = _column(branch.index)
+    mpc["branchdevicetype"] = _column(
+        branch["branch_device_type"].to_numpy(dtype=object)
+    )
+    timer.lap("branch")
 
     # generation cost
-    gencost = grid.gencost.copy()
-    gencost["before"].reset_index(inplace=True, drop=True)
-    gencost["before"].drop(columns=["interconnect"], inplace=True)
-    mpc["mpc"]["gencost"] = gencost["before"].values
+    mpc["gencost"] = _stack_columns(grid.gencost["before"], drop=["interconnect"])
+    timer.lap("gencost")
 
     # DC line
-    if len(grid.dcline) > 0:
-        dcline = grid.dcline.copy()
-        dclineid = dcline.index.values[np.newaxis].T
-        dcline.reset_index(inplace=True, drop=True)
-        dcline.drop(columns=["from_interconnect", "to_interconnect"], inplace=True)
-        mpc["mpc"]["dcline"] = dcline.values
-        mpc["mpc"]["dclineid"] = dclineid
+    dcline = grid.dcline
+    if len(dcline) > 0:
+        mpc["dcline"] = _stack_columns(
+            dcline, drop=["from_interconnect", "to_interconnect"]
+        )
+        mpc["dclineid"] = _column(dcline.index)
+    timer.lap("dcline")
 
     # energy storage
-    if len(grid.storage["gen"]) > 0:
-        storage = grid.storage.copy()
-
+    storage = grid.storage
+    if len(storage["gen"]) > 0:
         mpc_storage = {
             "storage": {
                 "xgd_table": np.array([]),
-                "gen": np.array(storage["gen"].values, dtype=np.float64),
+                "gen": _stack_columns(storage["gen"], dtype=np.float64),
                 "sd_table": {
                     "colnames": storage["StorageData"].columns.values[np.newaxis],
-                    "data": storage["StorageData"].values,
+                    "data": _stack_columns(storage["StorageData"]),
                 },
             }
         }
+        timer.lap("storage")
+        savemat(
+            storage_filepath,
+            mpc_storage,
+            appendmat=False,
+            do_compression=do_compression,
+        )
+        timer.lap("write_storage")
 
-        savemat(storage_filepath, mpc_storage, appendmat=False)
+    savemat(filepath, {"mpc": mpc}, appendmat=False, do_compression=do_compression)
+    timer.lap("write")
+    return timer.timings
 
-    savemat(filepath, mpc, appendmat=False)
 
-
-def export_transformed_profile(kind, scenario_info, grid, ct, filepath):
+def export_transformed_profile(kind, scenario_info, grid, ct, filepath, chunk_size=744):
     """Apply transformation to the given kind of profile and save the result locally.
+    The profile is computed and written block of rows by block of rows, so that the
+    memory used is bounded by the size of a block.
 
     :param str kind: which profile to export. This parameter is passed to
-        :meth:`TransformProfile.get_profile`.
+        :meth:`TransformProfile.get_profile_view`.
     :param dict scenario_info: a dict containing the profile version, with
         key in the form base_{kind}
     :param powersimdata.input.grid.Grid grid: a Grid object previously
         transformed.
     :param dict ct: change table.
     :param str filepath: path to save the result, including the filename
+    :param int chunk_size: number of hours computed and written at once.
     """
     tp = TransformProfile(scenario_info, grid, ct)
-    profile = tp.get_profile(kind)
+    profile = tp.get_profile_view(kind)
     print(f"Writing scaled {kind} profile to {filepath} on local machine")
-    profile.to_csv(filepath)
+    with open(filepath, "w", newline="") as f:
+        for i, chunk in enumerate(_iter_chunks(profile, chunk_size)):
+            chunk.to_frame().to_csv(f, header=i == 0)
+
+
+def _iter_chunks(profile, chunk_size):
+    """Splits a profile in blocks of rows.
+
+    :param powersimdata.input.profile_view.ProfileView profile: profile.
+    :param int chunk_size: number of rows in each block.
+    :return: (*generator*) -- views of consecutive blocks of rows.
+    """
+    index = profile.index
+    if len(index) == 0:
+        yield profile
+    for start in range(0, len(index), chunk_size):
+        end = min(start + chunk_size, len(index)) - 1
+        yield profile.window(index[start], index[end])
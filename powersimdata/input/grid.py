@@ -1,14 +1,64 @@
+import copy
+import glob
 import os
+import sys
 
 from powersimdata.data_access.context import Context
 from powersimdata.data_access.scenario_list import ScenarioListManager
+from powersimdata.input import helpers
 from powersimdata.input.scenario_grid import FromREISE, FromREISEjl
+from powersimdata.input.topology import get_topology
 from powersimdata.network.model import ModelImmutables
 from powersimdata.network.usa_tamu.constants import storage as tamu_storage
-from powersimdata.network.usa_tamu.model import TAMU
-from powersimdata.utility.helpers import MemoryCache, cache_key
+from powersimdata.network.usa_tamu.model import TAMU, check_and_format_interconnect
+from powersimdata.utility import server_setup
+from powersimdata.utility.helpers import (
+    DiskCache,
+    MemoryCache,
+    cache_key,
+    get_package_version,
+    read_only_copy,
+)
 
 _cache = MemoryCache()
+_disk_cache = DiskCache(os.path.join(server_setup.LOCAL_DIR, "cache", "grid"))
+
+
+_attributes = ["data_loc", "interconnect", "zone2id", "id2zone"]
+_tables = ["sub", "plant", "gencost", "dcline", "bus2sub", "bus", "branch", "storage"]
+
+
+class _Table:
+    """Grid table. Tables are shared read-only with the grid cache and the grids
+    forked from the same grid until they are accessed: a modifiable copy is then
+    made, except for grids returned by :meth:`Grid.view`.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, grid, owner=None):
+        if grid is None:
+            return self
+        if self.name not in grid._tables:
+            if self.name not in grid._shared:
+                raise AttributeError(
+                    f"'{type(grid).__name__}' object has no attribute '{self.name}'"
+                )
+            shared = grid._shared[self.name]
+            grid._tables[self.name] = (
+                read_only_copy(shared) if grid._read_only else copy.deepcopy(shared)
+            )
+        return grid._tables[self.name]
+
+    def __set__(self, grid, value):
+        grid._tables[self.name] = value
+        grid.__dict__.pop("_topology", None)
+
+    def __delete__(self, grid):
+        grid._tables.pop(self.name, None)
+        grid._shared.pop(self.name, None)
+        grid.__dict__.pop("_topology", None)
 
 
 class Grid:
@@ -16,6 +66,15 @@ class Grid:
     SUPPORTED_MODELS = {"usa_tamu"}
     SUPPORTED_ENGINES = {"REISE", "REISE.jl"}
 
+    sub = _Table()
+    plant = _Table()
+    gencost = _Table()
+    dcline = _Table()
+    bus2sub = _Table()
+    bus = _Table()
+    branch = _Table()
+    storage = _Table()
+
     """Grid
 
     :param str/iterable interconnect: geographical region covered. Either *'USA'*, one of
@@ -43,36 +102,90 @@ class Grid:
                 f"Engine must be one of {','.join(self.SUPPORTED_ENGINES)}"
             )
 
+        self.__dict__.update(_shared={}, _tables={}, _read_only=False)
         key = cache_key(interconnect, source)
         cached = _cache.get(key)
-        if cached is not None:
-            data = cached
-        elif source == "usa_tamu":
-            data = TAMU(interconnect)
-        elif os.path.splitext(source)[1] == ".mat":
-            if engine == "REISE":
-                data = FromREISE(source)
-            elif engine == "REISE.jl":
-                data = FromREISEjl(source)
-
-        self.data_loc = data.data_loc
-        self.interconnect = data.interconnect
-        self.zone2id = data.zone2id
-        self.id2zone = data.id2zone
-        self.sub = data.sub
-        self.plant = data.plant
-        self.gencost = data.gencost
-        self.dcline = data.dcline
-        self.bus2sub = data.bus2sub
-        self.bus = data.bus
-        self.branch = data.branch
-        self.storage = data.storage
-
-        _cache.put(key, self)
+        if cached is None:
+            disk_key = _get_disk_cache_key(interconnect, source, engine)
+            data = _disk_cache.get(disk_key)
+            if data is None:
+                if source == "usa_tamu":
+                    data = TAMU(interconnect)
+                elif os.path.splitext(source)[1] == ".mat":
+                    if engine == "REISE":
+                        data = FromREISE(source)
+                    elif engine == "REISE.jl":
+                        data = FromREISEjl(source)
+                _disk_cache.put(disk_key, data)
+            cached = {a: getattr(data, a) for a in _attributes + _tables}
+            _cache.put(key, cached)
+            frozen = _cache.get(key)
+            cached = read_only_copy(cached) if frozen is None else frozen
+
+        for a in _attributes:
+            setattr(self, a, cached[a])
+        self._shared = {t: cached[t] for t in _tables}
 
         self.grid_model = self._get_grid_model()
         self.model_immutables = ModelImmutables(self.grid_model)
 
+    def _fork(self, read_only):
+        """Returns a grid sharing the read-only tables of this grid.
+
+        :param bool read_only: whether tables of the new grid are read-only.
+        :return: (*powersimdata.input.grid.Grid*) -- a Grid object.
+        """
+        grid = copy.copy(self)
+        for k, v in self.__dict__.items():
+            if k not in {"_shared", "_tables", "_read_only", "_topology"}:
+                grid.__dict__[k] = copy.deepcopy(v)
+        shared = {
+            t: read_only_copy(self._tables[t]) if t in self._tables else v
+            for t, v in {**self._shared, **self._tables}.items()
+        }
+        grid.__dict__.update(_shared=shared, _tables={}, _read_only=read_only)
+        return grid
+
+    def view(self):
+        """Returns a read-only view of the grid. Tables are shared with this grid
+        when they have not been accessed since it was built, and copied once
+        otherwise. Tables and columns of the view can be replaced, but modifying
+        numeric values in place raises a ValueError. Object columns, e.g. names and
+        types, are copied so that they can be compared.
+
+        :return: (*powersimdata.input.grid.Grid*) -- a Grid object.
+        """
+        return self._fork(True)
+
+    def mutable(self):
+        """Returns a modifiable copy of the grid. Tables are only copied when they
+        are accessed.
+
+        :return: (*powersimdata.input.grid.Grid*) -- a Grid object.
+        """
+        return self._fork(False)
+
+    @property
+    def topology(self):
+        """Topology of the grid, built when first requested and again when the bus,
+        branch, dcline, plant or bus2sub table has been replaced or has had rows
+        added or dropped. Bus ids modified in place are not detected, in which case
+        ``del grid._topology`` resets the topology.
+
+        :return: (*powersimdata.input.topology.Topology*) -- topology.
+        """
+        return get_topology(self)
+
+    def __deepcopy__(self, memo):
+        return self.mutable()
+
+    def __setstate__(self, state):
+        if "_shared" not in state:
+            # Grid pickled before tables were shared
+            tables = {t: state.pop(t) for t in _tables if t in state}
+            state.update(_shared={}, _tables=tables, _read_only=False)
+        self.__dict__.update(state)
+
     def _get_grid_model(self):
         """Get the grid model.
 
@@ -164,6 +277,32 @@ class Grid:
         return True
 
 
+def _get_disk_cache_key(interconnect, source, engine):
+    """Get the key of a grid in the disk cache. The key includes the modification
+    time and size of the files the grid is built from, as well as the package version
+    and the modification time of the modules building the grid, such that any change
+    invalidates the cached grid.
+
+    :param str/iterable interconnect: geographical region covered.
+    :param str source: grid model or path to a .mat file that represents a grid.
+    :param str engine: engine used to run scenario, if using ScenarioGrid.
+    :return: (*tuple*) -- cache key.
+    """
+    if source == "usa_tamu":
+        builder = TAMU
+        interconnect = check_and_format_interconnect(interconnect)
+        model_dir = os.path.dirname(sys.modules[TAMU.__module__].__file__)
+        files = sorted(glob.glob(os.path.join(model_dir, "data", "*.csv")))
+    else:
+        builder = FromREISE if engine == "REISE" else FromREISEjl
+        interconnect = None
+        source = os.path.abspath(source)
+        files = [source] if os.path.isfile(source) else []
+    files += [sys.modules[builder.__module__].__file__, helpers.__file__]
+    fingerprint = [[f, os.stat(f).st_mtime_ns, os.stat(f).st_size] for f in files]
+    return cache_key(get_package_version(), source, interconnect, engine, fingerprint)
+
+
 def _get_grid_model_from_scenario_list(source):
     """Get grid model for a scenario listed in the scenario list.
 
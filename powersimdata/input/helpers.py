@@ -36,24 +36,37 @@ def add_column_to_data_frame(data_frame, column_dict):
         data_frame[key] = value
 
 
+def _lookup(values, keys):
+    """Looks up values by key.
+
+    :param pandas.Series values: values indexed by unique keys.
+    :param iterable keys: keys to look up.
+    :return: (*numpy.ndarray*) -- values, in the same order as keys.
+    :raises KeyError: if some keys are not in the index of values.
+    """
+    position = values.index.get_indexer(keys)
+    if (position == -1).any():
+        missing = pd.Index(keys)[position == -1].unique().tolist()
+        raise KeyError(f"{missing} not found")
+    return values.to_numpy()[position]
+
+
 def add_coord_to_grid_data_frames(grid):
     """Adds longitude and latitude information to bus, plant and branch data
         frames of grid instance.
 
     :param powersimdata.input.grid.Grid grid: grid instance.
     """
-    bus2coord = (
-        pd.merge(grid.bus2sub[["sub_id"]], grid.sub[["lat", "lon"]], on="sub_id")
-        .set_index(grid.bus2sub.index)
-        .drop(columns="sub_id")
-        .to_dict()
+    bus2coord = pd.DataFrame(
+        {c: _lookup(grid.sub[c], grid.bus2sub.sub_id) for c in ["lat", "lon"]},
+        index=grid.bus2sub.index,
     )
 
     def get_lat(idx):
-        return [bus2coord["lat"][i] for i in idx]
+        return _lookup(bus2coord["lat"], idx)
 
     def get_lon(idx):
-        return [bus2coord["lon"][i] for i in idx]
+        return _lookup(bus2coord["lon"], idx)
 
     extra_col_bus = {"lat": get_lat(grid.bus.index), "lon": get_lon(grid.bus.index)}
     add_column_to_data_frame(grid.bus, extra_col_bus)
@@ -78,13 +91,14 @@ def add_zone_to_grid_data_frames(grid):
 
     :param powersimdata.input.grid.Grid grid: grid instance.
     """
-    bus2zone = grid.bus.zone_id.to_dict()
+    bus2zone = grid.bus.zone_id
+    id2zone = pd.Series(grid.id2zone, dtype=object)
 
     def get_zone_id(idx):
-        return [bus2zone[i] for i in idx]
+        return _lookup(bus2zone, idx)
 
     def get_zone_name(idx):
-        return [grid.id2zone[bus2zone[i]] for i in idx]
+        return _lookup(id2zone, get_zone_id(idx))
 
     extra_col_plant = {
         "zone_id": get_zone_id(grid.plant.bus_id),
@@ -107,10 +121,10 @@ def add_interconnect_to_grid_data_frames(grid):
 
     :param powersimdata.input.grid.Grid grid: grid instance.
     """
-    bus2interconnect = grid.bus2sub.interconnect.to_dict()
+    bus2interconnect = grid.bus2sub.interconnect
 
     def get_interconnect(idx):
-        return [bus2interconnect[i] for i in idx]
+        return _lookup(bus2interconnect, idx)
 
     extra_col_bus = {"interconnect": get_interconnect(grid.bus.index)}
     add_column_to_data_frame(grid.bus, extra_col_bus)
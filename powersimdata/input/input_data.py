@@ -1,13 +1,17 @@
+import hashlib
+import json
 import os
 
+import numpy as np
 import pandas as pd
 
 from powersimdata.data_access.context import Context
 from powersimdata.data_access.profile_helper import ProfileHelper
+from powersimdata.input.profile_view import ProfileView
 from powersimdata.utility import server_setup
 from powersimdata.utility.helpers import MemoryCache, cache_key
 
-_cache = MemoryCache()
+_cache = MemoryCache(max_size=server_setup.MEMORY_CACHE_SIZE)
 
 profile_kind = {"demand", "hydro", "solar", "wind"}
 
@@ -67,15 +71,19 @@ class InputData:
         """Constructor."""
         self.data_access = Context.get_data_access(data_loc)
 
-    def get_data(self, scenario_info, field_name):
+    def get_data(self, scenario_info, field_name, columns=None):
         """Returns data either from server or local directory.
 
         :param dict scenario_info: scenario information.
         :param str field_name: *'demand'*, *'hydro'*, *'solar'*, *'wind'*,
             *'ct'* or *'grid'*.
+        :param list columns: columns to load, only used for profiles. If None,
+            all columns are loaded.
         :return: (*pandas.DataFrame*, *dict*, or *str*) --
             demand, hydro, solar or wind as a data frame, change table as a
-            dictionary, or the path to a matfile enclosing the grid data.
+            dictionary, or the path to a matfile enclosing the grid data. Profiles
+            loaded in full are cached and read-only, copy them before modifying
+            them in place.
         :raises FileNotFoundError: if file not found on local machine.
         """
         _check_field(field_name)
@@ -92,19 +100,53 @@ class InputData:
         key = cache_key(filepath)
         cached = _cache.get(key)
         if cached is not None:
-            return cached
+            return cached if columns is None else cached[columns]
         try:
-            data = _read_data(filepath)
+            data = _read_data(filepath, columns)
         except FileNotFoundError:
             print(
                 "%s not found in %s on local machine"
                 % (file_name, server_setup.LOCAL_DIR)
             )
             helper.download_file(file_name, from_dir)
-            data = _read_data(filepath)
-        _cache.put(key, data)
+            data = _read_data(filepath, columns)
+        if columns is None:
+            _cache.put(key, data)
+            cached = _cache.get(key)
+            if cached is not None:
+                return cached
         return data
 
+    def get_profile_view(self, scenario_info, field_name):
+        """Returns a lazy view of a raw profile, either from server or local
+        directory. Values are memory-mapped and only computed on demand.
+
+        :param dict scenario_info: scenario information.
+        :param str field_name: *'demand'*, *'hydro'*, *'solar'* or *'wind'*.
+        :return: (*powersimdata.input.profile_view.ProfileView*) -- view of the
+            profile.
+        :raises ValueError: if field_name is not a profile.
+        """
+        if field_name not in profile_kind:
+            raise ValueError(
+                "Only %s profiles can be viewed" % " | ".join(sorted(profile_kind))
+            )
+        print("--> Loading %s" % field_name)
+
+        file_name, from_dir = ProfileHelper.get_file_components(
+            scenario_info, field_name
+        )
+        filepath = os.path.join(server_setup.LOCAL_DIR, *from_dir, file_name)
+        try:
+            return _read_profile_view(filepath)
+        except FileNotFoundError:
+            print(
+                "%s not found in %s on local machine"
+                % (file_name, server_setup.LOCAL_DIR)
+            )
+            ProfileHelper.download_file(file_name, from_dir)
+            return _read_profile_view(filepath)
+
     def get_profile_version(self, grid_model, kind):
         """Returns available raw profile from blob storage or local disk.
 
@@ -115,10 +157,12 @@ class InputData:
         return self.data_access.get_profile_version(grid_model, kind)
 
 
-def _read_data(filepath):
+def _read_data(filepath, columns=None):
     """Reads data from local machine.
 
     :param str filepath: path to file, with extension either 'pkl', 'csv', or 'mat'.
+    :param list columns: columns to load from a profile. If None, all columns are
+        loaded.
     :return: (*pandas.DataFrame*, *dict*, or *str*) -- demand, hydro, solar or
         wind as a data frame, change table as a dict, or str containing a
         local path to a matfile of grid data.
@@ -128,8 +172,7 @@ def _read_data(filepath):
     if ext == "pkl":
         data = pd.read_pickle(filepath)
     elif ext == "csv":
-        data = pd.read_csv(filepath, index_col=0, parse_dates=True)
-        data.columns = data.columns.astype(int)
+        data = _read_profile(filepath, columns)
     elif ext == "mat":
         # Try to load the matfile, just to check if it exists locally
         open(filepath, "r")
@@ -140,15 +183,163 @@ def _read_data(filepath):
     return data
 
 
-def get_bus_demand(scenario_info, grid):
-    """Returns demand profiles by bus.
+def _get_profile_cache_dir(filepath):
+    """Returns the location of the binary cache of a raw profile.
+
+    :param str filepath: path to the profile csv file.
+    :return: (*str*) -- path to the cache directory of the profile.
+    """
+    dirname, file_name = os.path.split(filepath)
+    return os.path.join(dirname, "cache", os.path.splitext(file_name)[0])
+
+
+def _get_checksum(filepath, chunk_size=1 << 20):
+    """Computes the checksum of a file.
+
+    :param str filepath: path to file.
+    :param int chunk_size: number of bytes read at once.
+    :return: (*str*) -- sha1 hexadecimal digest of the file content.
+    """
+    sha1 = hashlib.sha1()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def _is_profile_cache_valid(filepath, cache_dir):
+    """Checks whether the binary cache of a raw profile matches the csv file. The
+    checksum is only recomputed when the size or modification time of the csv file
+    differ from the ones recorded when the cache was written.
+
+    :param str filepath: path to the profile csv file.
+    :param str cache_dir: path to the cache directory of the profile.
+    :return: (*bool*) -- whether the cache can be used.
+    :raises FileNotFoundError: if the csv file does not exist.
+    """
+    stat = os.stat(filepath)
+    try:
+        with open(os.path.join(cache_dir, "meta.json")) as f:
+            meta = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return False
+
+    if meta["size"] == stat.st_size and meta["mtime"] == stat.st_mtime_ns:
+        return True
+    if meta["size"] != stat.st_size or meta["checksum"] != _get_checksum(filepath):
+        return False
+
+    meta["mtime"] = stat.st_mtime_ns
+    with open(os.path.join(cache_dir, "meta.json"), "w") as f:
+        json.dump(meta, f)
+    return True
+
+
+def _save_array(filepath, array):
+    """Saves an array in NumPy format. The file is written under a temporary name
+    and then renamed so that arrays already memory-mapped by a reader are left
+    untouched.
+
+    :param str filepath: path to the .npy file.
+    :param numpy.ndarray array: array to save.
+    """
+    tmp_filepath = filepath + ".tmp"
+    with open(tmp_filepath, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_filepath, filepath)
+
+
+def _write_profile_cache(filepath, cache_dir):
+    """Parses a raw profile csv file and writes it to a binary cache. Values are
+    stored in column-major order so that a subset of columns can be read without
+    loading the whole array.
+
+    :param str filepath: path to the profile csv file.
+    :param str cache_dir: path to the cache directory of the profile.
+    """
+    print("Building binary cache of %s" % os.path.basename(filepath))
+    stat = os.stat(filepath)
+    profile = pd.read_csv(filepath, index_col=0, parse_dates=True)
+    profile.columns = profile.columns.astype(int)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Invalidate the previous cache, if any, before overwriting its content
+    meta_path = os.path.join(cache_dir, "meta.json")
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    _save_array(os.path.join(cache_dir, "data.npy"), np.asfortranarray(profile.values))
+    _save_array(os.path.join(cache_dir, "index.npy"), profile.index.values)
+    _save_array(os.path.join(cache_dir, "columns.npy"), profile.columns.values)
+    meta = {
+        "index_name": profile.index.name,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "checksum": _get_checksum(filepath),
+    }
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+
+
+def _open_profile_cache(cache_dir):
+    """Opens the binary cache of a raw profile without loading its values.
+
+    :param str cache_dir: path to the cache directory of the profile.
+    :return: (*powersimdata.input.profile_view.ProfileView*) -- view of the
+        memory-mapped profile.
+    """
+    with open(os.path.join(cache_dir, "meta.json")) as f:
+        meta = json.load(f)
+    index = pd.DatetimeIndex(
+        np.load(os.path.join(cache_dir, "index.npy")), name=meta["index_name"]
+    )
+    columns = np.load(os.path.join(cache_dir, "columns.npy"))
+    data = np.load(os.path.join(cache_dir, "data.npy"), mmap_mode="r")
+    return ProfileView(data, index, columns)
+
+
+def _read_profile_view(filepath):
+    """Opens a raw profile, building its binary cache first if needed.
+
+    :param str filepath: path to the profile csv file.
+    :return: (*powersimdata.input.profile_view.ProfileView*) -- view of the
+        memory-mapped profile.
+    :raises FileNotFoundError: if the csv file does not exist.
+    """
+    cache_dir = _get_profile_cache_dir(filepath)
+    if not _is_profile_cache_valid(filepath, cache_dir):
+        _write_profile_cache(filepath, cache_dir)
+    return _open_profile_cache(cache_dir)
+
+
+def _read_profile(filepath, columns=None):
+    """Reads a raw profile. The csv file is parsed once and subsequent reads are
+    done from a binary cache located next to it.
+
+    :param str filepath: path to the profile csv file.
+    :param list columns: columns to load. If None, all columns are loaded.
+    :return: (*pandas.DataFrame*) -- the profile.
+    :raises FileNotFoundError: if the csv file does not exist.
+    :raises KeyError: if some of the requested columns are not in the profile.
+    """
+    view = _read_profile_view(filepath)
+    if columns is not None:
+        view = view.select(columns)
+    return view.to_frame()
+
+
+def get_bus_demand(scenario_info, grid, start=None, end=None):
+    """Returns demand profiles by bus. Only the requested time window of the demand
+    profile is read.
 
     :param dict scenario_info: scenario information.
     :param powersimdata.input.grid.Grid grid: grid to construct bus demand for.
+    :param start: first timestamp, included. Defaults to the first one.
+    :param end: last timestamp, included. Defaults to the last one.
     :return: (*pandas.DataFrame*) -- data frame of demand.
     """
     bus = grid.bus.copy()
-    demand = InputData().get_data(scenario_info, "demand")[bus.zone_id.unique()]
+    demand = InputData().get_profile_view(scenario_info, "demand")
+    demand = demand.select(bus.zone_id.unique()).window(start, end).to_frame()
     bus["zone_Pd"] = bus.groupby("zone_id")["Pd"].transform("sum")
     bus["zone_share"] = bus["Pd"] / bus["zone_Pd"]
     zone_bus_shares = pd.DataFrame(
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+
+class ProfileView:
+    """Lazy view of a raw profile. Selecting, renaming, scaling and concatenating
+    columns only manipulate column positions and scaling factors, the values are
+    computed when a dense data frame is requested.
+
+    :param numpy.ndarray data: raw profile values (hour, column), typically a
+        read-only memory-mapped array.
+    :param pandas.DatetimeIndex index: timestamps of the rows.
+    :param iterable columns: labels of the columns of the raw profile.
+    """
+
+    #: number of columns computed at once when building a dense array.
+    block_size = 256
+
+    def __init__(self, data, index, columns):
+        """Constructor."""
+        if data.ndim != 2 or data.shape != (len(index), len(columns)):
+            raise ValueError("data must be a 2D array matching index and columns")
+        self._data = data
+        self.index = index
+        self.columns = pd.Index(columns)
+        self._rows = slice(0, len(self.index))
+        self._position = np.arange(len(self.columns))
+        self._factor = np.ones(len(self.columns))
+
+    def _new(self, columns, position, factor):
+        """Creates a view sharing the same raw data.
+
+        :param pandas.Index columns: labels of the columns of the view.
+        :param numpy.ndarray position: column positions in the raw data.
+        :param numpy.ndarray factor: scaling factor of each column.
+        :return: (*ProfileView*) -- new view.
+        """
+        view = object.__new__(ProfileView)
+        view._data = self._data
+        view.index = self.index
+        view._rows = self._rows
+        view.columns = columns
+        view._position = position
+        view._factor = factor
+        return view
+
+    @property
+    def shape(self):
+        """Shape of the dense profile.
+
+        :return: (*tuple*) -- number of rows and columns.
+        """
+        return len(self.index), len(self.columns)
+
+    @property
+    def dtype(self):
+        """Data type of the raw profile.
+
+        :return: (*numpy.dtype*) -- data type.
+        """
+        return self._data.dtype
+
+    def select(self, columns):
+        """Selects columns.
+
+        :param iterable columns: labels of the columns to keep, in order.
+        :return: (*ProfileView*) -- new view.
+        :raises KeyError: if some columns are not in the view.
+        """
+        columns = pd.Index(columns)
+        loc = self.columns.get_indexer(columns)
+        if (loc == -1).any():
+            raise KeyError(f"{list(columns[loc == -1])} not in profile")
+        return self._new(columns, self._position[loc], self._factor[loc])
+
+    def window(self, start=None, end=None):
+        """Selects rows in a time window.
+
+        :param start: first timestamp, included. Defaults to the first row.
+        :param end: last timestamp, included. Defaults to the last row.
+        :return: (*ProfileView*) -- new view.
+        """
+        first, last, _ = self.index.slice_indexer(start, end).indices(len(self.index))
+        last = max(first, last)
+        view = self._new(self.columns, self._position, self._factor)
+        view.index = self.index[first:last]
+        view._rows = slice(self._rows.start + first, self._rows.start + last)
+        return view
+
+    def rename(self, columns):
+        """Relabels columns.
+
+        :param iterable columns: new labels, one per column.
+        :return: (*ProfileView*) -- new view.
+        :raises ValueError: if the number of labels does not match.
+        """
+        columns = pd.Index(columns)
+        if len(columns) != len(self.columns):
+            raise ValueError("number of labels must match number of columns")
+        return self._new(columns, self._position, self._factor)
+
+    def scale(self, factor):
+        """Scales columns.
+
+        :param float/iterable/pandas.Series factor: scaling factor, either a scalar,
+            one value per column or a series indexed by column labels.
+        :return: (*ProfileView*) -- new view.
+        """
+        if isinstance(factor, pd.Series):
+            factor = factor.loc[self.columns].to_numpy()
+        factor = np.broadcast_to(np.asarray(factor, dtype=float), self._factor.shape)
+        return self._new(self.columns, self._position, self._factor * factor)
+
+    def concat(self, other):
+        """Appends the columns of another view built on the same raw profile.
+
+        :param ProfileView other: view to append.
+        :return: (*ProfileView*) -- new view.
+        :raises ValueError: if the views do not share the same raw profile and rows.
+        """
+        if other._data is not self._data or other._rows != self._rows:
+            raise ValueError("views must share the same raw profile and rows")
+        if len(other.columns) == 0:
+            return self
+        return self._new(
+            self.columns.append(other.columns),
+            np.concatenate([self._position, other._position]),
+            np.concatenate([self._factor, other._factor]),
+        )
+
+    def to_numpy(self, dtype=None):
+        """Computes the dense values of the view, block of columns by block of
+        columns, so that no more than one copy of the raw data is made.
+
+        :param numpy.dtype dtype: data type of the result. Defaults to the data type
+            of the raw profile.
+        :return: (*numpy.ndarray*) -- dense values (hour, column).
+        """
+        dtype = self.dtype if dtype is None else np.dtype(dtype)
+        out = np.empty(self.shape, dtype=dtype, order="F")
+        for start in range(0, len(self.columns), self.block_size):
+            block = slice(start, start + self.block_size)
+            np.multiply(
+                self._data[self._rows, self._position[block]],
+                self._factor[block],
+                out=out[:, block],
+                casting="unsafe",
+            )
+        return out
+
+    def to_frame(self, dtype=None):
+        """Computes the dense profile.
+
+        :param numpy.dtype dtype: data type of the result. Defaults to the data type
+            of the raw profile.
+        :return: (*pandas.DataFrame*) -- profile with column labels as columns and
+            timestamps as indices.
+        """
+        return pd.DataFrame(
+            self.to_numpy(dtype), index=self.index, columns=self.columns, copy=False
+        )
@@ -249,48 +249,60 @@ def column_type_provider():
 
 
 def format_gencost(data):
-    """Modify generation cost data frame.
+    """Modify generation cost data frame. Coefficients of polynomial (type 2) and
+    piecewise linear (type 1) cost curves are gathered for all rows at once.
 
     :param pandas.DataFrame data: generation cost data frame.
     :return: (pandas.DataFrame) -- formatted gencost data frame.
     """
+    values = data.to_numpy(dtype=float)
+    model = values[:, 0]
+    n = values[:, 3].astype(int)
 
-    def parse_gencost_row(row):
-        n = int(row["n"])
-        index = id2row[row.name]
-        if row["type"] == 2:
-            for c in range(n):
-                row["c" + str(n - c - 1)] = data.iloc[index, 4 + c]
-        if row["type"] == 1:
-            for c in range(n):
-                p_val = data.iloc[index, 4 + 2 * c]
-                f_val = data.iloc[index, 4 + 2 * c + 1]
-                row["p" + str(c + 1)] = p_val
-                row["f" + str(c + 1)] = f_val
-        return row
-
-    gencost = data.iloc[:, [0, 1, 2, 3]].copy()
-    gencost.rename(
-        columns={0: "type", 1: "startup", 2: "shutdown", 3: "n"}, inplace=True
-    )
-
-    if 2 in gencost.type.unique():
-        n_max = int(gencost.groupby("type").get_group(2).n.max())
-        for i in range(n_max):
-            gencost["c" + str(n_max - i - 1)] = [0.0] * gencost.shape[0]
-    if 1 in gencost.type.unique():
-        n_max = int(gencost.groupby("type").get_group(1).n.max())
-        for i in range(n_max):
-            gencost["p" + str(i + 1)] = [0.0] * gencost.shape[0]
-            gencost["f" + str(i + 1)] = [0.0] * gencost.shape[0]
-
-    id2row = {plant_id: row for row, plant_id in enumerate(gencost.index)}
-    gencost = gencost.apply(parse_gencost_row, axis=1)
+    columns = {
+        name: values[:, i]
+        for i, name in enumerate(["type", "startup", "shutdown", "n"])
+    }
+    if (model == 2).any():
+        n_max = n[model == 2].max()
+        order = np.arange(n_max - 1, -1, -1)
+        coefficient = _gather(values, model == 2, n, order, 4 + n[:, None] - 1 - order)
+        for i, c in enumerate(order):
+            columns[f"c{c}"] = coefficient[:, i]
+    if (model == 1).any():
+        n_max = n[model == 1].max()
+        point = np.arange(n_max)
+        p = _gather(values, model == 1, n, point, 4 + 2 * point[None, :])
+        f = _gather(values, model == 1, n, point, 5 + 2 * point[None, :])
+        for i in point:
+            columns[f"p{i + 1}"] = p[:, i]
+            columns[f"f{i + 1}"] = f[:, i]
+
+    gencost = pd.DataFrame(columns, index=data.index)
     gencost = gencost.astype({"type": "int", "n": "int"})
 
     return gencost
 
 
+def _gather(values, rows, n, rank, position):
+    """Gathers values of selected rows in a 2D array, filling with zeros.
+
+    :param numpy.ndarray values: 2D array.
+    :param numpy.ndarray rows: boolean mask of the rows to gather from.
+    :param numpy.ndarray n: number of values to gather in each row.
+    :param numpy.ndarray rank: rank of each output column. Values are gathered in
+        the output columns of rank lower than n.
+    :param numpy.ndarray position: column of the values to gather, for each row and
+        output column.
+    :return: (*numpy.ndarray*) -- gathered values.
+    """
+    out = np.zeros((values.shape[0], len(rank)))
+    mask = rows[:, None] & (rank[None, :] < n[:, None])
+    i, j = np.nonzero(mask)
+    out[i, j] = values[i, np.broadcast_to(position, mask.shape)[i, j]]
+    return out
+
+
 def add_information_to_model(grid):
     """Makes a standard grid.
 
@@ -8,11 +8,13 @@ from powersimdata import Grid
 from powersimdata.input.check import (
     _check_areas_and_format,
     _check_areas_are_in_grid_and_format,
+    _check_connected_components,
     _check_data_frame,
     _check_date,
     _check_date_range_in_scenario,
     _check_date_range_in_time_series,
     _check_epsilon,
+    _check_for_islanded_buses,
     _check_gencost,
     _check_grid_models_match,
     _check_grid_type,
@@ -24,6 +26,7 @@ from powersimdata.input.check import (
     _check_time_series,
     check_grid,
 )
+from powersimdata.tests.mock_grid import MockGrid
 from powersimdata.tests.mock_scenario import MockScenario
 
 
@@ -448,3 +451,71 @@ def test_check_gencost_argument_value(mock_grid):
 def test_check_gencost(mock_grid):
     gencost = mock_grid.gencost["after"]
     _check_gencost(gencost)
+
+
+@pytest.fixture
+def islanded_grid():
+    grid = MockGrid(
+        {
+            "bus": {"bus_id": list(range(1, 9)), "interconnect": ["Western"] * 8},
+            "branch": {
+                "branch_id": [101, 102, 103, 104],
+                "from_bus_id": [1, 2, 5, 6],
+                "to_bus_id": [2, 3, 6, 7],
+            },
+            "dcline": {"dcline_id": [0], "from_bus_id": [3], "to_bus_id": [4]},
+        }
+    )
+    grid.interconnect = ["Western"]
+    return grid
+
+
+def test_check_for_islanded_buses(islanded_grid):
+    error_messages = []
+    _check_for_islanded_buses(islanded_grid, error_messages)
+    assert error_messages == [
+        "islanded buses detected in 2 component(s): Western: [5, 6, 7]; Western: [8]."
+    ]
+
+
+def test_check_for_islanded_buses_connected(islanded_grid):
+    islanded_grid.bus = islanded_grid.bus.drop(index=[5, 6, 7, 8])
+    islanded_grid.branch = islanded_grid.branch.drop(index=[103, 104])
+    error_messages = []
+    _check_for_islanded_buses(islanded_grid, error_messages)
+    assert error_messages == []
+
+
+def test_check_for_islanded_buses_dc_tie():
+    grid = MockGrid(
+        {
+            "bus": {
+                "bus_id": [1, 2, 3, 4, 5, 6],
+                "interconnect": ["Western"] * 3 + ["Texas"] * 3,
+            },
+            "branch": {
+                "branch_id": [101, 102, 103],
+                "from_bus_id": [1, 4, 5],
+                "to_bus_id": [2, 5, 6],
+            },
+            "dcline": {"dcline_id": [0], "from_bus_id": [3], "to_bus_id": [6]},
+        }
+    )
+    error_messages = []
+    _check_for_islanded_buses(grid, error_messages)
+    assert error_messages == []
+
+    grid.dcline = grid.dcline.drop(index=[0])
+    _check_for_islanded_buses(grid, error_messages)
+    assert error_messages == [
+        "islanded buses detected in 1 component(s): Western: [3]."
+    ]
+
+
+def test_check_connected_components(islanded_grid):
+    error_messages = []
+    _check_connected_components(islanded_grid, error_messages)
+    assert error_messages == [
+        "This grid contains 2 connected components, but is specified as having 1 "
+        "interconnects: ['Western']."
+    ]
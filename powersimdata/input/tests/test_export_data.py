@@ -0,0 +1,177 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.io import loadmat
+
+from powersimdata.input import export_data
+from powersimdata.input.abstract_grid import storage_template
+from powersimdata.input.export_data import (
+    export_case_mat,
+    export_transformed_profile,
+)
+from powersimdata.input.profile_view import ProfileView
+from powersimdata.tests.mock_grid import MockGrid
+
+mock_plant = {
+    "plant_id": [101, 102, 103],
+    "bus_id": [1, 2, 2],
+    "Pg": [10.0, 20.0, 0.0],
+    "Pmax": [50.0, 100.0, 30.0],
+    "type": ["coal", "ng", "solar"],
+    "interconnect": ["Texas"] * 3,
+    "lat": [30.0, 31.0, 32.0],
+    "lon": [-97.0, -98.0, -99.0],
+    "zone_id": [301, 301, 302],
+    "zone_name": ["Far West", "Far West", "North"],
+    "GenFuelCost": [2.0, 3.0, 0.0],
+    "GenIOB": [10.0, 8.0, 0.0],
+    "GenIOC": [0.1, 0.2, 0.0],
+    "GenIOD": [0.0, 0.0, 0.0],
+}
+
+mock_bus = {
+    "bus_id": [1, 2],
+    "type": [3, 1],
+    "Pd": [15.0, 25.0],
+    "zone_id": [301, 302],
+    "interconnect": ["Texas"] * 2,
+    "lat": [30.0, 31.0],
+    "lon": [-97.0, -98.0],
+}
+
+mock_branch = {
+    "branch_id": [11, 12],
+    "from_bus_id": [1, 2],
+    "to_bus_id": [2, 1],
+    "x": [0.1, 0.2],
+    "rateA": [100.0, 200.0],
+    "branch_device_type": ["Line", "Transformer"],
+    "interconnect": ["Texas"] * 2,
+    "from_lat": [30.0, 31.0],
+    "from_lon": [-97.0, -98.0],
+    "to_lat": [31.0, 30.0],
+    "to_lon": [-98.0, -97.0],
+    "from_zone_id": [301, 302],
+    "to_zone_id": [302, 301],
+    "from_zone_name": ["Far West", "North"],
+    "to_zone_name": ["North", "Far West"],
+}
+
+mock_gencost = {
+    "plant_id": [101, 102, 103],
+    "type": [2, 2, 2],
+    "n": [3, 3, 3],
+    "c2": [0.1, 0.2, 0.0],
+    "c1": [10.0, 20.0, 0.0],
+    "c0": [100.0, 200.0, 0.0],
+    "interconnect": ["Texas"] * 3,
+}
+
+
+@pytest.fixture
+def grid():
+    grid = MockGrid(
+        {
+            "plant": mock_plant,
+            "bus": mock_bus,
+            "sub": {"sub_id": [7], "interconnect_sub_id": [1], "lat": [30.0]},
+            "bus2sub": {"bus_id": [1, 2], "sub_id": [7, 7]},
+            "branch": mock_branch,
+            "dcline": {
+                "dcline_id": [0],
+                "from_bus_id": [1],
+                "to_bus_id": [2],
+                "Pmax": [50.0],
+                "from_interconnect": ["Texas"],
+                "to_interconnect": ["Texas"],
+            },
+            "gencost_before": mock_gencost,
+        }
+    )
+    grid.id2zone = {301: "Far West", 302: "North"}
+    grid.storage = storage_template()
+    grid.storage["gen"] = pd.DataFrame({c: [1, 2] for c in grid.storage["gen"]})
+    grid.storage["StorageData"] = pd.DataFrame(
+        {c: [1.0, 2.0] for c in grid.storage["StorageData"]}
+    )
+    return grid
+
+
+def test_export_case_mat(grid, tmp_path):
+    filepath = os.path.join(tmp_path, "case.mat")
+    storage_filepath = os.path.join(tmp_path, "case_storage.mat")
+    timings = export_case_mat(grid, filepath, storage_filepath)
+    assert {"bus", "plant", "branch", "storage", "write"} <= set(timings)
+
+    mpc = loadmat(filepath, squeeze_me=True)["mpc"]
+    plant = pd.DataFrame(mock_plant)
+    expected = plant.drop(
+        columns=["plant_id", "type", "interconnect", "lat", "lon", "zone_id"]
+        + ["zone_name", "GenFuelCost", "GenIOB", "GenIOC", "GenIOD"]
+    )
+    np.testing.assert_array_equal(mpc["gen"].item(), expected.to_numpy())
+    np.testing.assert_array_equal(mpc["genid"].item(), plant["plant_id"])
+    assert list(mpc["genfuel"].item()) == mock_plant["type"]
+    np.testing.assert_array_equal(
+        mpc["heatratecurve"].item(), plant[["GenIOB", "GenIOC", "GenIOD"]]
+    )
+    np.testing.assert_array_equal(
+        mpc["bus"].item(), pd.DataFrame(mock_bus)[["bus_id", "type", "Pd", "zone_id"]]
+    )
+    np.testing.assert_array_equal(
+        mpc["branch"].item(), [[1, 2, 0.1, 100.0], [2, 1, 0.2, 200.0]]
+    )
+    assert list(mpc["branchdevicetype"].item()) == ["Line", "Transformer"]
+    np.testing.assert_array_equal(
+        mpc["gencost"].item(),
+        grid.gencost["before"].drop(columns="interconnect").to_numpy(),
+    )
+    np.testing.assert_array_equal(mpc["dcline"].item(), [1, 2, 50.0])
+
+    storage = loadmat(storage_filepath, squeeze_me=True)["storage"]
+    assert storage["gen"].item().dtype == np.float64
+    np.testing.assert_array_equal(
+        storage["sd_table"].item()["data"].item(),
+        grid.storage["StorageData"].to_numpy(),
+    )
+
+
+def test_export_case_mat_compression(grid, tmp_path):
+    filepath = os.path.join(tmp_path, "case.mat")
+    compressed_filepath = os.path.join(tmp_path, "case_compressed.mat")
+    storage_filepath = os.path.join(tmp_path, "case_storage.mat")
+    export_case_mat(grid, filepath, storage_filepath)
+    export_case_mat(grid, compressed_filepath, storage_filepath, do_compression=True)
+    assert os.path.getsize(compressed_filepath) < os.path.getsize(filepath)
+    mpc = loadmat(filepath)["mpc"]
+    compressed_mpc = loadmat(compressed_filepath)["mpc"]
+    for name in ["bus", "gen", "branch", "gencost", "dcline"]:
+        np.testing.assert_array_equal(mpc[name][0, 0], compressed_mpc[name][0, 0])
+
+
+@pytest.fixture
+def profile(monkeypatch):
+    index = pd.date_range("2016-01-01", periods=10, freq="H", name="UTC")
+    data = np.arange(30, dtype=float).reshape(10, 3) / 7
+    view = ProfileView(data, index, [101, 102, 103]).scale([1.0, 2.0, 0.5])
+
+    class FakeTransformProfile:
+        def __init__(self, scenario_info, grid, ct):
+            pass
+
+        def get_profile_view(self, name):
+            return view
+
+    monkeypatch.setattr(export_data, "TransformProfile", FakeTransformProfile)
+    return view.to_frame()
+
+
+def test_export_transformed_profile_csv(profile, tmp_path):
+    expected = os.path.join(tmp_path, "expected.csv")
+    profile.to_csv(expected)
+    filepath = os.path.join(tmp_path, "solar.csv")
+    export_transformed_profile("solar", {}, None, {}, filepath, chunk_size=3)
+    with open(filepath) as f, open(expected) as g:
+        assert f.read() == g.read()
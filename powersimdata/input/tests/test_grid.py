@@ -1,12 +1,18 @@
 import copy
+import os
+from types import SimpleNamespace
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from powersimdata.input import grid as grid_module
 from powersimdata.input.grid import Grid
 from powersimdata.input.helpers import add_column_to_data_frame
 from powersimdata.input.scenario_grid import format_gencost, link
+from powersimdata.input.transform_grid import TransformGrid
+from powersimdata.tests.mock_grid import MockGrid
+from powersimdata.utility.helpers import DiskCache, MemoryCache
 
 INCORRECT_SOURCE = "invalid_source"
 INCORRECT_ENGINE = "invalid_engine"
@@ -417,3 +423,141 @@ def test_that_fields_are_not_modified_when_loading_another_grid():
     western_plant_original_shape = western_grid.plant.shape
     Grid(["Eastern"])
     assert western_plant_original_shape == western_grid.plant.shape
+
+
+def _build_grid(tmp_path, monkeypatch, mock_grid):
+    data = SimpleNamespace(**vars(mock_grid))
+    data.data_loc = str(tmp_path / "usa_tamu" / "data")
+    os.makedirs(data.data_loc)
+    builds = []
+
+    def build(interconnect):
+        builds.append(interconnect)
+        return data
+
+    monkeypatch.setattr(grid_module, "_cache", MemoryCache())
+    monkeypatch.setattr(grid_module, "_disk_cache", DiskCache(str(tmp_path)))
+    monkeypatch.setattr(grid_module, "_get_disk_cache_key", lambda *args: args)
+    monkeypatch.setattr(grid_module, "TAMU", build)
+    grid = Grid(["Texas"])
+    assert len(builds) == 1
+    return grid
+
+
+@pytest.fixture
+def shared_grid(tmp_path, monkeypatch):
+    mock_grid = MockGrid(
+        {
+            "plant": {"plant_id": [1, 2], "Pmax": [10.0, 20.0]},
+            "bus": {"bus_id": [1, 2], "Pd": [1.0, 2.0]},
+        }
+    )
+    return _build_grid(tmp_path, monkeypatch, mock_grid)
+
+
+def test_grid_tables_are_copied_when_accessed(shared_grid):
+    other = Grid(["Texas"])
+    assert "plant" not in other._tables
+    shared_grid.plant.loc[1, "Pmax"] = 0
+    assert other.plant.loc[1, "Pmax"] == 10
+    other.plant.loc[2, "Pmax"] = 0
+    assert shared_grid.plant.Pmax.tolist() == [0, 20]
+
+
+def test_grid_view_is_read_only(shared_grid):
+    view = shared_grid.view()
+    other = shared_grid.view()
+    assert np.shares_memory(view.plant.Pmax.values, other.plant.Pmax.values)
+    with pytest.raises(ValueError):
+        view.plant.loc[1, "Pmax"] = 0
+    view.plant["Pmax"] = 2 * view.plant["Pmax"]
+    view.bus = view.bus.drop(1)
+    assert shared_grid.plant.Pmax.tolist() == [10, 20]
+    assert shared_grid.bus.index.tolist() == [1, 2]
+    assert other.plant.Pmax.tolist() == [10, 20]
+
+
+def test_grid_view_after_modification(shared_grid):
+    shared_grid.plant.loc[1, "Pmax"] = 0
+    view = shared_grid.view()
+    shared_grid.plant.loc[2, "Pmax"] = 0
+    assert view.plant.Pmax.tolist() == [0, 20]
+
+
+def test_grid_mutable(shared_grid):
+    for grid in [shared_grid.view().mutable(), copy.deepcopy(shared_grid.view())]:
+        grid.plant.loc[1, "Pmax"] = 0
+        assert grid.plant.Pmax.tolist() == [0, 20]
+        assert not grid._read_only
+    assert shared_grid.plant.Pmax.tolist() == [10, 20]
+
+
+def test_grid_view_string_columns(shared_grid):
+    shared_grid.plant["type"] = ["solar", "wind"]
+    view = shared_grid.view()
+    assert (view.plant.type == "solar").tolist() == [True, False]
+    view.plant.loc[1, "type"] = "coal"
+    assert shared_grid.plant.type.tolist() == ["solar", "wind"]
+
+
+def test_transform_grid_add_branch(tmp_path, monkeypatch):
+    mock_grid = MockGrid(
+        {
+            "bus": {
+                "bus_id": [1, 2, 3],
+                "baseKV": [230.0] * 3,
+                "zone_id": [301] * 3,
+                "lat": [30.0, 30.0, 31.0],
+                "lon": [-97.0, -98.0, -97.0],
+                "interconnect": ["Texas"] * 3,
+            },
+            "branch": {
+                "branch_id": [1],
+                "from_bus_id": [1],
+                "to_bus_id": [2],
+                "x": [0.01],
+                "branch_device_type": ["Line"],
+                "from_lat": [30.0],
+                "from_lon": [-97.0],
+                "to_lat": [30.0],
+                "to_lon": [-98.0],
+            },
+        }
+    )
+    mock_grid.id2zone = {301: "Far West"}
+    grid = _build_grid(tmp_path, monkeypatch, mock_grid)
+    ct = {"new_branch": [{"from_bus_id": 1, "to_bus_id": 3, "Pmax": 100}]}
+    new_grid = TransformGrid(grid, ct).get_grid()
+    assert (new_grid.branch.branch_device_type == "Line").tolist() == [True, True]
+    assert new_grid.branch.loc[2, "rateA"] == 100
+    assert new_grid.branch.loc[2, "x"] > 0
+    assert len(grid.branch) == 1
+
+
+def test_grid_delete_table(shared_grid):
+    del shared_grid.plant
+    assert not hasattr(shared_grid, "plant")
+    assert not hasattr(shared_grid.view(), "plant")
+    shared_grid.plant = pd.DataFrame({"Pmax": [1.0]})
+    assert shared_grid.view().plant.Pmax.tolist() == [1.0]
+
+
+def test_grid_topology_reset_on_assignment(tmp_path, monkeypatch):
+    mock_grid = MockGrid(
+        {
+            "bus": {"bus_id": [1, 2, 3]},
+            "branch": {
+                "branch_id": [11, 12],
+                "from_bus_id": [1, 2],
+                "to_bus_id": [2, 3],
+            },
+            "plant": {"plant_id": [1], "bus_id": [1]},
+        }
+    )
+    grid = _build_grid(tmp_path, monkeypatch, mock_grid)
+    topology = grid.topology
+    assert grid.topology is topology
+    assert grid.view().topology.component.nunique() == 1
+    grid.branch = grid.branch.loc[[11]]
+    assert grid.topology is not topology
+    assert grid.topology.component.nunique() == 2
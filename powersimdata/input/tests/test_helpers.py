@@ -1,3 +1,4 @@
+import time
 import unittest
 
 import pandas as pd
@@ -6,6 +7,9 @@ from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from powersimdata.input.grid import Grid
 from powersimdata.input.helpers import (
+    add_coord_to_grid_data_frames,
+    add_interconnect_to_grid_data_frames,
+    add_zone_to_grid_data_frames,
     get_active_resources_in_grid,
     get_plant_id_for_resources,
     get_plant_id_for_resources_in_area,
@@ -375,3 +379,73 @@ def test_get_storage_id_in_area():
     for a, e in zip(arg, expected):
         storage_id = get_storage_id_in_area(*a)
         assert e == storage_id
+
+
+def _enrichment_grid():
+    grid = MockGrid(
+        {
+            "sub": {"sub_id": [10, 20], "lat": [47.6, 37.8], "lon": [-122.3, -122.4]},
+            "bus2sub": {
+                "bus_id": [1, 2, 3],
+                "sub_id": [20, 10, 20],
+                "interconnect": ["Western", "Eastern", "Western"],
+            },
+            "bus": {"bus_id": [3, 1, 2], "zone_id": [201, 202, 201]},
+            "plant": {"plant_id": ["A", "B"], "bus_id": [2, 3]},
+            "branch": {"branch_id": [5], "from_bus_id": [1], "to_bus_id": [2]},
+            "dcline": {"dcline_id": [0], "from_bus_id": [3], "to_bus_id": [2]},
+            "gencost_before": {"plant_id": ["A", "B"]},
+        }
+    )
+    grid.id2zone = {201: "Washington", 202: "Bay Area"}
+    return grid
+
+
+def test_add_information_to_grid_data_frames():
+    grid = _enrichment_grid()
+    add_interconnect_to_grid_data_frames(grid)
+    add_zone_to_grid_data_frames(grid)
+    add_coord_to_grid_data_frames(grid)
+
+    assert_array_equal(grid.bus.interconnect, ["Western", "Western", "Eastern"])
+    assert_array_equal(grid.bus.lat, [37.8, 37.8, 47.6])
+    assert_array_equal(grid.plant.interconnect, ["Eastern", "Western"])
+    assert_array_equal(grid.gencost["before"].interconnect, ["Eastern", "Western"])
+    assert_array_equal(grid.plant.zone_id, [201, 201])
+    assert_array_equal(grid.plant.zone_name, ["Washington", "Washington"])
+    assert_array_equal(grid.plant.lon, [-122.3, -122.4])
+    assert_array_equal(grid.branch.from_zone_name, ["Bay Area"])
+    assert_array_equal(grid.branch.to_lat, [47.6])
+    assert_array_equal(grid.dcline.from_interconnect, ["Western"])
+    assert_array_equal(grid.dcline.to_interconnect, ["Eastern"])
+
+
+def test_add_information_to_grid_data_frames_unknown_bus():
+    grid = _enrichment_grid()
+    grid.plant.loc["B", "bus_id"] = 4
+    with pytest.raises(KeyError):
+        add_zone_to_grid_data_frames(grid)
+
+
+@pytest.mark.integration
+def test_add_information_to_grid_data_frames_benchmark(record_property):
+    grid = Grid(["USA"]).mutable()
+
+    def add_zone_with_dict(grid):
+        bus2zone = grid.bus.zone_id.to_dict()
+        return {
+            "from_zone_name": [
+                grid.id2zone[bus2zone[i]] for i in grid.branch.from_bus_id
+            ],
+            "to_zone_name": [grid.id2zone[bus2zone[i]] for i in grid.branch.to_bus_id],
+        }
+
+    tic = time.perf_counter()
+    reference = add_zone_with_dict(grid)
+    record_property("dict_lookups_time", time.perf_counter() - tic)
+    tic = time.perf_counter()
+    add_zone_to_grid_data_frames(grid)
+    record_property("vectorized_time", time.perf_counter() - tic)
+
+    for c, values in reference.items():
+        assert_array_equal(grid.branch[c], values)
@@ -1,6 +1,24 @@
+import os
+
+import numpy as np
+import pandas as pd
 import pytest
+from pandas.testing import assert_frame_equal
 
-from powersimdata.input.input_data import InputHelper, _check_field
+from powersimdata.input import input_data as input_data_module
+from powersimdata.input.input_data import (
+    InputData,
+    InputHelper,
+    _check_field,
+    _get_profile_cache_dir,
+    _is_profile_cache_valid,
+    _read_profile,
+    _read_profile_view,
+    get_bus_demand,
+)
+from powersimdata.tests.mock_grid import MockGrid
+from powersimdata.utility import server_setup
+from powersimdata.utility.helpers import MemoryCache
 
 
 def test_get_file_components():
@@ -18,3 +36,82 @@ def test_check_field():
     with pytest.raises(ValueError):
         _check_field("foo")
         _check_field("coal")
+
+
+@pytest.fixture
+def profile_csv(tmp_path):
+    index = pd.date_range(start="2016-01-01", periods=24, freq="H", name="UTC")
+    profile = pd.DataFrame(
+        np.random.random((24, 5)), index=index, columns=[101, 102, 103, 104, 105]
+    )
+    filepath = str(tmp_path / "solar_vTest.csv")
+    profile.to_csv(filepath)
+    expected = pd.read_csv(filepath, index_col=0, parse_dates=True)
+    expected.columns = expected.columns.astype(int)
+    return filepath, expected
+
+
+def test_read_profile_builds_cache(profile_csv):
+    filepath, expected = profile_csv
+    cache_dir = _get_profile_cache_dir(filepath)
+    assert not _is_profile_cache_valid(filepath, cache_dir)
+    assert_frame_equal(_read_profile(filepath), expected)
+    assert _is_profile_cache_valid(filepath, cache_dir)
+    assert_frame_equal(_read_profile(filepath), expected)
+
+
+def test_read_profile_column_projection(profile_csv):
+    filepath, expected = profile_csv
+    _read_profile(filepath)
+    projected = _read_profile(filepath, columns=[104, 101])
+    assert_frame_equal(projected, expected[[104, 101]])
+    with pytest.raises(KeyError):
+        _read_profile(filepath, columns=[101, 999])
+
+
+def test_profile_cache_invalidated_when_csv_changes(profile_csv):
+    filepath, expected = profile_csv
+    _read_profile(filepath)
+    expected *= 2
+    expected.to_csv(filepath)
+    assert not _is_profile_cache_valid(filepath, _get_profile_cache_dir(filepath))
+    assert_frame_equal(_read_profile(filepath), expected)
+
+
+def test_get_bus_demand(profile_csv, monkeypatch):
+    filepath, expected = profile_csv
+    monkeypatch.setattr(
+        InputData, "__init__", lambda self, data_loc=None: None, raising=True
+    )
+    monkeypatch.setattr(
+        InputData,
+        "get_profile_view",
+        lambda self, scenario_info, field_name: _read_profile_view(filepath),
+    )
+    grid = MockGrid(
+        {"bus": {"bus_id": [1, 2, 3], "zone_id": [101, 101, 102], "Pd": [1, 3, 2]}}
+    )
+    start, end = expected.index[[5, 10]]
+    bus_demand = get_bus_demand({}, grid, start=start, end=end)
+    assert bus_demand.index.equals(expected.index[5:11])
+    assert bus_demand.columns.tolist() == [1, 2, 3]
+    np.testing.assert_allclose(bus_demand[1], expected[101].iloc[5:11] * 0.25)
+    np.testing.assert_allclose(bus_demand[2], expected[101].iloc[5:11] * 0.75)
+    np.testing.assert_allclose(bus_demand[3], expected[102].iloc[5:11])
+
+
+def test_get_data_returns_cached_profile(profile_csv, monkeypatch):
+    filepath, expected = profile_csv
+    monkeypatch.setattr(server_setup, "LOCAL_DIR", os.path.dirname(filepath))
+    monkeypatch.setattr(input_data_module, "_cache", MemoryCache())
+    monkeypatch.setattr(
+        input_data_module.ProfileHelper,
+        "get_file_components",
+        lambda scenario_info, field_name: (os.path.basename(filepath), ()),
+    )
+    monkeypatch.setattr(InputData, "__init__", lambda self, data_loc=None: None)
+    profile = InputData().get_data({}, "solar")
+    assert_frame_equal(profile, expected, check_freq=False)
+    with pytest.raises(ValueError):
+        profile.iloc[0, 0] = 42
+    assert_frame_equal(InputData().get_data({}, "solar"), profile)
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from powersimdata.input.profile_view import ProfileView
+
+
+@pytest.fixture
+def raw():
+    index = pd.date_range(start="2016-01-01", periods=24, freq="H", name="UTC")
+    data = np.asfortranarray(np.random.random((24, 4)))
+    return pd.DataFrame(data, index=index, columns=[11, 12, 13, 14])
+
+
+@pytest.fixture
+def view(raw):
+    return ProfileView(raw.to_numpy(), raw.index, raw.columns)
+
+
+def test_to_frame(raw, view):
+    assert view.shape == (24, 4)
+    assert_frame_equal(view.to_frame(), raw)
+
+
+def test_select_and_scale(raw, view):
+    factor = [2.0, 0.5]
+    profile = view.select([14, 12]).scale(factor).to_frame()
+    assert_frame_equal(profile, raw[[14, 12]] * factor)
+    with pytest.raises(KeyError):
+        view.select([11, 99])
+
+
+def test_scale_with_series(raw, view):
+    factor = pd.Series({11: 1.0, 12: 2.0, 13: 3.0, 14: 4.0})
+    assert_frame_equal(view.scale(factor).to_frame(), raw * factor)
+
+
+def test_rename_and_concat(raw, view):
+    pmax = raw.columns.to_series() * 10
+    scaled = view.scale(pmax)
+    new = view.select([12, 12]).rename([15, 16]).scale([3.0, 5.0])
+    profile = scaled.concat(new).to_frame()
+
+    expected = (raw * pmax).join(
+        pd.DataFrame({15: raw[12] * 3.0, 16: raw[12] * 5.0}, index=raw.index)
+    )
+    assert_frame_equal(profile, expected)
+
+
+def test_concat_empty(view):
+    assert view.concat(view.select([])) is view
+
+
+def test_concat_different_data(raw, view):
+    other = ProfileView(raw.to_numpy().copy(), raw.index, raw.columns)
+    with pytest.raises(ValueError):
+        view.concat(other)
+
+
+def test_to_frame_in_blocks(raw, view):
+    view.block_size = 3
+    assert_frame_equal(
+        view.scale(2).to_frame(dtype="float32"), (raw * 2).astype("float32")
+    )
+
+
+def test_view_does_not_copy(raw, view):
+    assert view.select([11]).scale(2)._data is view._data
+
+
+def test_window(raw, view):
+    start, end = "2016-01-01 05:00", "2016-01-01 10:00"
+    profile = view.select([13, 11]).scale(2.0).window(start, end)
+    assert profile.shape == (6, 2)
+    assert_frame_equal(profile.to_frame(), raw.loc[start:end, [13, 11]] * 2.0)
+    assert_frame_equal(
+        profile.window(end="2016-01-01 06:00").to_frame(),
+        raw.loc[start:"2016-01-01 06:00", [13, 11]] * 2.0,
+    )
+    assert view.window("2016-01-02").shape == (0, 4)
+
+
+def test_concat_different_window(view):
+    with pytest.raises(ValueError):
+        view.window(end="2016-01-01 05:00").concat(view)
@@ -0,0 +1,90 @@
+import pytest
+
+from powersimdata.input.topology import Topology, get_topology
+from powersimdata.tests.mock_grid import MockGrid
+
+"""
+Buses 1-2-3-4 form a ring, bus 5 is a spur of bus 2, buses 6-7 a spur of bus 4 and
+buses 8-9 are connected to each other and to the ring by a DC line only. Bus 10 is
+islanded.
+"""
+
+
+@pytest.fixture
+def grid():
+    return MockGrid(
+        {
+            "bus": {"bus_id": list(range(1, 11))},
+            "bus2sub": {"bus_id": list(range(1, 11)), "sub_id": [1] * 5 + [2] * 5},
+            "branch": {
+                "branch_id": [101, 102, 103, 104, 105, 106, 107, 108],
+                "from_bus_id": [1, 2, 3, 4, 2, 4, 6, 8],
+                "to_bus_id": [2, 3, 4, 1, 5, 6, 7, 9],
+            },
+            "dcline": {"dcline_id": [0], "from_bus_id": [3], "to_bus_id": [8]},
+            "plant": {"plant_id": ["A", "B", "C"], "bus_id": [5, 7, 5]},
+        }
+    )
+
+
+def test_topology_queries(grid):
+    topology = get_topology(grid)
+    assert set(topology.branches_at(2)) == {101, 102, 105}
+    assert set(topology.branches_at(10)) == set()
+    assert set(topology.plants_at(5)) == {"A", "C"}
+    assert set(topology.plants_at(1)) == set()
+    assert topology.sub_at(7) == 2
+    assert topology.degree.loc[[1, 5, 10]].tolist() == [2, 1, 0]
+    with pytest.raises(KeyError):
+        topology.branches_at(11)
+
+
+def test_topology_components(grid):
+    topology = get_topology(grid)
+    assert topology.connected.loc[[8, 10]].tolist() == [True, False]
+    component = topology.component
+    assert component.loc[1] == component.loc[7] != component.loc[8] == component.loc[9]
+    assert topology.n_components == 3
+    network_component = topology.network_component
+    assert network_component.loc[1] == network_component.loc[9]
+    assert network_component.loc[10] != network_component.loc[1]
+
+
+def test_topology_stub_branches(grid):
+    stubs = get_topology(grid).stub_branches().sort_values(["bus_id", "branch_id"])
+    assert stubs["bus_id"].tolist() == [5, 7, 7, 8, 9]
+    assert stubs["branch_id"].tolist() == [105, 106, 107, 108, 108]
+    assert stubs["stub_degree"].tolist() == [1, 2, 2, 1, 1]
+
+
+def test_topology_from_branch_only(grid):
+    topology = Topology(grid.branch)
+    assert set(topology.branches_at(4)) == {103, 104, 106}
+    assert 10 not in topology.bus_id
+
+
+def test_get_topology_is_cached(grid):
+    topology = get_topology(grid)
+    assert get_topology(grid) is topology
+    grid.plant.loc["B", "Pmax"] = 10
+    assert get_topology(grid) is topology
+
+    branch = grid.branch.copy()
+    branch.loc[108, "to_bus_id"] = 7
+    grid.branch = branch
+    updated = get_topology(grid)
+    assert updated is not topology
+    assert set(updated.branches_at(7)) == {107, 108}
+
+
+def test_get_topology_rows_dropped_in_place(grid):
+    topology = get_topology(grid)
+    grid.branch.drop(index=[108], inplace=True)
+    updated = get_topology(grid)
+    assert updated is not topology
+    assert 108 not in updated.branch_id
+
+    grid.branch.loc[107, "to_bus_id"] = 8
+    assert get_topology(grid) is updated
+    del grid._topology
+    assert set(get_topology(grid).branches_at(8)) == {107}
@@ -133,6 +133,27 @@ def test_scale_gen_one_plant(ct):
         assert new_c2.loc[plant_id] == c2.loc[plant_id] / factor
 
 
+def test_scale_gen_by_zone_and_by_id(ct):
+    zone_id = grid.zone2id["Washington"]
+    plant_id = get_plant_id(zone_id, "ng")
+    ct.scale_plant_capacity("ng", zone_name={"Washington": 2})
+    ct.scale_plant_capacity("ng", plant_id={plant_id[0]: 0.5, plant_id[1]: 0})
+    new_grid = TransformGrid(grid, ct.ct).get_grid()
+
+    pmax = grid.plant.Pmax
+    new_pmax = new_grid.plant.Pmax
+    c2 = grid.gencost["before"].c2
+    new_c2 = new_grid.gencost["before"].c2
+
+    assert new_pmax.loc[plant_id[0]] == pmax.loc[plant_id[0]]
+    assert new_pmax.loc[plant_id[1]] == 0
+    assert new_pmax.loc[plant_id[2:]].equals(2 * pmax.loc[plant_id[2:]])
+    assert new_c2.loc[plant_id[0]] == c2.loc[plant_id[0]]
+    assert new_c2.loc[plant_id[1]] == c2.loc[plant_id[1]] / 2
+    other = grid.plant.index.difference(plant_id)
+    assert new_pmax.loc[other].equals(pmax.loc[other])
+
+
 def test_scale_gencost_one_plant(ct):
     # This must be the plant ID of a non-zero-cost resource
     plant_id = 3000
@@ -527,6 +548,10 @@ def test_add_storage(ct):
     assert new_grid.storage["gen"].shape[0] != grid.storage["gen"].shape[0]
     assert np.array_equal(pmin, -1 * np.array([d["capacity"] for d in storage]))
     assert np.array_equal(pmax, np.array([d["capacity"] for d in storage]))
+    assert new_grid.storage["gen"].bus_id.dtype == np.int64
+    assert new_grid.storage["gen"].status.dtype == np.int64
+    assert new_grid.storage["StorageData"].UnitIdx.dtype == np.int64
+    assert new_grid.storage["genfuel"] == ["ess"] * len(storage)
 
 
 def test_add_bus(ct):
@@ -560,6 +585,20 @@ def test_add_bus(ct):
     assert new_grid.sub.index.dtype == grid.sub.index.dtype
 
 
+def test_add_bus_interconnect_without_sub(ct):
+    no_sub_grid = grid.mutable()
+    no_sub_grid.sub = no_sub_grid.sub.query("interconnect != 'Texas'")
+    ct.ct["new_bus"] = [
+        {"lat": 30.5, "lon": -101.5, "zone_id": 301, "Pd": 0, "baseKV": 345},
+        {"lat": 31.5, "lon": -101.5, "zone_id": 301, "Pd": 0, "baseKV": 345},
+    ]
+    new_grid = TransformGrid(no_sub_grid, ct.ct).get_grid()
+    new_sub = new_grid.sub.query("interconnect == 'Texas'")
+    assert new_sub.interconnect_sub_id.tolist() == [1, 2]
+    new_bus_id = new_grid.bus.index[-2:]
+    assert new_grid.bus2sub.loc[new_bus_id, "sub_id"].tolist() == new_sub.index.tolist()
+
+
 def test_remove_branch(ct):
     assert 0 in grid.branch.index
     ct.ct["remove_branch"] = {0}
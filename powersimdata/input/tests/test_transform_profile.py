@@ -7,6 +7,7 @@ from powersimdata.input.grid import Grid
 from powersimdata.input.input_data import InputData
 from powersimdata.input.transform_grid import TransformGrid
 from powersimdata.input.transform_profile import TransformProfile
+from powersimdata.tests.mock_grid import MockGrid
 
 interconnect = ["Western"]
 param = {
@@ -351,3 +352,33 @@ def test_new_wind_profile(base_grid, raw_wind):
 
 def test_new_hydro_profile(base_grid, raw_hydro):
     _check_profile_of_new_plants_are_produced_correctly(base_grid, *raw_hydro, "hydro")
+
+
+def test_profile_key():
+    grid = MockGrid(
+        {
+            "plant": {
+                "plant_id": [1, 2, 3, 4],
+                "type": ["solar", "wind", "solar", "solar"],
+                "Pmax": [10.0, 20.0, 30.0, 40.0],
+            },
+            "bus": {"bus_id": [1, 2], "zone_id": [301, 302]},
+        }
+    )
+    info = {"grid_model": "usa_tamu", "base_solar": "v1", "base_demand": "v1"}
+    ct = {"new_plant": [{"type": "solar", "plant_id_neighbor": 1, "Pmax": 40.0}]}
+    key = TransformProfile(info, grid, ct).get_profile_key("solar")
+    assert key == TransformProfile(info, grid, ct).get_profile_key("solar")
+
+    grid.plant.loc[2, "Pmax"] = 25.0
+    assert TransformProfile(info, grid, ct).get_profile_key("solar") == key
+    grid.plant.loc[3, "Pmax"] = 35.0
+    assert TransformProfile(info, grid, ct).get_profile_key("solar") != key
+    ct["new_plant"][0]["plant_id_neighbor"] = 3
+    assert TransformProfile(info, grid, ct).get_profile_key("solar") != key
+    info["base_solar"] = "v2"
+    assert TransformProfile(info, grid, ct).get_profile_key("solar") != key
+
+    demand_key = TransformProfile(info, grid, {}).get_profile_key("demand")
+    scaled = {"demand": {"zone_id": {302: 1.1}}}
+    assert TransformProfile(info, grid, scaled).get_profile_key("demand") != demand_key
@@ -0,0 +1,237 @@
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+def _incidence(rows, n_rows):
+    """Builds a sparse incidence matrix between rows and elements.
+
+    :param list rows: arrays giving the row of each element. An element is in
+        several rows when it appears in several arrays. Rows equal to -1 are left
+        out.
+    :param int n_rows: number of rows.
+    :return: (*scipy.sparse.csr_matrix*) -- incidence matrix, with sorted column
+        indices and without duplicates.
+    """
+    n_elements = len(rows[0])
+    row = np.concatenate(rows)
+    column = np.tile(np.arange(n_elements), len(rows))
+    keep = row != -1
+    matrix = csr_matrix(
+        (np.ones(keep.sum()), (row[keep], column[keep])), shape=(n_rows, n_elements)
+    )
+    matrix.sum_duplicates()
+    return matrix
+
+
+def _bus_id(table, column):
+    """Returns bus ids of a table, as integers when the table is empty.
+
+    :param pandas.DataFrame table: table, may be None.
+    :param str column: name of the column.
+    :return: (*numpy.ndarray*) -- bus ids.
+    """
+    if table is None or len(table) == 0:
+        return np.empty(0, dtype=int)
+    return table[column].to_numpy()
+
+
+class Topology:
+    """Bus-branch topology of a grid. Incidence between buses and branches, buses
+    and plants and connected components are computed once with
+    :mod:`scipy.sparse.csgraph`, so that queries only look up the elements connected
+    to a bus.
+
+    :param pandas.DataFrame branch: branch table.
+    :param pandas.DataFrame bus: bus table. Buses found in other tables only are
+        appended.
+    :param pandas.DataFrame dcline: DC line table.
+    :param pandas.DataFrame plant: plant table.
+    :param pandas.DataFrame bus2sub: bus to substation mapping.
+    """
+
+    def __init__(self, branch, bus=None, dcline=None, plant=None, bus2sub=None):
+        """Constructor."""
+        endpoints = [
+            _bus_id(branch, "from_bus_id"),
+            _bus_id(branch, "to_bus_id"),
+            _bus_id(dcline, "from_bus_id"),
+            _bus_id(dcline, "to_bus_id"),
+            _bus_id(plant, "bus_id"),
+        ]
+        bus_id = pd.Index(np.empty(0, dtype=int) if bus is None else bus.index)
+        extra = pd.Index(np.concatenate(endpoints)).unique()
+        self.bus_id = bus_id.append(extra[~extra.isin(bus_id)])
+        self.branch_id = branch.index
+        self.plant_id = pd.Index([]) if plant is None else plant.index
+        n_bus = len(self.bus_id)
+
+        from_bus, to_bus = self._code(endpoints[0]), self._code(endpoints[1])
+        self._branch_end = from_bus, to_bus
+        self._branch = _incidence([from_bus, to_bus], n_bus)
+        self._plant = _incidence([self._code(endpoints[4])], n_bus)
+        self._degree = np.diff(self._branch.indptr)
+        #: number of branches connected to each bus.
+        self.degree = pd.Series(self._degree, index=self.bus_id)
+
+        dc_bus = self._code(np.concatenate(endpoints[2:4]))
+        #: whether each bus is connected to a branch or a DC line.
+        self.connected = pd.Series(
+            (self._degree > 0) | (np.bincount(dc_bus, minlength=n_bus) > 0),
+            index=self.bus_id,
+        )
+
+        adjacency = csr_matrix(
+            (np.ones(len(from_bus)), (from_bus, to_bus)), shape=(n_bus, n_bus)
+        )
+        n_components, labels = connected_components(adjacency, directed=False)
+        #: number of connected components, through branches. Buses not connected to
+        #: any branch are components of their own.
+        self.n_components = n_components
+        #: connected component of each bus, through branches.
+        self.component = pd.Series(labels, index=self.bus_id)
+
+        dc_from, dc_to = self._code(endpoints[2]), self._code(endpoints[3])
+        _, labels = connected_components(
+            adjacency
+            + csr_matrix(
+                (np.ones(len(dc_from)), (dc_from, dc_to)), shape=(n_bus, n_bus)
+            ),
+            directed=False,
+        )
+        #: connected component of each bus, through branches and DC lines.
+        self.network_component = pd.Series(labels, index=self.bus_id)
+
+        self.bus2sub = None if bus2sub is None else bus2sub["sub_id"]
+        self._stubs = None
+
+    def _code(self, bus_id):
+        """Returns the position of buses.
+
+        :param iterable bus_id: bus ids.
+        :return: (*numpy.ndarray*) -- positions.
+        """
+        return self.bus_id.get_indexer(bus_id)
+
+    def _position(self, bus_id):
+        """Returns the position of a bus.
+
+        :param int bus_id: bus id.
+        :return: (*int*) -- position.
+        :raises KeyError: if bus is not in the grid.
+        """
+        return self.bus_id.get_loc(bus_id)
+
+    def branches_at(self, bus_id):
+        """Returns the branches connected to a bus.
+
+        :param int bus_id: bus id.
+        :return: (*pandas.Index*) -- branch ids.
+        :raises KeyError: if bus is not in the grid.
+        """
+        i = self._position(bus_id)
+        start, end = self._branch.indptr[i], self._branch.indptr[i + 1]
+        return self.branch_id[self._branch.indices[start:end]]
+
+    def plants_at(self, bus_id):
+        """Returns the plants located at a bus.
+
+        :param int bus_id: bus id.
+        :return: (*pandas.Index*) -- plant ids.
+        :raises KeyError: if bus is not in the grid.
+        """
+        i = self._position(bus_id)
+        start, end = self._plant.indptr[i], self._plant.indptr[i + 1]
+        return self.plant_id[self._plant.indices[start:end]]
+
+    def sub_at(self, bus_id):
+        """Returns the substation of a bus.
+
+        :param int bus_id: bus id.
+        :return: (*int*) -- substation id.
+        :raises KeyError: if bus is not in the bus to substation mapping.
+        """
+        return self.bus2sub.loc[bus_id]
+
+    def stub_branches(self):
+        """Finds stub branches of all buses. A bus connected to a single branch is a
+        stub of degree 1. If the bus at the other end of this branch is connected to
+        a single other branch, the bus is a stub of degree 2 and both branches are
+        stub branches. The stub branches are found once and cached.
+
+        :return: (*pandas.DataFrame*) -- one row per bus and stub branch, with
+            *'bus_id'*, *'branch_id'* and *'stub_degree'* columns. Buses that are not
+            stubs are left out.
+        """
+        if self._stubs is None:
+            self._stubs = self._find_stub_branches()
+        return self._stubs.copy()
+
+    def _find_stub_branches(self):
+        """Finds stub branches of all buses. See :meth:`stub_branches`.
+
+        :return: (*pandas.DataFrame*) -- stub branches.
+        """
+        indptr, indices = self._branch.indptr, self._branch.indices
+        from_bus, to_bus = self._branch_end
+
+        stub = np.flatnonzero(self._degree == 1)
+        stub_branch = indices[indptr[stub]]
+        other_end = np.where(
+            from_bus[stub_branch] == stub, to_bus[stub_branch], from_bus[stub_branch]
+        )
+        # We could keep going recursively, but degree 2 is the max in Western.
+        second = (self._degree[other_end] == 2) & (other_end != stub)
+
+        start = indptr[other_end[second]]
+        second_branch = indices[np.stack([start, start + 1], axis=1).ravel()]
+        bus_position = np.concatenate([stub[~second], np.repeat(stub[second], 2)])
+        branch_position = np.concatenate([stub_branch[~second], second_branch])
+        return pd.DataFrame(
+            {
+                "bus_id": self.bus_id.to_numpy()[bus_position],
+                "branch_id": self.branch_id.to_numpy()[branch_position],
+                "stub_degree": np.repeat([1, 2], [(~second).sum(), 2 * second.sum()]),
+            }
+        )
+
+
+_topology_tables = ("bus", "branch", "dcline", "plant", "bus2sub")
+
+
+def _get_topology_key(grid):
+    """Returns the tables a topology is built from, with their index and number of
+    rows, which change when rows are added or dropped in place.
+
+    :param powersimdata.input.grid.Grid grid: grid or grid-like object.
+    :return: (*tuple*) -- table, index and number of rows of each table.
+    """
+    tables = (getattr(grid, t) for t in _topology_tables)
+    return tuple((t, t.index, len(t)) for t in tables)
+
+
+def get_topology(grid):
+    """Returns the topology of a grid. The topology is cached on the grid and built
+    again when the bus, branch, dcline, plant or bus2sub table is replaced or when
+    rows are added to or dropped from one of these tables. Bus ids modified in place
+    are not detected, ``del grid._topology`` then resets the cached topology.
+
+    :param powersimdata.input.grid.Grid grid: grid or grid-like object.
+    :return: (*Topology*) -- topology.
+    """
+    key = _get_topology_key(grid)
+    cached = grid.__dict__.get("_topology")
+    if cached is None or any(
+        t is not u or i is not j or n != m
+        for (t, i, n), (u, j, m) in zip(cached[0], key)
+    ):
+        topology = Topology(
+            grid.branch,
+            bus=grid.bus,
+            dcline=grid.dcline,
+            plant=grid.plant,
+            bus2sub=grid.bus2sub,
+        )
+        grid.__dict__["_topology"] = cached = (key, topology)
+    return cached[1]
@@ -1,59 +1,74 @@
 import copy
+import warnings
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
+from powersimdata.input.check import check_grid
 from powersimdata.utility.distance import haversine
 
 
 class TransformGrid:
     """Transforms grid according to operations listed in change table."""
 
+    gen_types = [
+        "biomass",
+        "coal",
+        "dfo",
+        "geothermal",
+        "ng",
+        "nuclear",
+        "hydro",
+        "solar",
+        "wind",
+        "wind_offshore",
+        "other",
+    ]
+    thermal_gen_types = ["coal", "dfo", "geothermal", "ng", "nuclear"]
+    tables = [
+        "bus",
+        "sub",
+        "bus2sub",
+        "branch",
+        "dcline",
+        "plant",
+        "gencost",
+        "storage",
+    ]
+
     def __init__(self, grid, ct):
         """Constructor
 
         :param powersimdata.input.grid.Grid grid: a Grid object.
         :param dict ct: change table.
         """
-        self.grid = copy.deepcopy(grid)
+        self.grid = grid.view()
         self.ct = copy.deepcopy(ct)
-        self.gen_types = [
-            "biomass",
-            "coal",
-            "dfo",
-            "geothermal",
-            "ng",
-            "nuclear",
-            "hydro",
-            "solar",
-            "wind",
-            "wind_offshore",
-            "other",
-        ]
-        self.thermal_gen_types = ["coal", "dfo", "geothermal", "ng", "nuclear"]
 
-    def get_grid(self):
-        """Returns the transformed grid.
+    def get_grid(self, check=False):
+        """Returns the transformed grid. Tables which are not modified by the change
+        table are shared read-only with the original grid, see
+        :meth:`powersimdata.input.grid.Grid.view`.
 
+        :param bool check: whether to check the consistency of the transformed grid
+            with :func:`powersimdata.input.check.check_grid`. Problems are reported
+            as warnings.
         :return: (*powersimdata.input.grid.Grid*) -- a Grid object.
         """
         if bool(self.ct):
             self._apply_change_table()
+        if check:
+            try:
+                check_grid(self.grid)
+            except ValueError as e:
+                warnings.warn(str(e))
         return self.grid
 
     def _apply_change_table(self):
         """Apply changes listed in change table to the grid."""
         # First scale by zones, so that zone factors are not applied to additions.
-        for g in self.gen_types:
-            if g in self.ct.keys():
-                self._scale_gen_by_zone(g)
-            if f"{g}_cost" in self.ct.keys():
-                self._scale_gencost_by_zone(g)
-            if f"{g}_pmin" in self.ct.keys():
-                self._scale_gen_pmin_by_zone(g)
-
-        if "branch" in self.ct.keys():
-            self._scale_branch_by_zone()
+        self._scale_by_zone()
 
         # Then, add new elements
         if "new_bus" in self.ct.keys():
@@ -72,178 +87,223 @@ class TransformGrid:
             self._add_storage()
 
         # Scale by IDs, so that additions can be scaled.
+        self._scale_by_id()
+
+        # Finally, remove elements (so that removal doesn't cause downstream errors)
+        if "remove_branch" in self.ct.keys():
+            self._remove_branch()
+        if "remove_bus" in self.ct.keys():
+            self._remove_bus()
+
+    def _scale_by_zone(self):
+        """Scales generators and AC lines by zone. Factors of all zones are collected
+        first and applied with one operation per column.
+        """
+        scaling = {t: _Scaling() for t in ["plant", "gencost", "branch"]}
+        plant_groups = self.grid.plant.groupby(["zone_id", "type"]).groups
+        for g in self.gen_types:
+            if g in self.ct.keys():
+                self._scale_gen_by_zone(scaling, plant_groups, g)
+            if f"{g}_cost" in self.ct.keys():
+                self._scale_gencost_by_zone(scaling, plant_groups, g)
+            if f"{g}_pmin" in self.ct.keys():
+                self._scale_gen_pmin_by_zone(scaling, plant_groups, g)
+
+        if "branch" in self.ct.keys():
+            self._scale_branch_by_zone(scaling)
+
+        self._apply_scaling(scaling)
+
+    def _scale_by_id(self):
+        """Scales generators, AC lines and HVDC lines by ID. Factors of all elements
+        are collected first and applied with one operation per column.
+        """
+        scaling = {t: _Scaling() for t in ["plant", "gencost", "branch", "dcline"]}
         for g in self.gen_types:
             if g in self.ct.keys():
-                self._scale_gen_by_id(g)
+                self._scale_gen_by_id(scaling, g)
             if f"{g}_cost" in self.ct.keys():
-                self._scale_gencost_by_id(g)
+                self._scale_gencost_by_id(scaling, g)
             if f"{g}_pmin" in self.ct.keys():
-                self._scale_gen_pmin_by_id(g)
+                self._scale_gen_pmin_by_id(scaling, g)
 
         if "branch" in self.ct.keys():
-            self._scale_branch_by_id()
+            self._scale_branch_by_id(scaling)
 
         if "dcline" in self.ct.keys():
-            self._scale_dcline()
+            self._scale_dcline(scaling)
 
-        # Finally, remove elements (so that removal doesn't cause downstream errors)
-        if "remove_branch" in self.ct.keys():
-            self._remove_branch()
-        if "remove_bus" in self.ct.keys():
-            self._remove_bus()
+        self._apply_scaling(scaling)
+
+    def _apply_scaling(self, scaling):
+        """Applies factors to the grid tables.
 
-    def _scale_gen_by_zone(self, gen_type):
+        :param dict scaling: factors keyed by table name.
+        """
+        for table, factors in scaling.items():
+            if factors.is_empty():
+                continue
+            if table == "gencost":
+                factors.apply(self.grid.gencost["before"])
+            else:
+                factors.apply(getattr(self.grid, table))
+
+    def _scale_gen_by_zone(self, scaling, plant_groups, gen_type):
         """Scales capacity of generators, by zone. Also scales the associated generation
             cost curve (to maintain the same slopes at the start/end of the curve).
 
+        :param dict scaling: factors keyed by table name.
+        :param dict plant_groups: plant ids keyed by (zone id, type) tuples.
         :param str gen_type: type of generator.
         """
         if "zone_id" in self.ct[gen_type].keys():
             for zone_id, factor in self.ct[gen_type]["zone_id"].items():
-                plant_id = (
-                    self.grid.plant.groupby(["zone_id", "type"])
-                    .get_group((zone_id, gen_type))
-                    .index.tolist()
-                )
-                self._scale_gen_capacity(plant_id, factor)
+                plant_id = plant_groups[(zone_id, gen_type)]
+                self._scale_gen_capacity(scaling, plant_id, factor)
                 if gen_type in self.thermal_gen_types:
-                    self._scale_gencost_by_capacity(plant_id, factor)
+                    self._scale_gencost_by_capacity(scaling, plant_id, factor)
 
-    def _scale_gen_by_id(self, gen_type):
+    def _scale_gen_by_id(self, scaling, gen_type):
         """Scales capacity of generators by ID. Also scales the associated generation
             cost curve (to maintain the same slopes at the start/end of the curve).
 
+        :param dict scaling: factors keyed by table name.
         :param str gen_type: type of generator.
         """
         if "plant_id" in self.ct[gen_type].keys():
-            for plant_id, factor in self.ct[gen_type]["plant_id"].items():
-                self._scale_gen_capacity(plant_id, factor)
-                if gen_type in self.thermal_gen_types:
-                    self._scale_gencost_by_capacity(plant_id, factor)
+            plant_id, factor = _split(self.ct[gen_type]["plant_id"])
+            self._scale_gen_capacity(scaling, plant_id, factor)
+            if gen_type in self.thermal_gen_types:
+                self._scale_gencost_by_capacity(scaling, plant_id, factor)
 
-    def _scale_gencost_by_zone(self, gen_type):
+    def _scale_gencost_by_zone(self, scaling, plant_groups, gen_type):
         """Scales cost of generators, by zone.
 
+        :param dict scaling: factors keyed by table name.
+        :param dict plant_groups: plant ids keyed by (zone id, type) tuples.
         :param str gen_type: type of generator.
         """
         cost_key = f"{gen_type}_cost"
         if "zone_id" in self.ct[cost_key].keys():
             for zone_id, factor in self.ct[cost_key]["zone_id"].items():
-                plant_id = (
-                    self.grid.plant.groupby(["zone_id", "type"])
-                    .get_group((zone_id, gen_type))
-                    .index.tolist()
-                )
-                self.grid.gencost["before"].loc[plant_id, ["c0", "c1", "c2"]] *= factor
+                plant_id = plant_groups[(zone_id, gen_type)]
+                scaling["gencost"].multiply(["c0", "c1", "c2"], plant_id, factor)
 
-    def _scale_gencost_by_id(self, gen_type):
+    def _scale_gencost_by_id(self, scaling, gen_type):
         """Scales cost of generators, by ID.
 
+        :param dict scaling: factors keyed by table name.
         :param str gen_type: type of generator.
         """
         cost_key = f"{gen_type}_cost"
         if "plant_id" in self.ct[cost_key].keys():
-            for plant_id, factor in self.ct[cost_key]["plant_id"].items():
-                self.grid.gencost["before"].loc[plant_id, ["c0", "c1", "c2"]] *= factor
+            plant_id, factor = _split(self.ct[cost_key]["plant_id"])
+            scaling["gencost"].multiply(["c0", "c1", "c2"], plant_id, factor)
 
-    def _scale_gen_pmin_by_zone(self, gen_type):
+    def _scale_gen_pmin_by_zone(self, scaling, plant_groups, gen_type):
         """Scales minimum generation of generators, by zone.
 
+        :param dict scaling: factors keyed by table name.
+        :param dict plant_groups: plant ids keyed by (zone id, type) tuples.
         :param str gen_type: type of generator.
         """
         pmin_key = f"{gen_type}_pmin"
         if "zone_id" in self.ct[pmin_key].keys():
             for zone_id, factor in self.ct[pmin_key]["zone_id"].items():
-                plant_id = (
-                    self.grid.plant.groupby(["zone_id", "type"])
-                    .get_group((zone_id, gen_type))
-                    .index.tolist()
-                )
-                self.grid.plant.loc[plant_id, "Pmin"] *= factor
+                plant_id = plant_groups[(zone_id, gen_type)]
+                scaling["plant"].multiply(["Pmin"], plant_id, factor)
 
-    def _scale_gen_pmin_by_id(self, gen_type):
+    def _scale_gen_pmin_by_id(self, scaling, gen_type):
         """Scales minimum generation of generators, by ID.
 
+        :param dict scaling: factors keyed by table name.
         :param str gen_type: type of generator.
         """
         pmin_key = f"{gen_type}_pmin"
         if "plant_id" in self.ct[pmin_key].keys():
-            for plant_id, factor in self.ct[pmin_key]["plant_id"].items():
-                self.grid.plant.loc[plant_id, "Pmin"] *= factor
+            plant_id, factor = _split(self.ct[pmin_key]["plant_id"])
+            scaling["plant"].multiply(["Pmin"], plant_id, factor)
 
-    def _scale_gen_capacity(self, plant_id, factor):
+    def _scale_gen_capacity(self, scaling, plant_id, factor):
         """Scales capacity of plants.
 
-        :param int/list plant_id: plant identification number(s).
-        :param float factor: scaling factor.
+        :param dict scaling: factors keyed by table name.
+        :param list plant_id: plant identification numbers.
+        :param float/numpy.ndarray factor: scaling factor(s).
         """
-        self.grid.plant.loc[plant_id, "Pmax"] *= factor
-        self.grid.plant.loc[plant_id, "Pmin"] *= factor
+        scaling["plant"].multiply(["Pmax", "Pmin"], plant_id, factor)
 
-    def _scale_gencost_by_capacity(self, plant_id, factor):
+    def _scale_gencost_by_capacity(self, scaling, plant_id, factor):
         """Scales generation cost curves along with capacity, such that the start/end
             slopes are consistent before and after.
 
-        :param int/list plant_id: plant identification number(s).
-        :param float factor: scaling factor.
-        :return:
+        :param dict scaling: factors keyed by table name.
+        :param list plant_id: plant identification numbers.
+        :param float/numpy.ndarray factor: scaling factor(s).
         """
-        self.grid.gencost["before"].loc[plant_id, "c0"] *= factor
-        if factor != 0:
-            self.grid.gencost["before"].loc[plant_id, "c2"] /= factor
+        plant_id = np.asarray(plant_id)
+        factor = np.broadcast_to(factor, plant_id.shape)
+        scaling["gencost"].multiply(["c0"], plant_id, factor)
+        scaling["gencost"].divide(["c2"], plant_id[factor != 0], factor[factor != 0])
 
-    def _scale_branch_by_zone(self):
-        """Scales capacity of AC lines, by zone, for lines entirely within that zone."""
+    def _scale_branch_by_zone(self, scaling):
+        """Scales capacity of AC lines, by zone, for lines entirely within that zone.
+
+        :param dict scaling: factors keyed by table name.
+        """
         if "zone_id" in self.ct["branch"].keys():
+            branch_groups = self.grid.branch.groupby(["from_zone_id", "to_zone_id"])
+            branch_groups = branch_groups.groups
             for zone_id, factor in self.ct["branch"]["zone_id"].items():
-                branch_id = (
-                    self.grid.branch.groupby(["from_zone_id", "to_zone_id"])
-                    .get_group((zone_id, zone_id))
-                    .index.tolist()
-                )
-                self._scale_branch_capacity(branch_id, factor)
+                branch_id = branch_groups[(zone_id, zone_id)]
+                self._scale_branch_capacity(scaling, branch_id, factor)
 
-    def _scale_branch_by_id(self):
-        """Scales capacity of AC lines, by ID."""
+    def _scale_branch_by_id(self, scaling):
+        """Scales capacity of AC lines, by ID.
+
+        :param dict scaling: factors keyed by table name.
+        """
         if "branch_id" in self.ct["branch"].keys():
-            for branch_id, factor in self.ct["branch"]["branch_id"].items():
-                self._scale_branch_capacity(branch_id, factor)
+            branch_id, factor = _split(self.ct["branch"]["branch_id"])
+            self._scale_branch_capacity(scaling, branch_id, factor)
 
-    def _scale_branch_capacity(self, branch_id, factor):
+    def _scale_branch_capacity(self, scaling, branch_id, factor):
         """Scales capacity of AC lines.
 
-        :param int/list branch_id: branch identification number(s)
-        :param float factor: scaling factor
+        :param dict scaling: factors keyed by table name.
+        :param list branch_id: branch identification numbers.
+        :param float/numpy.ndarray factor: scaling factor(s).
         """
-        self.grid.branch.loc[branch_id, "rateA"] *= factor
-        self.grid.branch.loc[branch_id, "x"] /= factor
+        scaling["branch"].multiply(["rateA"], branch_id, factor)
+        scaling["branch"].divide(["x"], branch_id, factor)
+
+    def _scale_dcline(self, scaling):
+        """Scales capacity of HVDC lines.
 
-    def _scale_dcline(self):
-        """Scales capacity of HVDC lines."""
-        for dcline_id, factor in self.ct["dcline"]["dcline_id"].items():
-            self.grid.dcline.loc[dcline_id, "Pmin"] *= factor
-            self.grid.dcline.loc[dcline_id, "Pmax"] *= factor
-            if factor == 0:
-                self.grid.dcline.loc[dcline_id, "status"] = 0
+        :param dict scaling: factors keyed by table name.
+        """
+        dcline_id, factor = _split(self.ct["dcline"]["dcline_id"])
+        scaling["dcline"].multiply(["Pmin", "Pmax"], dcline_id, factor)
+        if (factor == 0).any():
+            dcline = self.grid.dcline
+            off = dcline.index.isin(dcline_id[factor == 0])
+            dcline["status"] = dcline["status"].where(~off, 0)
 
     def _add_branch(self):
         """Adds branch(es) to the grid."""
         v2x = voltage_to_x_per_distance(self.grid)
-        for entry in self.ct["new_branch"]:
+        entries = self.ct["new_branch"]
+        from_bus = self.grid.bus.loc[[e["from_bus_id"] for e in entries]]
+        to_bus = self.grid.bus.loc[[e["to_bus_id"] for e in entries]]
+        new_branches = []
+        for entry, (_, from_bus), (_, to_bus) in zip(
+            entries, from_bus.iterrows(), to_bus.iterrows()
+        ):
             new_branch = {c: 0 for c in self.grid.branch.columns}
-            from_bus_id = entry["from_bus_id"]
-            to_bus_id = entry["to_bus_id"]
-            interconnect = self.grid.bus.loc[from_bus_id].interconnect
-            from_zone_id = self.grid.bus.loc[from_bus_id].zone_id
-            to_zone_id = self.grid.bus.loc[to_bus_id].zone_id
-            from_zone_name = self.grid.id2zone[from_zone_id]
-            to_zone_name = self.grid.id2zone[to_zone_id]
-            from_lon = self.grid.bus.loc[from_bus_id].lon
-            from_lat = self.grid.bus.loc[from_bus_id].lat
-            to_lon = self.grid.bus.loc[to_bus_id].lon
-            to_lat = self.grid.bus.loc[to_bus_id].lat
-            from_basekv = v2x[self.grid.bus.loc[from_bus_id].baseKV]
-            to_basekv = v2x[self.grid.bus.loc[to_bus_id].baseKV]
+            from_lon, from_lat = from_bus.lon, from_bus.lat
+            to_lon, to_lat = to_bus.lon, to_bus.lat
+            from_basekv = v2x[from_bus.baseKV]
+            to_basekv = v2x[to_bus.baseKV]
             distance = haversine((from_lat, from_lon), (to_lat, to_lon))
             x = distance * np.mean([from_basekv, to_basekv])
 
@@ -253,27 +313,34 @@ class TransformGrid:
             new_branch["ratio"] = 0
             new_branch["branch_device_type"] = "Line"
             new_branch["rateA"] = entry["Pmax"]
-            new_branch["interconnect"] = interconnect
-            new_branch["from_zone_id"] = from_zone_id
-            new_branch["to_zone_id"] = to_zone_id
-            new_branch["from_zone_name"] = from_zone_name
-            new_branch["to_zone_name"] = to_zone_name
+            new_branch["interconnect"] = from_bus.interconnect
+            new_branch["from_zone_id"] = from_bus.zone_id
+            new_branch["to_zone_id"] = to_bus.zone_id
+            new_branch["from_zone_name"] = self.grid.id2zone[from_bus.zone_id]
+            new_branch["to_zone_name"] = self.grid.id2zone[to_bus.zone_id]
             new_branch["from_lon"] = from_lon
             new_branch["from_lat"] = from_lat
             new_branch["to_lon"] = to_lon
             new_branch["to_lat"] = to_lat
             new_branch["x"] = x
-            new_index = [self.grid.branch.index[-1] + 1]
-            self.grid.branch = self.grid.branch.append(
-                pd.DataFrame(new_branch, index=new_index), sort=False
-            )
+            new_branches.append(new_branch)
+        self.grid.branch = _append_rows(
+            self.grid.branch, new_branches, _next_index(self.grid.branch, entries)
+        )
 
     def _add_bus(self):
+        """Adds bus(es) to the grid, along with their substation."""
         bus = self.grid.bus
+        sub = self.grid.sub
         zone2interconnect = {
             k: v[0] for k, v in bus.groupby("zone_id").interconnect.unique().items()
         }
-        latlon2sub = self.grid.sub.groupby(["lat", "lon"]).groups
+        latlon2sub = sub.groupby(["lat", "lon"]).groups
+        interconnect2sub_id = sub.groupby("interconnect").interconnect_sub_id.max()
+        interconnect2sub_id = interconnect2sub_id.to_dict()
+        new_bus_index = bus.index.max() + 1 + np.arange(len(self.ct["new_bus"]))
+        new_sub_id = sub.index.max()
+        new_buses, new_bus2sub, new_subs, new_sub_index = [], [], [], []
         for entry in self.ct["new_bus"]:
             # Add to the bus dataframe
             new_bus = {c: 0 for c in bus.columns}
@@ -290,51 +357,46 @@ class TransformGrid:
             lat, lon = entry["lat"], entry["lon"]
             new_bus["lat"] = lat
             new_bus["lon"] = lon
-            new_bus_index = [self.grid.bus.index.max() + 1]
-            self.grid.bus = self.grid.bus.append(
-                pd.DataFrame(new_bus, index=new_bus_index), sort=False
-            )
+            new_buses.append(new_bus)
             # Add to substation & bus2sub mapping dataframes
             if (lat, lon) in latlon2sub:
                 # If there are multiple matching substations, arbitrarily grab the first
                 sub_id = latlon2sub[(lat, lon)][0]
-                new_row = pd.DataFrame(
-                    {"sub_id": sub_id, "interconnect": interconnect},
-                    index=new_bus_index,
-                )
-                self.grid.bus2sub = self.grid.bus2sub.append(new_row, sort=False)
             else:
                 # Create a new substation
-                sub = self.grid.sub
-                new_sub_id = sub.index.max() + 1
-                interconnect_sub = sub[sub.interconnect == interconnect]
-                new_interconnect_sub_id = interconnect_sub.interconnect_sub_id.max() + 1
-                new_row = pd.DataFrame(
-                    {"sub_id": new_sub_id, "interconnect": interconnect},
-                    index=new_bus_index,
+                new_sub_id += 1
+                sub_id = new_sub_id
+                interconnect2sub_id[interconnect] = (
+                    interconnect2sub_id.get(interconnect, 0) + 1
                 )
-                self.grid.bus2sub = self.grid.bus2sub.append(new_row, sort=False)
-                new_row = pd.DataFrame(
+                new_subs.append(
                     {
-                        "name": f"NEW {new_sub_id}",
-                        "interconnect_sub_id": new_interconnect_sub_id,
+                        "name": f"NEW {sub_id}",
+                        "interconnect_sub_id": interconnect2sub_id[interconnect],
                         "lat": lat,
                         "lon": lon,
                         "interconnect": interconnect,
-                    },
-                    index=[new_sub_id],
+                    }
                 )
-                self.grid.sub = sub.append(new_row, sort=False)
-                latlon2sub[(lat, lon)] = [new_sub_id]
+                new_sub_index.append(sub_id)
+                latlon2sub[(lat, lon)] = [sub_id]
+            new_bus2sub.append({"sub_id": sub_id, "interconnect": interconnect})
+        self.grid.bus = _append_rows(bus, new_buses, new_bus_index)
+        self.grid.bus2sub = _append_rows(self.grid.bus2sub, new_bus2sub, new_bus_index)
+        self.grid.sub = _append_rows(sub, new_subs, new_sub_index)
 
     def _add_dcline(self):
         """Adds HVDC line(s) to the grid"""
-        for entry in self.ct["new_dcline"]:
+        entries = self.ct["new_dcline"]
+        from_interconnect = self.grid.bus.loc[
+            [e["from_bus_id"] for e in entries], "interconnect"
+        ]
+        to_interconnect = self.grid.bus.loc[
+            [e["to_bus_id"] for e in entries], "interconnect"
+        ]
+        new_dclines = []
+        for entry, from_ic, to_ic in zip(entries, from_interconnect, to_interconnect):
             new_dcline = {c: 0 for c in self.grid.dcline.columns}
-            from_bus_id = entry["from_bus_id"]
-            to_bus_id = entry["to_bus_id"]
-            from_interconnect = self.grid.bus.loc[from_bus_id].interconnect
-            to_interconnect = self.grid.bus.loc[to_bus_id].interconnect
             new_dcline["from_bus_id"] = entry["from_bus_id"]
             new_dcline["to_bus_id"] = entry["to_bus_id"]
             new_dcline["status"] = 1
@@ -342,12 +404,12 @@ class TransformGrid:
             new_dcline["Pt"] = 0.98 * entry["Pmax"]
             new_dcline["Pmin"] = entry["Pmin"]
             new_dcline["Pmax"] = entry["Pmax"]
-            new_dcline["from_interconnect"] = from_interconnect
-            new_dcline["to_interconnect"] = to_interconnect
-            new_index = [self.grid.dcline.index[-1] + 1]
-            self.grid.dcline = self.grid.dcline.append(
-                pd.DataFrame(new_dcline, index=new_index), sort=False
-            )
+            new_dcline["from_interconnect"] = from_ic
+            new_dcline["to_interconnect"] = to_ic
+            new_dclines.append(new_dcline)
+        self.grid.dcline = _append_rows(
+            self.grid.dcline, new_dclines, _next_index(self.grid.dcline, entries)
+        )
 
     def _add_gen(self):
         """Adds generator(s) to the grid."""
@@ -356,66 +418,74 @@ class TransformGrid:
 
     def _add_plant(self):
         """Adds plant to the grid"""
-        for entry in self.ct["new_plant"]:
+        entries = self.ct["new_plant"]
+        buses = self.grid.bus.loc[[e["bus_id"] for e in entries]]
+        new_plants = []
+        for entry, (bus_id, bus) in zip(entries, buses.iterrows()):
             new_plant = {c: 0 for c in self.grid.plant.columns}
-            bus_id = entry["bus_id"]
-            interconnect = self.grid.bus.loc[bus_id].interconnect
-            zone_id = self.grid.bus.loc[bus_id].zone_id
-            zone_name = self.grid.id2zone[zone_id]
-            lon = self.grid.bus.loc[bus_id].lon
-            lat = self.grid.bus.loc[bus_id].lat
-
             new_plant["bus_id"] = bus_id
             new_plant["type"] = entry["type"]
             new_plant["Pmin"] = entry["Pmin"]
             new_plant["Pmax"] = entry["Pmax"]
             new_plant["status"] = 1
-            new_plant["interconnect"] = interconnect
-            new_plant["zone_id"] = zone_id
-            new_plant["zone_name"] = zone_name
-            new_plant["lon"] = lon
-            new_plant["lat"] = lat
-            new_index = [self.grid.plant.index[-1] + 1]
-            self.grid.plant = self.grid.plant.append(
-                pd.DataFrame(new_plant, index=new_index), sort=False
-            )
+            new_plant["interconnect"] = bus.interconnect
+            new_plant["zone_id"] = bus.zone_id
+            new_plant["zone_name"] = self.grid.id2zone[bus.zone_id]
+            new_plant["lon"] = bus.lon
+            new_plant["lat"] = bus.lat
+            new_plants.append(new_plant)
+        self.grid.plant = _append_rows(
+            self.grid.plant, new_plants, _next_index(self.grid.plant, entries)
+        )
 
     def _add_gencost(self):
         """Adds generation cost curves."""
-        for entry in self.ct["new_plant"]:
-            new_gencost = {c: 0 for c in self.grid.gencost["before"].columns}
-            bus_id = entry["bus_id"]
+        entries = self.ct["new_plant"]
+        gencost = self.grid.gencost["before"]
+        interconnect = self.grid.bus.loc[[e["bus_id"] for e in entries], "interconnect"]
+        new_gencosts = []
+        for entry, ic in zip(entries, interconnect):
+            new_gencost = {c: 0 for c in gencost.columns}
             new_gencost["type"] = 2
             new_gencost["n"] = 3
-            new_gencost["interconnect"] = self.grid.bus.loc[bus_id].interconnect
+            new_gencost["interconnect"] = ic
             if entry["type"] in self.thermal_gen_types:
                 new_gencost["c0"] = entry["c0"]
                 new_gencost["c1"] = entry["c1"]
                 new_gencost["c2"] = entry["c2"]
-            new_index = [self.grid.gencost["before"].index[-1] + 1]
-            self.grid.gencost["before"] = self.grid.gencost["before"].append(
-                pd.DataFrame(new_gencost, index=new_index), sort=False
-            )
-            self.grid.gencost["after"] = self.grid.gencost["before"]
+            new_gencosts.append(new_gencost)
+        self.grid.gencost["before"] = _append_rows(
+            gencost, new_gencosts, _next_index(gencost, entries)
+        )
+        self.grid.gencost["after"] = self.grid.gencost["before"]
 
     def _add_storage(self):
         """Adds storage to the grid."""
         first_storage_id = self.grid.plant.index.max() + 1
-        for i, entry in enumerate(self.ct["storage"]):
-            storage_id = first_storage_id + i
-            self._add_storage_unit(entry)
-            self._add_storage_gencost()
-            self._add_storage_genfuel()
-            self._add_storage_data(storage_id, entry)
+        entries = self.ct["storage"]
+        storage = self.grid.storage
+        storage["gen"] = _append_rows(
+            storage["gen"], [self._get_storage_unit(e) for e in entries]
+        )
+        storage["gencost"] = _append_rows(
+            storage["gencost"], [self._get_storage_gencost() for _ in entries]
+        )
+        storage["genfuel"].extend(["ess"] * len(entries))
+        storage["StorageData"] = _append_rows(
+            storage["StorageData"],
+            [
+                self._get_storage_data(first_storage_id + i, e)
+                for i, e in enumerate(entries)
+            ],
+        )
 
-    def _add_storage_unit(self, entry):
-        """Add storage unit.
+    def _get_storage_unit(self, entry):
+        """Builds storage unit.
 
-        :param int bus_id: bus identification number.
         :param dict entry: storage details, containing at least "bus_id" and "capacity".
+        :return: (*dict*) -- row of the storage gen table.
         """
-        storage = self.grid.storage
-        gen = {g: 0 for g in storage["gen"].columns}
+        gen = {g: 0 for g in self.grid.storage["gen"].columns}
         gen["bus_id"] = entry["bus_id"]
         gen["Vg"] = 1
         gen["mBase"] = 100
@@ -424,32 +494,27 @@ class TransformGrid:
         gen["Pmin"] = -1 * entry["capacity"]
         gen["ramp_10"] = entry["capacity"]
         gen["ramp_30"] = entry["capacity"]
-        storage["gen"] = storage["gen"].append(gen, ignore_index=True, sort=False)
-        # Maintain int columns after the append converts them to float
-        storage["gen"] = storage["gen"].astype({"bus_id": "int", "status": "int"})
+        return gen
+
+    def _get_storage_gencost(self):
+        """Builds generation cost of storage unit.
 
-    def _add_storage_gencost(self):
-        """Sets generation cost of storage unit."""
+        :return: (*dict*) -- row of the storage gencost table.
+        """
         gencost = {g: 0 for g in self.grid.storage["gencost"].columns}
         gencost["type"] = 2
         gencost["n"] = 3
-        self.grid.storage["gencost"] = self.grid.storage["gencost"].append(
-            gencost, ignore_index=True, sort=False
-        )
-
-    def _add_storage_genfuel(self):
-        """Sets fuel type of storage unit."""
-        self.grid.storage["genfuel"].append("ess")
+        return gencost
 
-    def _add_storage_data(self, storage_id, entry):
-        """Sets storage data.
+    def _get_storage_data(self, storage_id, entry):
+        """Builds storage data.
 
         :param int storage_id: storage identification number.
         :param dict entry: storage details, containing at least:
             "bus_id", "capacity".
+        :return: (*dict*) -- row of the storage StorageData table.
         """
-        storage = self.grid.storage
-        data = {g: 0 for g in storage["StorageData"].columns}
+        data = {g: 0 for g in self.grid.storage["StorageData"].columns}
 
         capacity = entry["capacity"]
         duration = entry["duration"]
@@ -473,11 +538,7 @@ class TransformGrid:
         data["InEff"] = entry["InEff"]
         data["LossFactor"] = entry["LossFactor"]
         data["rho"] = 1
-        storage["StorageData"] = storage["StorageData"].append(
-            data, ignore_index=True, sort=False
-        )
-        # Maintain int columns after the append converts them to float
-        storage["StorageData"] = storage["StorageData"].astype({"UnitIdx": "int"})
+        return data
 
     def _remove_branch(self):
         """Removes branches."""
@@ -500,6 +561,178 @@ class TransformGrid:
         self.grid.plant = plant.loc[~plant.index.isin(self.ct["remove_plant"])]
 
 
+def get_dependent_tables(keys, ct):
+    """Returns the grid tables modified by some keys of a change table.
+
+    :param iterable keys: keys of the change table.
+    :param dict ct: change table.
+    :return: (*set*) -- names of the grid tables to transform again when the
+        entries of the change table under these keys change. *'gencost'* always
+        comes along with *'plant'*.
+    """
+    gen_keys = {
+        f"{g}{suffix}"
+        for g in TransformGrid.gen_types
+        for suffix in ["", "_cost", "_pmin"]
+    }
+    tables = set()
+    for k in keys:
+        if k in gen_keys or k in {"new_plant", "remove_plant"}:
+            tables |= {"plant", "gencost"}
+        elif k in {"branch", "new_branch", "remove_branch"}:
+            tables.add("branch")
+        elif k in {"dcline", "new_dcline", "remove_dcline"}:
+            tables.add("dcline")
+        elif k in {"new_bus", "remove_bus"}:
+            tables |= {"bus", "sub", "bus2sub"}
+        elif k == "storage":
+            tables.add("storage")
+        elif k != "demand":
+            return set(TransformGrid.tables)
+    # Additions read buses, and storage ids follow plant ids
+    if "new_bus" in keys:
+        tables |= {
+            t
+            for k, t in [
+                ("new_branch", "branch"),
+                ("new_dcline", "dcline"),
+                ("new_plant", "plant"),
+                ("new_plant", "gencost"),
+            ]
+            if k in ct
+        }
+    if "plant" in tables and "storage" in ct:
+        tables.add("storage")
+    return tables
+
+
+def _next_index(df, rows):
+    """Returns index of rows appended after the last row of a data frame.
+
+    :param pandas.DataFrame df: data frame.
+    :param list rows: rows to append.
+    :return: (*numpy.ndarray*) -- index of the new rows.
+    """
+    return df.index[-1] + 1 + np.arange(len(rows))
+
+
+def _append_rows(df, rows, index=None):
+    """Appends rows to a data frame in a single operation. Numeric columns keep
+    their data type when the new values can be represented in it.
+
+    :param pandas.DataFrame df: data frame.
+    :param list rows: rows to append, as dictionaries keyed by column name.
+    :param iterable index: index of the new rows. If None, the index of the result
+        is reset.
+    :return: (*pandas.DataFrame*) -- data frame with the new rows.
+    """
+    if len(rows) == 0:
+        return df
+    new = pd.DataFrame(rows, index=index)
+    columns = df.columns.append(new.columns.difference(df.columns, sort=False))
+    if len(df) == 0:
+        new = new.reindex(columns=columns, fill_value=0)
+        return new.reset_index(drop=True) if index is None else new
+    for c in new.columns.intersection(df.columns):
+        dtype = df[c].dtype
+        values = new[c]
+        if (
+            is_numeric_dtype(dtype)
+            and is_numeric_dtype(values)
+            and values.notna().all()
+            and (values.astype(dtype) == values).all()
+        ):
+            new[c] = values.astype(dtype)
+    return pd.concat([df, new], sort=False, ignore_index=index is None)[columns]
+
+
+class _Scaling:
+    """Collects factors to multiply or divide columns of a table with, so that all
+    factors of a column are applied at once.
+    """
+
+    def __init__(self):
+        self._factors = {}
+
+    def is_empty(self):
+        """Checks whether factors have been recorded.
+
+        :return: (*bool*) -- whether no factor has been recorded.
+        """
+        return len(self._factors) == 0
+
+    def _add(self, operation, columns, ids, factor):
+        """Records factors.
+
+        :param str operation: *'multiply'* or *'divide'*.
+        :param list columns: columns to scale.
+        :param list ids: index labels of the rows to scale.
+        :param float/numpy.ndarray factor: factor, either a scalar or one per id.
+        """
+        ids = np.asarray(ids)
+        factor = np.broadcast_to(np.asarray(factor, dtype=float), ids.shape)
+        for c in columns:
+            self._factors.setdefault((c, operation), []).append((ids, factor))
+
+    def multiply(self, columns, ids, factor):
+        """Records factors to multiply columns with.
+
+        :param list columns: columns to scale.
+        :param list ids: index labels of the rows to scale.
+        :param float/numpy.ndarray factor: factor, either a scalar or one per id.
+        """
+        self._add("multiply", columns, ids, factor)
+
+    def divide(self, columns, ids, factor):
+        """Records factors to divide columns by.
+
+        :param list columns: columns to scale.
+        :param list ids: index labels of the rows to scale.
+        :param float/numpy.ndarray factor: factor, either a scalar or one per id.
+        """
+        self._add("divide", columns, ids, factor)
+
+    def _get_factor(self, index, column, operation):
+        """Combines factors of a column into one array aligned with the table.
+
+        :param pandas.Index index: index of the table.
+        :param str column: column name.
+        :param str operation: *'multiply'* or *'divide'*.
+        :return: (*numpy.ndarray*) -- combined factors.
+        :raises KeyError: if some ids are not in the table.
+        """
+        combined = np.ones(len(index))
+        if (column, operation) in self._factors:
+            entries = self._factors[(column, operation)]
+            ids = np.concatenate([e[0] for e in entries])
+            position = index.get_indexer(ids)
+            if (position == -1).any():
+                raise KeyError(f"{list(ids[position == -1])} not in index")
+            np.multiply.at(combined, position, np.concatenate([e[1] for e in entries]))
+        return combined
+
+    def apply(self, df):
+        """Scales columns of a table in place.
+
+        :param pandas.DataFrame df: table to scale.
+        :raises KeyError: if some ids are not in the table.
+        """
+        for c in {c for c, _ in self._factors}:
+            multiplier = self._get_factor(df.index, c, "multiply")
+            divisor = self._get_factor(df.index, c, "divide")
+            with np.errstate(divide="ignore", invalid="ignore"):
+                df[c] = df[c].to_numpy() * multiplier / divisor
+
+
+def _split(factors):
+    """Splits a dictionary of factors keyed by ids.
+
+    :param dict factors: factors keyed by ids.
+    :return: (*tuple*) -- array of ids and array of factors.
+    """
+    return np.array(list(factors.keys())), np.array(list(factors.values()), dtype=float)
+
+
 def voltage_to_x_per_distance(grid):
     """Calculates reactance per distance for voltage level.
 
@@ -1,4 +1,8 @@
 import copy
+import hashlib
+import json
+
+import numpy as np
 
 from powersimdata.input.input_data import InputData
 
@@ -18,7 +22,7 @@ class TransformProfile:
         self.scenario_info = scenario_info
 
         self.ct = copy.deepcopy(ct)
-        self.grid = copy.deepcopy(grid)
+        self.grid = grid.view()
 
         self.scale_keys = {
             "wind": {"wind", "wind_offshore"},
@@ -47,77 +51,106 @@ class TransformProfile:
         """Return the transformed profile.
 
         :param str resource: *'hydro'*, *'solar'* or *'wind'*.
-        :return: (*pandas.DataFrame*) -- power output for generators of specified type
-            with plant identification number as columns and UTC timestamp as indices.
+        :return: (*powersimdata.input.profile_view.ProfileView*) -- lazy view of the
+            power output for generators of specified type with plant identification
+            number as columns and UTC timestamp as indices.
         """
-        plant_id = (
-            self.grid.plant.iloc[: len(self.grid.plant) - self.n_new_plant]
-            .isin(self.scale_keys[resource])
-            .query("type == True")
-            .index
-        )
-
-        profile = self._input_data.get_data(self.scenario_info, resource)[plant_id]
+        plant_id = self._get_plant_id(resource)
+        profile = self._input_data.get_profile_view(self.scenario_info, resource)
+        profile = profile.select(plant_id)
         scaled_profile = self._scale_plant_profile(profile)
 
         if self.n_new_clean_plant > 0:
             new_profile = self._add_plant_profile(profile, resource)
-            return scaled_profile.join(new_profile)
+            return scaled_profile.concat(new_profile)
         else:
             return scaled_profile
 
-    def _scale_plant_profile(self, profile):
-        """Scale profile.
+    def _get_plant_id(self, resource):
+        """Return the id of the plants of the base grid with a profile.
 
-        :param pandas.DataFrame profile: profile with plant identification number as
-            columns and UTC timestamp as indices. Values are for 1-W generators.
-        :return: (*pandas.DataFrame*) -- scaled power output profile.
+        :param str resource: *'hydro'*, *'solar'* or *'wind'*.
+        :return: (*pandas.Index*) -- plant ids.
         """
-        plant_id = list(map(int, profile.columns))
-        return profile * self.grid.plant.loc[plant_id, "Pmax"]
+        return (
+            self.grid.plant.iloc[: len(self.grid.plant) - self.n_new_plant]
+            .isin(self.scale_keys[resource])
+            .query("type == True")
+            .index
+        )
 
-    def _add_plant_profile(self, profile, resource):
-        """Add profile for plants added via the change table.
+    def _get_new_plant(self, resource):
+        """Return the plants added via the change table with a profile.
 
-        :param pandas.DataFrame profile: profile with plant identification number as
-            columns and UTC timestamp as indices.
-        :param resource: fuel type.
-        :return: (*pandas.DataFrame*) -- profile with additional columns corresponding
-            to new generators inserted to the grid via the change table.
+        :param str resource: fuel type.
+        :return: (*tuple*) -- ids of the new plants, ids of the plants whose profile
+            they use and their capacity.
         """
         new_plant_ids, neighbor_ids, scaling = [], [], []
-        for i, entry in enumerate(self.ct["new_plant"]):
+        for i, entry in enumerate(self.ct.get("new_plant", [])):
             if entry["type"] in self.scale_keys[resource]:
                 new_plant_ids.append(self.grid.plant.index[-self.n_new_plant + i])
                 neighbor_ids.append(entry["plant_id_neighbor"])
                 scaling.append(entry["Pmax"])
+        return new_plant_ids, neighbor_ids, scaling
+
+    def _get_demand_factor(self):
+        """Return the scaling factor of the demand in each load zone.
+
+        :return: (*tuple*) -- sorted load zone ids and scaling factors.
+        """
+        zone_id = sorted(self.grid.bus.zone_id.unique())
+        factor = np.ones(len(zone_id))
+        if bool(self.ct) and "demand" in list(self.ct.keys()):
+            for key, value in self.ct["demand"]["zone_id"].items():
+                factor[zone_id.index(key)] *= value
+        return zone_id, factor
+
+    def _scale_plant_profile(self, profile):
+        """Scale profile.
 
-        neighbor_profile = profile[neighbor_ids]
-        new_profile = neighbor_profile.multiply(scaling, axis=1)
-        new_profile.columns = new_plant_ids
-        return new_profile
+        :param powersimdata.input.profile_view.ProfileView profile: profile with plant
+            identification number as columns and UTC timestamp as indices. Values are
+            for 1-W generators.
+        :return: (*powersimdata.input.profile_view.ProfileView*) -- scaled power
+            output profile.
+        """
+        return profile.scale(self.grid.plant.loc[profile.columns, "Pmax"].to_numpy())
+
+    def _add_plant_profile(self, profile, resource):
+        """Add profile for plants added via the change table.
+
+        :param powersimdata.input.profile_view.ProfileView profile: profile with plant
+            identification number as columns and UTC timestamp as indices.
+        :param resource: fuel type.
+        :return: (*powersimdata.input.profile_view.ProfileView*) -- profile of the new
+            generators inserted to the grid via the change table.
+        """
+        new_plant_ids, neighbor_ids, scaling = self._get_new_plant(resource)
+        return profile.select(neighbor_ids).rename(new_plant_ids).scale(scaling)
 
     def _get_demand_profile(self):
         """Return scaled demand profile.
 
-        :return: (*pandas.DataFrame*) -- data frame of demand.
+        :return: (*powersimdata.input.profile_view.ProfileView*) -- lazy view of
+            demand.
         """
-        zone_id = sorted(self.grid.bus.zone_id.unique())
-        demand = self._input_data.get_data(self.scenario_info, "demand").loc[:, zone_id]
+        zone_id, factor = self._get_demand_factor()
+        demand = self._input_data.get_profile_view(self.scenario_info, "demand")
         if bool(self.ct) and "demand" in list(self.ct.keys()):
             for key, value in self.ct["demand"]["zone_id"].items():
                 print(
                     "Multiply demand in %s (#%d) by %.2f"
                     % (self.grid.id2zone[key], key, value)
                 )
-                demand.loc[:, key] *= value
-        return demand
+        return demand.select(zone_id).scale(factor)
 
-    def get_profile(self, name):
-        """Return profile.
+    def get_profile_view(self, name):
+        """Return a lazy view of the profile. Values are only computed when calling
+        :meth:`powersimdata.input.profile_view.ProfileView.to_frame`.
 
         :param str name: either *'demand'*, *'hydro'*, *'solar'*, *'wind'*.
-        :return: (*pandas.DataFrame*) -- profile.
+        :return: (*powersimdata.input.profile_view.ProfileView*) -- profile.
         :raises ValueError: if argument not one of *'demand'*, *'hydro'*, *'solar'* or
             *'wind'*.
         """
@@ -128,3 +161,58 @@ class TransformProfile:
             return self._get_demand_profile()
         else:
             return self._get_renewable_profile(name)
+
+    def get_profile(self, name, start=None, end=None, columns=None):
+        """Return profile. Only the requested time window and columns are computed.
+
+        :param str name: either *'demand'*, *'hydro'*, *'solar'*, *'wind'*.
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: zone or plant ids. Defaults to all columns.
+        :return: (*pandas.DataFrame*) -- profile.
+        :raises ValueError: if argument not one of *'demand'*, *'hydro'*, *'solar'* or
+            *'wind'*.
+        :raises KeyError: if some columns are not in the profile.
+        """
+        profile = self.get_profile_view(name)
+        if columns is not None:
+            profile = profile.select(columns)
+        return profile.window(start, end).to_frame()
+
+    def get_profile_key(self, name):
+        """Return a hash of everything the transformed profile depends on: the raw
+        profile version and the labels and scaling factors of its columns. Two
+        scenarios with the same key have identical transformed profiles. The raw
+        profile is not loaded.
+
+        :param str name: either *'demand'*, *'hydro'*, *'solar'*, *'wind'*.
+        :return: (*str*) -- hexadecimal digest.
+        :raises ValueError: if argument not one of *'demand'*, *'hydro'*, *'solar'* or
+            *'wind'*.
+        """
+        possible = ["demand", "hydro", "solar", "wind"]
+        if name not in possible:
+            raise ValueError("Choose from %s" % " | ".join(possible))
+        version = {
+            "kind": name,
+            "grid_model": self.scenario_info.get("grid_model"),
+            "base": self.scenario_info[f"base_{name}"],
+        }
+        key = hashlib.sha256(json.dumps(version, sort_keys=True).encode())
+        if name == "demand":
+            zone_id, factor = self._get_demand_factor()
+            parts = [zone_id, zone_id, factor]
+        else:
+            plant_id = self._get_plant_id(name)
+            new_plant_ids, neighbor_ids, scaling = self._get_new_plant(name)
+            parts = [
+                np.concatenate([plant_id, new_plant_ids]),
+                np.concatenate([plant_id, neighbor_ids]),
+                np.concatenate(
+                    [self.grid.plant.loc[plant_id, "Pmax"].to_numpy(), scaling]
+                ),
+            ]
+        for dtype, values in zip(["int64", "int64", "float64"], parts):
+            key.update(np.asarray(values, dtype=dtype).tobytes())
+            key.update(b"|")
+        return key.hexdigest()
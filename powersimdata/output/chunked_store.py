@@ -0,0 +1,351 @@
+import io
+import json
+import os
+import struct
+import zlib
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix, csc_matrix
+
+_MAGIC = b"PSDCHK01"
+_HEADER_SIZE = struct.Struct("<Q")
+
+
+def _encode_array(array, level):
+    """Serializes and compresses an array.
+
+    :param numpy.ndarray array: array to encode.
+    :param int level: zlib compression level.
+    :return: (*bytes*) -- compressed block.
+    """
+    buf = io.BytesIO()
+    np.lib.format.write_array(buf, np.ascontiguousarray(array), allow_pickle=False)
+    return zlib.compress(buf.getvalue(), level)
+
+
+def _decode_array(block):
+    """Decompresses and deserializes an array.
+
+    :param bytes block: compressed block.
+    :return: (*numpy.ndarray*) -- decoded array.
+    """
+    buf = io.BytesIO(zlib.decompress(block))
+    return np.lib.format.read_array(buf, allow_pickle=False)
+
+
+def _encode_labels(labels):
+    """Converts an index into an array and a description of the index.
+
+    :param pandas.Index labels: index or columns of a data frame.
+    :return: (*tuple*) -- array of labels and dictionary of metadata.
+    :raises TypeError: if labels can not be stored without pickling.
+    """
+    meta = {"name": labels.name, "kind": "plain"}
+    if isinstance(labels, pd.DatetimeIndex):
+        if labels.tz is not None:
+            raise TypeError("time zone aware indices are not supported")
+        meta.update({"kind": "datetime", "freq": labels.freqstr})
+        return labels.asi8, meta
+    values = labels.to_numpy()
+    if values.dtype == object:
+        if not all(isinstance(v, str) for v in values):
+            raise TypeError("labels must be numbers or strings")
+        values = values.astype(str)
+    return values, meta
+
+
+def _decode_labels(values, meta):
+    """Rebuilds an index.
+
+    :param numpy.ndarray values: array of labels.
+    :param dict meta: description of the index.
+    :return: (*pandas.Index*) -- index.
+    """
+    if meta["kind"] == "datetime":
+        return pd.DatetimeIndex(values, name=meta["name"], freq=meta["freq"])
+    if values.dtype.kind == "U":
+        values = values.astype(object)
+    return pd.Index(values, name=meta["name"])
+
+
+def is_sparse_frame(df):
+    """Checks whether all columns of a data frame are sparse.
+
+    :param pandas.DataFrame df: data frame.
+    :return: (*bool*) -- whether the data frame is sparse.
+    """
+    return len(df.columns) > 0 and all(isinstance(d, pd.SparseDtype) for d in df.dtypes)
+
+
+def _get_dtype(df):
+    """Returns the data type shared by all columns of a data frame.
+
+    :param pandas.DataFrame df: data frame.
+    :return: (*numpy.dtype*) -- data type of values.
+    :raises TypeError: if columns have different or non numeric data types, or if
+        sparse columns are not filled with zeros.
+    """
+    dtypes = set(df.dtypes)
+    if is_sparse_frame(df):
+        if any(d.fill_value != 0 for d in dtypes):
+            raise TypeError("sparse columns must be filled with zeros")
+        dtypes = {d.subtype for d in dtypes}
+    if len(dtypes) > 1 or not all(
+        isinstance(d, np.dtype) and d.kind in "biuf" for d in dtypes
+    ):
+        raise TypeError("df must have a single numeric dtype")
+    return dtypes.pop() if len(dtypes) == 1 else np.dtype(float)
+
+
+def _encode_dense(values, chunks, level):
+    """Splits dense values in compressed blocks of rows and columns.
+
+    :param numpy.ndarray values: 2D array.
+    :param tuple chunks: number of rows and columns in each block.
+    :param int level: zlib compression level.
+    :return: (*list*) -- compressed blocks, in row major order.
+    """
+    n_rows, n_cols = values.shape
+    return [
+        _encode_array(values[i : i + chunks[0], j : j + chunks[1]], level)
+        for i in range(0, n_rows, chunks[0])
+        for j in range(0, n_cols, chunks[1])
+    ]
+
+
+def _encode_sparse(matrix, chunks, level):
+    """Splits a sparse matrix in compressed blocks of columns. The first block holds
+    the column pointers of the CSC representation, followed by the row indices and
+    the values of each block of columns.
+
+    :param scipy.sparse.csc_matrix matrix: sparse matrix.
+    :param tuple chunks: number of rows and columns in each block. Only the number
+        of columns is used.
+    :param int level: zlib compression level.
+    :return: (*list*) -- compressed blocks.
+    """
+    matrix.sort_indices()
+    indptr = matrix.indptr.astype(np.int64)
+    blocks = [_encode_array(indptr, level)]
+    for j in range(0, matrix.shape[1], chunks[1]):
+        lo, hi = indptr[j], indptr[min(j + chunks[1], matrix.shape[1])]
+        blocks.append(_encode_array(matrix.indices[lo:hi], level))
+        blocks.append(_encode_array(matrix.data[lo:hi], level))
+    return blocks
+
+
+def write_chunked(df, filepath, chunks=(744, 128), level=1, sparse=False, source=None):
+    """Writes a data frame in a chunked, compressed, columnar file. Values are split
+    in blocks of rows and columns compressed independently, so that a time window
+    or a subset of columns can be read without decoding the whole file. Sparse data
+    frames, or dense ones when requested, are stored as compressed sparse columns
+    split in blocks of columns. The file is written under a temporary name and then
+    renamed.
+
+    :param pandas.DataFrame df: data frame with a single numeric data type.
+    :param str filepath: path to file.
+    :param tuple chunks: number of rows and columns in each block.
+    :param int level: zlib compression level.
+    :param bool sparse: store a dense data frame in the sparse layout. Sparse data
+        frames are always stored in the sparse layout.
+    :param dict source: description of the file the data frame was read from, see
+        :func:`read_chunked_source`.
+    :raises TypeError: if the data frame can not be stored in this format.
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("df must be a pandas.DataFrame")
+    dtype = _get_dtype(df)
+
+    index, index_meta = _encode_labels(df.index)
+    columns, columns_meta = _encode_labels(df.columns)
+    blocks = [_encode_array(index, level), _encode_array(columns, level)]
+    if is_sparse_frame(df):
+        layout = "sparse"
+        blocks += _encode_sparse(df.sparse.to_coo().tocsc(), chunks, level)
+    elif sparse:
+        layout = "sparse"
+        blocks += _encode_sparse(csc_matrix(df.to_numpy()), chunks, level)
+    else:
+        layout = "dense"
+        blocks += _encode_dense(df.to_numpy(), chunks, level)
+    header = json.dumps(
+        {
+            "layout": layout,
+            "shape": list(df.shape),
+            "dtype": dtype.str,
+            "chunks": list(chunks),
+            "index": index_meta,
+            "columns": columns_meta,
+            "blocks": [len(b) for b in blocks],
+            "source": source,
+        }
+    ).encode()
+
+    tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_filepath, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_HEADER_SIZE.pack(len(header)))
+        f.write(header)
+        for b in blocks:
+            f.write(b)
+    os.replace(tmp_filepath, filepath)
+
+
+def _read_header(f, filepath):
+    """Reads the header of a file written by :func:`write_chunked`.
+
+    :param io.BufferedReader f: file object, positioned at the start of the file.
+    :param str filepath: path to file.
+    :return: (*dict*) -- header.
+    :raises ValueError: if the file is not a chunked file or is corrupted.
+    """
+    if f.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError(f"{filepath} is not a chunked output file")
+    try:
+        (size,) = _HEADER_SIZE.unpack(f.read(_HEADER_SIZE.size))
+        return json.loads(f.read(size))
+    except (struct.error, ValueError) as e:
+        raise ValueError(f"Unable to read {filepath}, possibly corrupted: {e}")
+
+
+def get_source(filepath):
+    """Describes a file by its size and modification time.
+
+    :param str filepath: path to file.
+    :return: (*dict*) -- description of the file.
+    """
+    stat = os.stat(filepath)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def read_chunked_source(filepath):
+    """Reads the description of the file a chunked file was built from.
+
+    :param str filepath: path to file written by :func:`write_chunked`.
+    :return: (*dict*) -- description of the source file, as returned by
+        :func:`get_source`, or None if the chunked file was not built from a file.
+    :raises ValueError: if the file is not a chunked file or is corrupted.
+    """
+    with open(filepath, "rb") as f:
+        return _read_header(f, filepath).get("source")
+
+
+def read_chunked(filepath, start=None, end=None, columns=None):
+    """Reads a data frame written by :func:`write_chunked`. Only blocks overlapping
+    the requested rows and columns are read and decompressed. Data stored in the
+    sparse layout is returned as a sparse data frame, without being densified.
+
+    :param str filepath: path to file.
+    :param start: first label of the rows to read, included. Defaults to the first
+        row.
+    :param end: last label of the rows to read, included. Defaults to the last row.
+    :param list columns: labels of the columns to read, in order. Defaults to all
+        columns.
+    :return: (*pandas.DataFrame*) -- data frame.
+    :raises ValueError: if the file is not a chunked file or is corrupted.
+    :raises KeyError: if some columns are not in the file.
+    """
+    with open(filepath, "rb") as f:
+        header = _read_header(f, filepath)
+        try:
+            offset = np.cumsum([f.tell()] + header["blocks"])
+
+            def read_block(i):
+                f.seek(offset[i])
+                return _decode_array(f.read(header["blocks"][i]))
+
+            index = _decode_labels(read_block(0), header["index"])
+            labels = _decode_labels(read_block(1), header["columns"])
+            row_start, row_end, _ = index.slice_indexer(start, end).indices(len(index))
+            row_end = max(row_start, row_end)
+
+            if columns is None:
+                out_columns = labels
+                position = np.arange(len(labels))
+            else:
+                out_columns = pd.Index(columns, name=labels.name)
+                position = labels.get_indexer(out_columns)
+                if (position == -1).any():
+                    missing = list(out_columns[position == -1])
+                    raise KeyError(f"{missing} not in {os.path.basename(filepath)}")
+
+            sparse = header.get("layout", "dense") == "sparse"
+            decode = _decode_sparse if sparse else _decode_dense
+            out = decode(read_block, header, row_start, row_end, position)
+        except (zlib.error, struct.error, EOFError) as e:
+            raise ValueError(f"Unable to read {filepath}, possibly corrupted: {e}")
+
+    if sparse:
+        return pd.DataFrame.sparse.from_spmatrix(
+            out, index=index[row_start:row_end], columns=out_columns
+        )
+    return pd.DataFrame(out, index=index[row_start:row_end], columns=out_columns)
+
+
+def _decode_dense(read_block, header, row_start, row_end, position):
+    """Reads values stored in the dense layout.
+
+    :param callable read_block: function decoding a block given its number.
+    :param dict header: file header.
+    :param int row_start: first row to read.
+    :param int row_end: row following the last row to read.
+    :param numpy.ndarray position: positions of the columns to read.
+    :return: (*numpy.ndarray*) -- values.
+    """
+    n_rows, n_cols = header["chunks"]
+    n_col_blocks = -(-header["shape"][1] // n_cols)
+    out = np.empty((row_end - row_start, len(position)), dtype=header["dtype"])
+    col_block = position // n_cols
+    for j in np.unique(col_block):
+        selected = np.flatnonzero(col_block == j)
+        local = position[selected] - j * n_cols
+        for i in range(row_start // n_rows, -(-row_end // n_rows)):
+            lo, hi = max(row_start, i * n_rows), min(row_end, (i + 1) * n_rows)
+            if lo >= hi:
+                continue
+            block = read_block(2 + i * n_col_blocks + j)
+            out[lo - row_start : hi - row_start, selected] = block[
+                lo - i * n_rows : hi - i * n_rows
+            ][:, local]
+    return out
+
+
+def _decode_sparse(read_block, header, row_start, row_end, position):
+    """Reads values stored in the sparse layout.
+
+    :param callable read_block: function decoding a block given its number.
+    :param dict header: file header.
+    :param int row_start: first row to read.
+    :param int row_end: row following the last row to read.
+    :param numpy.ndarray position: positions of the columns to read.
+    :return: (*scipy.sparse.coo_matrix*) -- values.
+    """
+    n_cols = header["chunks"][1]
+    indptr = read_block(2)
+    rows, cols, data = [], [], []
+    col_block = position // n_cols
+    for j in np.unique(col_block):
+        selected = np.flatnonzero(col_block == j)
+        indices, values = read_block(3 + 2 * j), read_block(4 + 2 * j)
+        start = indptr[position[selected]] - indptr[j * n_cols]
+        length = indptr[position[selected] + 1] - indptr[position[selected]]
+        offset = np.cumsum(length) - length
+        gather = np.arange(length.sum()) + np.repeat(start - offset, length)
+        row = indices[gather]
+        keep = (row >= row_start) & (row < row_end)
+        rows.append(row[keep] - row_start)
+        cols.append(np.repeat(selected, length)[keep])
+        data.append(values[gather][keep])
+    dtype = np.dtype(header["dtype"])
+    return coo_matrix(
+        (
+            np.concatenate(data) if data else np.empty(0, dtype=dtype),
+            (
+                np.concatenate(rows) if rows else np.empty(0, dtype=int),
+                np.concatenate(cols) if cols else np.empty(0, dtype=int),
+            ),
+        ),
+        shape=(row_end - row_start, len(position)),
+        dtype=dtype,
+    )
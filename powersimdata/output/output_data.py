@@ -1,14 +1,25 @@
 import os
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
-from scipy.sparse import coo_matrix
+from scipy.sparse import coo_matrix, csc_matrix
 
 from powersimdata.data_access.context import Context
 from powersimdata.input.input_data import get_bus_demand
+from powersimdata.output.chunked_store import (
+    get_source,
+    is_sparse_frame,
+    read_chunked,
+    read_chunked_source,
+    write_chunked,
+)
 from powersimdata.utility import server_setup
 
+#: fields made mostly of zeros, stored in the sparse layout.
+sparse_fields = {"LOAD_SHED", "CONGU", "CONGL"}
+
 
 class OutputData:
     """Load output data.
@@ -20,34 +31,161 @@ class OutputData:
         """Constructor"""
         self._data_access = Context.get_data_access(data_loc)
 
-    def get_data(self, scenario_id, field_name):
+    def get_data(
+        self, scenario_id, field_name, start=None, end=None, columns=None, sparse=None
+    ):
         """Returns data either from server or from local directory.
 
         :param str scenario_id: scenario id.
         :param str field_name: *'PG'*, *'PF'*, *'LMP'*, *'CONGU'*, *'CONGL'*,
             *'AVERAGED_CONG'*, *'STORAGE_PG'* or *'STORAGE_E'*.
+        :param start: first timestamp to load, included. Defaults to the first one.
+        :param end: last timestamp to load, included. Defaults to the last one.
+        :param list columns: columns to load. Defaults to all columns.
+        :param bool sparse: return a sparse data frame. Defaults to True for
+            *'LOAD_SHED'* and False otherwise.
         :return: (*pandas.DataFrame*) -- specified field as a data frame.
         :raises FileNotFoundError: if file not found on local machine.
         :raises ValueError: if second argument is not an allowable field.
         """
-        _check_field(field_name)
+        data = self.get_data_many(
+            scenario_id, [field_name], start, end, columns, sparse
+        )
+        return data[field_name]
+
+    def get_data_many(
+        self, scenario_id, field_names, start=None, end=None, columns=None, sparse=None
+    ):
+        """Returns several fields, transferring all missing files from the server in
+        one batch and loading files concurrently.
+
+        :param str scenario_id: scenario id.
+        :param list field_names: fields to load, see :meth:`get_data`.
+        :param start: first timestamp to load, included. Defaults to the first one.
+        :param end: last timestamp to load, included. Defaults to the last one.
+        :param list columns: columns to load in each field. Defaults to all columns.
+        :param bool sparse: return sparse data frames, see :meth:`get_data`.
+        :return: (*dict*) -- data frames keyed by field name.
+        :raises ValueError: if a field is not allowable or a file cannot be
+            read.
+        """
+        for f in field_names:
+            _check_field(f)
 
-        print("--> Loading %s" % field_name)
-        file_name = scenario_id + "_" + field_name + ".pkl"
         from_dir = server_setup.OUTPUT_DIR
-        filepath = os.path.join(server_setup.LOCAL_DIR, *from_dir, file_name)
+        missing = []
+        for f in field_names:
+            print("--> Loading %s" % f)
+            filepath = _get_filepath(scenario_id, f)
+            if not os.path.isfile(filepath + ".chunked") and not os.path.isfile(
+                filepath + ".pkl"
+            ):
+                print(f"{filepath}.pkl not found on local machine")
+                missing.append(f"{scenario_id}_{f}.pkl")
+
+        if len(missing) > 0:
+            remote_dir = self._data_access.join(*from_dir)
+            self._data_access.copy_from_many(missing, remote_dir)
+
+        def read(field_name):
+            filepath = _get_filepath(scenario_id, field_name)
+            data = _read_output(
+                filepath, start, end, columns, field_name in sparse_fields
+            )
+            as_sparse = field_name == "LOAD_SHED" if sparse is None else sparse
+            return _to_sparse(data) if as_sparse else _to_dense(data)
+
+        with ThreadPoolExecutor(max_workers=min(len(field_names), 8) or 1) as pool:
+            return dict(zip(field_names, pool.map(read, field_names)))
+
+    def save_data(self, scenario_id, field_name, data):
+        """Saves data in the local output directory.
+
+        :param str scenario_id: scenario id.
+        :param str field_name: output field, see :meth:`get_data`.
+        :param pandas.DataFrame data: data frame.
+        :raises ValueError: if second argument is not an allowable field.
+        """
+        _check_field(field_name)
+        filepath = _get_filepath(scenario_id, field_name)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        write_chunked(data, filepath + ".chunked", sparse=field_name in sparse_fields)
 
-        try:
-            return pd.read_pickle(filepath)
-        except pickle.UnpicklingError:
-            err_msg = f"Unable to unpickle {file_name}, possibly corrupted in download."
-            raise ValueError(err_msg)
-        except FileNotFoundError:
-            print(f"{filepath} not found on local machine")
 
-        remote_dir = self._data_access.join(*from_dir)
-        self._data_access.copy_from(file_name, remote_dir)
-        return pd.read_pickle(filepath)
+def _get_filepath(scenario_id, field_name):
+    """Returns the local path of an output file, without extension.
+
+    :param str scenario_id: scenario id.
+    :param str field_name: output field.
+    :return: (*str*) -- path to file.
+    """
+    file_name = scenario_id + "_" + field_name
+    return os.path.join(server_setup.LOCAL_DIR, *server_setup.OUTPUT_DIR, file_name)
+
+
+def _to_sparse(df):
+    """Converts a data frame to a sparse data frame filled with zeros.
+
+    :param pandas.DataFrame df: data frame.
+    :return: (*pandas.DataFrame*) -- sparse data frame.
+    """
+    if is_sparse_frame(df) or len(df.columns) == 0:
+        return df
+    return pd.DataFrame.sparse.from_spmatrix(
+        csc_matrix(df.to_numpy()), index=df.index, columns=df.columns
+    )
+
+
+def _to_dense(df):
+    """Converts a sparse data frame to a dense data frame.
+
+    :param pandas.DataFrame df: data frame.
+    :return: (*pandas.DataFrame*) -- dense data frame.
+    """
+    return df.sparse.to_dense() if is_sparse_frame(df) else df
+
+
+def _read_output(filepath, start=None, end=None, columns=None, sparse=False):
+    """Reads an output file from the local output directory. The chunked columnar
+    file is read if present and up to date, otherwise the pickle file is loaded and
+    converted to the chunked format for subsequent reads, when possible. A chunked
+    file built from a pickle file is out of date when the size or the modification
+    time of the pickle file has changed since.
+
+    :param str filepath: path to file, without extension.
+    :param start: first timestamp to load, included.
+    :param end: last timestamp to load, included.
+    :param list columns: columns to load.
+    :param bool sparse: whether the chunked file uses the sparse layout.
+    :return: (*pandas.DataFrame*) -- data frame, sparse if stored as such.
+    :raises ValueError: if file cannot be read.
+    """
+    if os.path.isfile(filepath + ".chunked"):
+        source = read_chunked_source(filepath + ".chunked")
+        if (
+            source is None
+            or not os.path.isfile(filepath + ".pkl")
+            or source == get_source(filepath + ".pkl")
+        ):
+            return read_chunked(filepath + ".chunked", start, end, columns)
+
+    try:
+        data = pd.read_pickle(filepath + ".pkl")
+    except pickle.UnpicklingError:
+        file_name = os.path.basename(filepath) + ".pkl"
+        err_msg = f"Unable to unpickle {file_name}, possibly corrupted in download."
+        raise ValueError(err_msg)
+    try:
+        write_chunked(
+            data,
+            filepath + ".chunked",
+            sparse=sparse,
+            source=get_source(filepath + ".pkl"),
+        )
+    except TypeError:
+        pass
+    data = data.loc[start:end]
+    return data if columns is None else data[columns]
 
 
 def _check_field(field_name):
@@ -87,28 +225,32 @@ def construct_load_shed(scenario_info, grid, infeasibilities=None):
     """
     hours = pd.date_range(
         start=scenario_info["start_date"], end=scenario_info["end_date"], freq="1H"
-    ).tolist()
+    )
     buses = grid.bus.index
+    load_shed = coo_matrix((len(hours), len(buses)))
     if infeasibilities is None:
         print("No infeasibilities, constructing DataFrame")
-        load_shed_data = coo_matrix((len(hours), len(buses)))
-        load_shed = pd.DataFrame.sparse.from_spmatrix(load_shed_data)
     else:
         print("Infeasibilities, constructing DataFrame")
-        bus_demand = get_bus_demand(scenario_info, grid)
-        load_shed = np.zeros((len(hours), len(buses)))
         # Convert '24H' to 24
         interval = int(scenario_info["interval"][:-1])
+        bus_demand = get_bus_demand(scenario_info, grid, start=hours[0], end=hours[-1])
+        bus_demand = bus_demand[buses].to_numpy()
+        rows, cols, data = [load_shed.row], [load_shed.col], [load_shed.data]
         for i, v in infeasibilities.items():
             start = i * interval
-            end = (i + 1) * interval
-            base_demand = bus_demand.iloc[start:end, :].to_numpy()
-            shed_demand = base_demand * (v / 100)
-            load_shed[start:end, :] = shed_demand
-        load_shed = pd.DataFrame(load_shed, columns=buses, index=hours)
-        load_shed = load_shed.astype(pd.SparseDtype("float", 0))
-    load_shed.index = hours
+            if start >= len(hours):
+                continue
+            end = min((i + 1) * interval, len(hours))
+            shed_demand = coo_matrix(bus_demand[start:end] * (v / 100))
+            rows.append(shed_demand.row + start)
+            cols.append(shed_demand.col)
+            data.append(shed_demand.data)
+        load_shed = coo_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+            shape=load_shed.shape,
+        )
+    load_shed = pd.DataFrame.sparse.from_spmatrix(load_shed, index=hours, columns=buses)
     load_shed.index.name = "UTC"
-    load_shed.columns = buses
 
     return load_shed
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from powersimdata.output.chunked_store import (
+    get_source,
+    read_chunked,
+    read_chunked_source,
+    write_chunked,
+)
+
+
+@pytest.fixture
+def df():
+    index = pd.date_range("2016-01-01", periods=100, freq="H", name="UTC")
+    columns = pd.Index(np.arange(101, 124), name="plant_id")
+    values = np.random.default_rng(0).random((100, 23))
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+@pytest.fixture
+def filepath(df, tmp_path):
+    filepath = str(tmp_path / "1_PG.chunked")
+    write_chunked(df, filepath, chunks=(24, 5))
+    return filepath
+
+
+def test_read_chunked(df, filepath):
+    result = read_chunked(filepath)
+    pd.testing.assert_frame_equal(result, df)
+    assert result.index.freq == df.index.freq
+
+
+def test_read_chunked_time_range(df, filepath):
+    start, end = "2016-01-01 20:00", "2016-01-03 03:00"
+    pd.testing.assert_frame_equal(
+        read_chunked(filepath, start=start, end=end), df.loc[start:end]
+    )
+    pd.testing.assert_frame_equal(read_chunked(filepath, end=start), df.loc[:start])
+
+
+def test_read_chunked_columns(df, filepath):
+    columns = [122, 101, 107, 108]
+    result = read_chunked(filepath, start="2016-01-02", columns=columns)
+    pd.testing.assert_frame_equal(result, df.loc["2016-01-02":, columns])
+    with pytest.raises(KeyError):
+        read_chunked(filepath, columns=[101, 1])
+
+
+def test_write_chunked_labels(tmp_path):
+    df = pd.DataFrame(
+        {"CONGL": [0.0, 1.0], "CONGU": [2.0, 0.0]}, index=pd.Index([5, 9], name="id")
+    )
+    filepath = str(tmp_path / "1_AVERAGED_CONG.chunked")
+    write_chunked(df, filepath)
+    pd.testing.assert_frame_equal(read_chunked(filepath), df)
+    pd.testing.assert_frame_equal(
+        read_chunked(filepath, columns=["CONGU"]), df[["CONGU"]]
+    )
+
+
+def test_write_chunked_source(df, filepath, tmp_path):
+    assert read_chunked_source(filepath) is None
+    source = get_source(filepath)
+    other = str(tmp_path / "other.chunked")
+    write_chunked(df, other, source=source)
+    assert read_chunked_source(other) == source
+
+
+def test_write_chunked_unsupported(tmp_path):
+    filepath = str(tmp_path / "foo.chunked")
+    with pytest.raises(TypeError):
+        write_chunked(pd.DataFrame({"a": [1.0], "b": ["foo"]}), filepath)
+    with pytest.raises(TypeError):
+        write_chunked(pd.DataFrame({"a": [1.0]}).astype(pd.SparseDtype()), filepath)
+
+
+def test_read_chunked_corrupted(filepath):
+    with open(filepath, "r+b") as f:
+        f.seek(-10, 2)
+        f.write(b"0" * 10)
+    with pytest.raises(ValueError):
+        read_chunked(filepath)
+    with open(filepath, "wb") as f:
+        f.write(b"foo")
+    with pytest.raises(ValueError):
+        read_chunked(filepath)
+
+
+@pytest.fixture
+def sparse_df(df):
+    values = df.to_numpy()
+    values[values < 0.9] = 0
+    return pd.DataFrame(values, index=df.index, columns=df.columns)
+
+
+@pytest.mark.parametrize("as_sparse_frame", [True, False])
+def test_sparse_layout(sparse_df, tmp_path, as_sparse_frame):
+    filepath = str(tmp_path / "1_CONGU.chunked")
+    if as_sparse_frame:
+        write_chunked(sparse_df.astype(pd.SparseDtype(float, 0)), filepath, (24, 5))
+    else:
+        write_chunked(sparse_df, filepath, (24, 5), sparse=True)
+    result = read_chunked(filepath)
+    assert all(isinstance(d, pd.SparseDtype) for d in result.dtypes)
+    pd.testing.assert_frame_equal(result.sparse.to_dense(), sparse_df)
+
+    start, end, columns = "2016-01-02 03:00", "2016-01-03", [120, 103, 104]
+    result = read_chunked(filepath, start=start, end=end, columns=columns)
+    pd.testing.assert_frame_equal(
+        result.sparse.to_dense(), sparse_df.loc[start:end, columns]
+    )
+    assert (
+        result.sparse.to_coo().nnz
+        == (sparse_df.loc[start:end, columns] != 0).sum().sum()
+    )
+
+
+def test_sparse_layout_empty(tmp_path):
+    index = pd.date_range("2016-01-01", periods=10, freq="H", name="UTC")
+    df = pd.DataFrame(0.0, index=index, columns=[1, 2, 3])
+    filepath = str(tmp_path / "1_LOAD_SHED.chunked")
+    write_chunked(df, filepath, sparse=True)
+    pd.testing.assert_frame_equal(read_chunked(filepath).sparse.to_dense(), df)
+    assert read_chunked(filepath, columns=[]).shape == (10, 0)
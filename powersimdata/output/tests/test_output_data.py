@@ -0,0 +1,146 @@
+import os
+
+import pandas as pd
+import pytest
+from scipy.sparse import coo_matrix
+
+from powersimdata.data_access.data_access import DataAccess
+from powersimdata.output import output_data as output_data_module
+from powersimdata.output.output_data import OutputData, construct_load_shed
+from powersimdata.tests.mock_grid import MockGrid
+from powersimdata.utility import server_setup
+
+
+class FakeServer(DataAccess):
+    """Writes requested output files in the local output directory"""
+
+    def __init__(self, frames):
+        super().__init__("dummy")
+        self.frames = frames
+        self.requests = []
+
+    def copy_from_many(self, file_names, from_dir=None):
+        self.requests.append(list(file_names))
+        for f in file_names:
+            self.frames[f].to_pickle(_get_path(f))
+
+
+def _get_path(file_name):
+    return os.path.join(server_setup.LOCAL_DIR, *server_setup.OUTPUT_DIR, file_name)
+
+
+@pytest.fixture
+def output_data(tmp_path, monkeypatch):
+    monkeypatch.setattr(server_setup, "LOCAL_DIR", str(tmp_path))
+    os.makedirs(_get_path(""))
+    frames = {
+        f"1_{f}.pkl": pd.DataFrame({f: range(3)}) for f in ["PG", "PF", "LMP", "CONGU"]
+    }
+    frames["1_PG.pkl"].to_pickle(_get_path("1_PG.pkl"))
+    output_data = OutputData()
+    output_data._data_access = FakeServer(frames)
+    return output_data
+
+
+def test_get_data_many(output_data):
+    data = output_data.get_data_many("1", ["PG", "PF", "LMP"])
+    assert list(data) == ["PG", "PF", "LMP"]
+    for f, df in data.items():
+        assert df.columns.tolist() == [f]
+    assert output_data._data_access.requests == [["1_PF.pkl", "1_LMP.pkl"]]
+
+
+def test_get_data_uses_local_file(output_data):
+    pg = output_data.get_data("1", "PG")
+    assert pg.columns.tolist() == ["PG"]
+    assert output_data._data_access.requests == []
+
+
+def test_get_data_many_invalid_field(output_data):
+    with pytest.raises(ValueError):
+        output_data.get_data_many("1", ["PG", "FOO"])
+
+
+def test_get_data_corrupted_file(output_data):
+    with open(_get_path("1_PG.pkl"), "wb") as f:
+        f.write(b"\x80\x04garbage")
+    with pytest.raises(ValueError):
+        output_data.get_data("1", "PG")
+
+
+def test_get_data_converts_pickle(output_data):
+    pg = output_data.get_data("1", "PG")
+    assert os.path.isfile(_get_path("1_PG.chunked"))
+    os.remove(_get_path("1_PG.pkl"))
+    pd.testing.assert_frame_equal(output_data.get_data("1", "PG"), pg)
+    pd.testing.assert_frame_equal(
+        output_data.get_data("1", "PG", start=1, end=1, columns=["PG"]), pg.loc[1:1]
+    )
+
+
+def test_get_data_pickle_updated(output_data):
+    output_data.get_data("1", "PG")
+    pg = pd.DataFrame({"PG": [4, 5, 6, 7]})
+    pg.to_pickle(_get_path("1_PG.pkl"))
+    pd.testing.assert_frame_equal(output_data.get_data("1", "PG"), pg)
+    os.remove(_get_path("1_PG.pkl"))
+    pd.testing.assert_frame_equal(output_data.get_data("1", "PG"), pg)
+
+
+def test_save_data_is_not_replaced_by_pickle(output_data):
+    pg = pd.DataFrame({"PG": [4.0, 5.0]})
+    output_data.save_data("1", "PG", pg)
+    pd.testing.assert_frame_equal(output_data.get_data("1", "PG"), pg)
+
+
+def test_get_data_sparse_fields(output_data):
+    congu = pd.DataFrame({1: [0.0, 2.0, 0.0], 2: [0.0, 0.0, 0.0]})
+    congu.to_pickle(_get_path("1_CONGU.pkl"))
+    pd.testing.assert_frame_equal(output_data.get_data("1", "CONGU"), congu)
+    sparse = output_data.get_data("1", "CONGU", sparse=True)
+    assert sparse.sparse.density == 1 / 6
+    pd.testing.assert_frame_equal(sparse.sparse.to_dense(), congu)
+
+
+def test_save_load_shed(output_data):
+    load_shed = pd.DataFrame.sparse.from_spmatrix(
+        coo_matrix(([1.0], ([1], [0])), shape=(3, 2))
+    )
+    output_data.save_data("1", "LOAD_SHED", load_shed)
+    result = output_data.get_data("1", "LOAD_SHED")
+    assert all(isinstance(d, pd.SparseDtype) for d in result.dtypes)
+    pd.testing.assert_frame_equal(result.sparse.to_dense(), load_shed.sparse.to_dense())
+    assert output_data._data_access.requests == []
+
+
+def test_construct_load_shed(monkeypatch):
+    grid = MockGrid({"bus": {"bus_id": [4, 5, 6], "Pd": [1, 1, 1]}})
+    scenario_info = {
+        "start_date": "2016-01-01 00:00:00",
+        "end_date": "2016-01-02 23:00:00",
+        "interval": "6H",
+    }
+    hours = pd.date_range("2016-01-01", periods=48, freq="H")
+    demand = pd.DataFrame({6: range(48), 4: range(48), 5: 0.0}, index=hours)
+
+    calls = []
+
+    def get_bus_demand(scenario_info, grid, start=None, end=None):
+        calls.append((start, end))
+        return demand.loc[start:end]
+
+    monkeypatch.setattr(output_data_module, "get_bus_demand", get_bus_demand)
+    load_shed = construct_load_shed(scenario_info, grid, {1: 50, 3: 10, 8: 20})
+    assert calls == [(hours[0], hours[-1])]
+    assert load_shed.shape == (48, 3)
+    assert load_shed.index.name == "UTC"
+    assert all(isinstance(d, pd.SparseDtype) for d in load_shed.dtypes)
+    expected = pd.DataFrame(0.0, index=load_shed.index, columns=[4, 5, 6])
+    expected.iloc[6:12] = demand[[4, 5, 6]].iloc[6:12].to_numpy() * 0.5
+    expected.iloc[18:24] = demand[[4, 5, 6]].iloc[18:24].to_numpy() * 0.1
+    pd.testing.assert_frame_equal(
+        load_shed.sparse.to_dense(), expected, check_names=False, check_freq=False
+    )
+
+    empty = construct_load_shed(scenario_info, grid)
+    assert empty.sparse.to_coo().nnz == 0
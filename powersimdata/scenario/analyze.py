@@ -1,14 +1,9 @@
-import os
-import pickle
-
 import pandas as pd
 
 from powersimdata.input.grid import Grid
 from powersimdata.input.input_data import InputData
-from powersimdata.input.transform_profile import TransformProfile
 from powersimdata.output.output_data import OutputData, construct_load_shed
 from powersimdata.scenario.ready import Ready
-from powersimdata.utility import server_setup
 
 
 class Analyze(Ready):
@@ -26,6 +21,7 @@ class Analyze(Ready):
         "get_dcline_pf",
         "get_lmp",
         "get_load_shed",
+        "get_outputs",
         "get_pf",
         "get_pg",
         "get_storage_e",
@@ -49,6 +45,7 @@ class Analyze(Ready):
 
         self._set_allowed_state()
         self._set_ct_and_grid()
+        self._output_data = OutputData(data_loc=self.data_loc)
 
     def _set_allowed_state(self):
         """Sets allowed state."""
@@ -110,63 +107,89 @@ class Analyze(Ready):
                     )
                 )
 
-    def get_pg(self):
+    def get_pg(self, start=None, end=None, columns=None):
         """Returns PG data frame.
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: plant ids. Defaults to all columns.
         :return: (*pandas.DataFrame*) -- data frame of power generated.
         """
-        output_data = OutputData(data_loc=self.data_loc)
-        pg = output_data.get_data(self._scenario_info["id"], "PG")
+        pg = self._output_data.get_data(
+            self._scenario_info["id"], "PG", start, end, columns
+        )
 
         return pg
 
-    def get_pf(self):
+    def get_pf(self, start=None, end=None, columns=None):
         """Returns PF data frame.
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: branch ids. Defaults to all columns.
         :return: (*pandas.DataFrame*) -- data frame of power flow.
         """
-        output_data = OutputData(data_loc=self.data_loc)
-        pf = output_data.get_data(self._scenario_info["id"], "PF")
+        pf = self._output_data.get_data(
+            self._scenario_info["id"], "PF", start, end, columns
+        )
 
         return pf
 
-    def get_dcline_pf(self):
+    def get_dcline_pf(self, start=None, end=None, columns=None):
         """Returns PF_DCLINE data frame.
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: dc line ids. Defaults to all columns.
         :return: (*pandas.DataFrame*) -- data frame of power flow on DC line(s).
         """
-        output_data = OutputData(data_loc=self.data_loc)
-        dcline_pf = output_data.get_data(self._scenario_info["id"], "PF_DCLINE")
+        dcline_pf = self._output_data.get_data(
+            self._scenario_info["id"], "PF_DCLINE", start, end, columns
+        )
 
         return dcline_pf
 
-    def get_lmp(self):
+    def get_lmp(self, start=None, end=None, columns=None):
         """Returns LMP data frame. LMP = locational marginal price
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: bus ids. Defaults to all columns.
         :return: (*pandas.DataFrame*) -- data frame of nodal prices.
         """
-        output_data = OutputData(data_loc=self.data_loc)
-        lmp = output_data.get_data(self._scenario_info["id"], "LMP")
+        lmp = self._output_data.get_data(
+            self._scenario_info["id"], "LMP", start, end, columns
+        )
 
         return lmp
 
-    def get_congu(self):
+    def get_congu(self, start=None, end=None, columns=None, sparse=False):
         """Returns CONGU data frame. CONGU = Congestion, Upper flow limit
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: branch ids. Defaults to all columns.
+        :param bool sparse: return a sparse data frame, without densifying values.
         :return: (*pandas.DataFrame*) -- data frame of branch flow mu (upper).
         """
-        output_data = OutputData(data_loc=self.data_loc)
-        congu = output_data.get_data(self._scenario_info["id"], "CONGU")
+        congu = self._output_data.get_data(
+            self._scenario_info["id"], "CONGU", start, end, columns, sparse
+        )
 
         return congu
 
-    def get_congl(self):
+    def get_congl(self, start=None, end=None, columns=None, sparse=False):
         """Returns CONGL data frame. CONGL = Congestion, Lower flow limit
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: branch ids. Defaults to all columns.
+        :param bool sparse: return a sparse data frame, without densifying values.
         :return: (*pandas.DataFrame*) -- data frame of branch flow mu (lower).
         """
-        output_data = OutputData(data_loc=self.data_loc)
-        congl = output_data.get_data(self._scenario_info["id"], "CONGL")
+        congl = self._output_data.get_data(
+            self._scenario_info["id"], "CONGL", start, end, columns, sparse
+        )
 
         return congl
 
@@ -176,65 +199,84 @@ class Analyze(Ready):
         :return: (*pandas.DataFrame*) -- data frame of averaged congestion with
             the branch id as indices an the averaged CONGL and CONGU as columns.
         """
-        output_data = OutputData(data_loc=self.data_loc)
-        mean_cong = output_data.get_data(self._scenario_info["id"], "AVERAGED_CONG")
+        mean_cong = self._output_data.get_data(
+            self._scenario_info["id"], "AVERAGED_CONG"
+        )
 
         return mean_cong
 
-    def get_storage_pg(self):
+    def get_storage_pg(self, start=None, end=None, columns=None):
         """Returns STORAGE_PG data frame.
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: storage ids. Defaults to all columns.
         :return: (*pandas.DataFrame*) -- data frame of power generated by
             storage units.
         """
-        output_data = OutputData(data_loc=self.data_loc)
-        storage_pg = output_data.get_data(self._scenario_info["id"], "STORAGE_PG")
+        storage_pg = self._output_data.get_data(
+            self._scenario_info["id"], "STORAGE_PG", start, end, columns
+        )
 
         return storage_pg
 
-    def get_storage_e(self):
+    def get_storage_e(self, start=None, end=None, columns=None):
         """Returns STORAGE_E data frame. Energy state of charge.
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: storage ids. Defaults to all columns.
         :return: (*pandas.DataFrame*) -- data frame of energy state of charge.
         """
-        output_data = OutputData(data_loc=self.data_loc)
-        storage_e = output_data.get_data(self._scenario_info["id"], "STORAGE_E")
+        storage_e = self._output_data.get_data(
+            self._scenario_info["id"], "STORAGE_E", start, end, columns
+        )
 
         return storage_e
 
     def get_load_shed(self):
         """Returns LOAD_SHED data frame, either via loading or calculating.
 
-        :return: (*pandas.DataFrame*) -- data frame of load shed (hour x bus).
+        :return: (*pandas.DataFrame*) -- sparse data frame of load shed (hour x bus).
         """
         scenario_id = self._scenario_info["id"]
         try:
             # It's either on the server or in our local ScenarioData folder
-            output_data = OutputData(data_loc=self.data_loc)
-            load_shed = output_data.get_data(scenario_id, "LOAD_SHED")
+            load_shed = self._output_data.get_data(scenario_id, "LOAD_SHED")
         except OSError:
             # The scenario was run without load_shed, and we must construct it
             grid = self.get_grid()
             infeasibilities = self._parse_infeasibilities()
             load_shed = construct_load_shed(self._scenario_info, grid, infeasibilities)
-
-            filename = scenario_id + "_LOAD_SHED.pkl"
-            output_dir = server_setup.OUTPUT_DIR
-            filepath = os.path.join(server_setup.LOCAL_DIR, output_dir, filename)
-            with open(filepath, "wb") as f:
-                pickle.dump(load_shed, f)
+            self._output_data.save_data(scenario_id, "LOAD_SHED", load_shed)
 
         return load_shed
 
-    def get_demand(self, original=True):
+    def get_outputs(self, fields):
+        """Returns several output data frames at once. Files missing on the local
+        machine are transferred in one batch and all files are loaded concurrently.
+
+        :param list fields: output fields, e.g. *'PG'*, *'PF'*, *'LMP'*,
+            *'CONGU'*, *'CONGL'* or *'LOAD_SHED'*.
+        :return: (*dict*) -- data frames keyed by field.
+        """
+        batch = [f for f in fields if f != "LOAD_SHED"]
+        outputs = self._output_data.get_data_many(self._scenario_info["id"], batch)
+        if "LOAD_SHED" in fields:
+            outputs["LOAD_SHED"] = self.get_load_shed()
+        return {f: outputs[f] for f in fields}
+
+    def get_demand(self, original=True, start=None, end=None, columns=None):
         """Returns demand profiles.
 
         :param bool original: should the original demand profile or the
             potentially modified one be returned.
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: zone ids. Defaults to all zones.
         :return: (*pandas.DataFrame*) -- data frame of demand (hour, zone).
         """
-        profile = TransformProfile(self._scenario_info, self.get_grid(), self.get_ct())
-        demand = profile.get_profile("demand")
+        demand = self.get_profile("demand", start, end, columns)
 
         if original:
             return demand
@@ -263,3 +305,4 @@ class Analyze(Ready):
         """Cleans when leaving state."""
         del self.grid
         del self.ct
+        del self._output_data
@@ -8,7 +8,7 @@ import pandas as pd
 from powersimdata.input.change_table import ChangeTable
 from powersimdata.input.grid import Grid
 from powersimdata.input.input_data import InputData, get_bus_demand
-from powersimdata.input.transform_grid import TransformGrid
+from powersimdata.input.transform_grid import TransformGrid, get_dependent_tables
 from powersimdata.input.transform_profile import TransformProfile
 from powersimdata.network.model import ModelImmutables
 from powersimdata.scenario.execute import Execute
@@ -211,6 +211,8 @@ class _Builder:
 
         self.base_grid = Grid(interconnect, source=grid_model)
         self.change_table = ChangeTable(self.base_grid)
+        self._grid = None
+        self._grid_ct = {}
 
         self.existing = table[table.interconnect == self.interconnect]
 
@@ -233,8 +235,8 @@ class _Builder:
                     "grid_model": self.grid_model,
                     "base_%s" % kind: getattr(self, kind),
                 },
-                self.get_grid(),
-                self.get_ct(),
+                self._get_grid(),
+                self.change_table.ct,
             )
             return profile.get_profile(kind)
         else:
@@ -372,14 +374,56 @@ class _Builder:
 
         :return: (*powersimdata.input.grid.Grid*) -- a Grid object.
         """
-        return TransformGrid(self.base_grid, self.change_table.ct).get_grid()
+        return self._get_grid().mutable()
+
+    def _get_grid(self):
+        """Returns the transformed grid maintained by the builder. The grid is
+        transformed in full once. Afterwards, only the tables depending on the entries
+        of the change table modified since the last call are transformed again.
+
+        :return: (*powersimdata.input.grid.Grid*) -- a Grid object, not to be
+            modified.
+        """
+        ct = self.change_table.ct
+        if self._grid is None:
+            self._grid = TransformGrid(self.base_grid, ct).get_grid(check=True)
+        else:
+            changed = {
+                k
+                for k in ct.keys() | self._grid_ct.keys()
+                if k not in ct or k not in self._grid_ct or ct[k] != self._grid_ct[k]
+            }
+            tables = get_dependent_tables(changed, ct)
+            if len(tables) > 0:
+                self._update_grid(tables)
+        self._grid_ct = copy.deepcopy(ct)
+        return self._grid
+
+    def _update_grid(self, tables):
+        """Transforms some tables of the grid again.
+
+        :param set tables: names of the tables to transform.
+        """
+        ct = {
+            k: v
+            for k, v in self.change_table.ct.items()
+            if len(get_dependent_tables([k], self.change_table.ct) & tables) > 0
+        }
+        # Only copy the tables the change table entries modify or read
+        needed = tables | get_dependent_tables(ct.keys(), ct) | {"bus", "plant"}
+        grid = self.base_grid.view()
+        for t in set(TransformGrid.tables) - needed:
+            setattr(grid, t, None)
+        transformed = TransformGrid(grid, ct).get_grid()
+        for t in tables:
+            setattr(self._grid, t, getattr(transformed, t))
 
     def get_base_grid(self):
         """Returns original grid.
 
         :return: (*powersimdata.input.grid.Grid*) -- a Grid object.
         """
-        return copy.deepcopy(self.base_grid)
+        return self.base_grid.mutable()
 
     def __str__(self):
         return self.name
@@ -11,7 +11,9 @@ class Delete(Ready):
     exported_methods = {"delete_scenario"} | Ready.exported_methods
 
     def delete_scenario(self, confirm=True):
-        """Deletes scenario on server.
+        """Deletes scenario on server. Transformed profiles in the store shared by
+        all scenarios are kept, see
+        :meth:`powersimdata.scenario.execute.SimulationInput.prepare_profile`.
 
         :param bool confirm: prompt before each batch
         """
@@ -1,10 +1,14 @@
 import os
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 
 from powersimdata.data_access.context import Context
 from powersimdata.input.export_data import export_case_mat, export_transformed_profile
 from powersimdata.input.grid import Grid
 from powersimdata.input.input_data import InputData
 from powersimdata.input.transform_grid import TransformGrid
+from powersimdata.input.transform_profile import TransformProfile
 from powersimdata.scenario.ready import Ready
 from powersimdata.utility import server_setup
 from powersimdata.utility.config import get_deployment_mode
@@ -64,7 +68,7 @@ class Execute(Ready):
         if self._scenario_info["change_table"] == "Yes":
             input_data = InputData()
             self.ct = input_data.get_data(self._scenario_info, "ct")
-            self.grid = TransformGrid(base_grid, self.ct).get_grid()
+            self.grid = TransformGrid(base_grid, self.ct).get_grid(check=True)
         else:
             self.ct = {}
             self.grid = base_grid
@@ -104,10 +108,11 @@ class Execute(Ready):
                 self._data_access, self._scenario_info, self.grid, self.ct
             )
             si.create_folder()
-            for p in ["demand", "hydro", "solar", "wind"]:
-                si.prepare_profile(p, profiles_as)
-
-            si.prepare_mpc_file()
+            timings = si.prepare_all(["demand", "hydro", "solar", "wind"], profiles_as)
+            print(
+                "--> Prepared simulation inputs in "
+                + ", ".join(f"{k}: {v:.1f}s" for k, v in timings.items())
+            )
 
             prepared = "prepared"
             self._execute_list_manager.set_status(self.scenario_id, prepared)
@@ -194,6 +199,23 @@ class SimulationInput:
         self.scenario_id = scenario_info["id"]
 
         self.REL_TMP_DIR = self._data_access.tmp_folder(self.scenario_id)
+        self.REL_PROFILE_DIR = self._data_access.join(
+            server_setup.EXECUTE_DIR, "profiles"
+        )
+        self._move_lock = threading.Lock()
+
+    def _move_to(self, file_name, change_name_to, to_dir=None):
+        """Uploads a file in the simulation input folder. Uploads are done one at a
+        time since the data access may not be used from several threads at once.
+
+        :param str file_name: file name, located at the local root.
+        :param str change_name_to: name of the uploaded file.
+        :param str to_dir: folder to upload the file to. Defaults to the simulation
+            input folder.
+        """
+        to_dir = self.REL_TMP_DIR if to_dir is None else to_dir
+        with self._move_lock:
+            self._data_access.move_to(file_name, to_dir, change_name_to=change_name_to)
 
     def create_folder(self):
         """Creates folder on server that will enclose simulation inputs."""
@@ -208,32 +230,92 @@ class SimulationInput:
         file_path = os.path.join(server_setup.LOCAL_DIR, file_name)
         storage_file_path = os.path.join(server_setup.LOCAL_DIR, storage_file_name)
         print("Building MPC file")
-        export_case_mat(self.grid, file_path, storage_file_path)
-        self._data_access.move_to(
-            file_name, self.REL_TMP_DIR, change_name_to="case.mat"
-        )
+        export_case_mat(self.grid, file_path, storage_file_path, do_compression=True)
+        self._move_to(file_name, "case.mat")
         if len(self.grid.storage["gen"]) > 0:
-            self._data_access.move_to(
-                storage_file_name, self.REL_TMP_DIR, change_name_to="case_storage.mat"
+            self._move_to(storage_file_name, "case_storage.mat")
+
+    def _store_profile(self, file_name, stored_name):
+        """Uploads a profile to the profile store. The profile is uploaded under a
+        name unique to the scenario and then renamed, such that other scenarios never
+        see a partial file. A profile stored meanwhile under the same name by another
+        scenario is identical and is replaced.
+
+        :param str file_name: file name, located at the local root.
+        :param str stored_name: name of the profile in the store.
+        """
+        tmp_name = f"{stored_name}.{self.scenario_id}.tmp"
+        self._move_to(file_name, tmp_name, to_dir=self.REL_PROFILE_DIR)
+        with self._move_lock:
+            self._data_access.fs.move(
+                self._data_access.join(self.REL_PROFILE_DIR, tmp_name),
+                self._data_access.join(self.REL_PROFILE_DIR, stored_name),
+                overwrite=True,
             )
 
     def prepare_profile(self, kind, profile_as=None):
-        """Prepares profile for simulation.
+        """Prepares profile for simulation. Transformed profiles are kept in a store
+        shared by all scenarios, under a hash of the inputs they are built from, and
+        linked in the scenario folder. A profile already in the store is not built
+        again. Stored profiles are kept when scenarios are deleted, since other
+        scenarios may use them, and can be removed from the store at any time when
+        no simulation is being prepared.
 
         :param kind: one of *demand*, *'hydro'*, *'solar'* or *'wind'*.
         :param int/str profile_as: if given, copy profile from this scenario.
         """
         if profile_as is None:
-            file_name = "%s_%s.csv" % (self.scenario_id, kind)
-            filepath = os.path.join(server_setup.LOCAL_DIR, file_name)
-            export_transformed_profile(
-                kind, self._scenario_info, self.grid, self.ct, filepath
-            )
-
-            self._data_access.move_to(
-                file_name, self.REL_TMP_DIR, change_name_to=f"{kind}.csv"
-            )
+            tp = TransformProfile(self._scenario_info, self.grid, self.ct)
+            stored_name = f"{kind}_{tp.get_profile_key(kind)}.csv"
+            stored_path = self._data_access.join(self.REL_PROFILE_DIR, stored_name)
+            with self._move_lock:
+                is_stored = self._data_access.fs.exists(stored_path)
+            if is_stored:
+                print(f"--> Reusing {kind} profile {stored_name}")
+            else:
+                file_name = "%s_%s.csv" % (self.scenario_id, kind)
+                filepath = os.path.join(server_setup.LOCAL_DIR, file_name)
+                export_transformed_profile(
+                    kind, self._scenario_info, self.grid, self.ct, filepath
+                )
+                self._store_profile(file_name, stored_name)
+            dest = self._data_access.join(self.REL_TMP_DIR, f"{kind}.csv")
+            with self._move_lock:
+                self._data_access.link(stored_path, dest)
         else:
             from_dir = self._data_access.tmp_folder(profile_as)
             src = self._data_access.join(from_dir, f"{kind}.csv")
-            self._data_access.copy(src, self.REL_TMP_DIR)
+            with self._move_lock:
+                self._data_access.copy(src, self.REL_TMP_DIR)
+
+    def prepare_all(self, kinds, profile_as=None):
+        """Prepares the MATPOWER case file and the profiles concurrently. All steps
+        share the same grid and each file is uploaded as soon as it is built. If a
+        step fails, the steps not started yet are cancelled, the running ones are
+        awaited and the error of the first failed step is raised.
+
+        :param list kinds: kinds of profile to prepare.
+        :param int/str profile_as: if given, copy profiles from this scenario.
+        :return: (*dict*) -- time spent in seconds in each step, keyed by *'mpc'*
+            or profile kind.
+        """
+        self.grid = self.grid.view()
+        steps = {"mpc": self.prepare_mpc_file}
+        for kind in kinds:
+            steps[kind] = lambda kind=kind: self.prepare_profile(kind, profile_as)
+        timings = {}
+
+        def run(name):
+            tic = time.perf_counter()
+            steps[name]()
+            timings[name] = time.perf_counter() - tic
+
+        with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+            futures = [pool.submit(run, name) for name in steps]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in futures:
+                if not future.cancelled() and future.exception() is not None:
+                    raise future.exception()
+        return {name: timings[name] for name in steps if name in timings}
@@ -48,72 +48,89 @@ class Ready(State):
             source=self._scenario_info["grid_model"],
         )
 
-    def get_profile(self, kind):
+    def get_profile(self, kind, start=None, end=None, columns=None):
         """Returns demand, hydro, solar or wind  profile.
 
         :param str kind: either *'demand'*, *'hydro'*, *'solar'*, *'wind'*.
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: zone or plant ids. Defaults to all columns.
         :return: (*pandas.DataFrame*) -- profile.
         """
         profile = TransformProfile(self._scenario_info, self.get_grid(), self.get_ct())
-        return profile.get_profile(kind)
+        return profile.get_profile(kind, start, end, columns)
 
-    def get_hydro(self):
+    def get_hydro(self, start=None, end=None, columns=None):
         """Returns hydro profile
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: plant ids. Defaults to all hydro plants.
         :return: (*pandas.DataFrame*) -- data frame of hydro energy output.
         """
-        return self.get_profile("hydro")
+        return self.get_profile("hydro", start, end, columns)
 
-    def get_solar(self):
+    def get_solar(self, start=None, end=None, columns=None):
         """Returns solar profile
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: plant ids. Defaults to all solar plants.
         :return: (*pandas.DataFrame*) -- data frame of solar energy output.
         """
-        return self.get_profile("solar")
+        return self.get_profile("solar", start, end, columns)
 
-    def get_wind(self):
+    def get_wind(self, start=None, end=None, columns=None):
         """Returns wind profile
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: plant ids. Defaults to all wind plants.
         :return: (*pandas.DataFrame*) -- data frame of wind energy output.
         """
-        return self.get_profile("wind")
+        return self.get_profile("wind", start, end, columns)
 
-    def get_wind_onshore(self):
+    def get_wind_onshore(self, start=None, end=None):
         """Returns wind onshore profile
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
         :return: (*pandas.DataFrame*) -- data frame of wind energy output for onshore
             turbines
         """
-        wind = self.get_profile("wind")
         grid = self.get_grid()
         onshore_id = grid.plant.groupby(["type"]).get_group("wind").index
-        return wind[onshore_id]
+        return self.get_profile("wind", start, end, onshore_id)
 
-    def get_wind_offshore(self):
+    def get_wind_offshore(self, start=None, end=None):
         """Returns wind offshore profile
 
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
         :return: (*pandas.DataFrame*) -- data frame of wind energy output for offshore
             turbines
         :raises ValueError: if no offshore wind turbines in grid
         """
-        wind = self.get_profile("wind")
         grid = self.get_grid()
         if "wind_offshore" in grid.plant["type"].unique():
             offshore_id = grid.plant.groupby(["type"]).get_group("wind_offshore").index
-            return wind[offshore_id]
+            return self.get_profile("wind", start, end, offshore_id)
         else:
             raise ValueError("No offshore wind turbines in grid")
 
-    def get_demand(self, original=True):
+    def get_demand(self, original=True, start=None, end=None, columns=None):
         """Returns demand profiles.
 
         :param bool original: should the original demand profile or the
             potentially modified one be returned.
+        :param start: first timestamp, included. Defaults to the first one.
+        :param end: last timestamp, included. Defaults to the last one.
+        :param list columns: zone ids. Defaults to all zones.
         :return: (*pandas.DataFrame*) -- data frame of demand (hour, zone).
         """
         if not original:
             print("Only original profile is accessible before scenario is complete")
-        return self.get_profile("demand")
+        return self.get_profile("demand", start, end, columns)
 
     def get_bus_demand(self):
         """Returns demand profiles, by bus.
@@ -1,6 +1,14 @@
+from types import SimpleNamespace
+
+import pandas as pd
 import pytest
 
+from powersimdata.input.abstract_grid import storage_template
+from powersimdata.input.transform_grid import TransformGrid
+from powersimdata.scenario import create
+from powersimdata.scenario.create import _Builder
 from powersimdata.scenario.scenario import Scenario
+from powersimdata.tests.mock_grid import MockGrid
 
 
 @pytest.mark.integration
@@ -10,3 +18,118 @@ def test_get_bus_demand():
     scenario.state.set_grid(interconnect="Texas")
     scenario.state.builder.set_base_profile("demand", "vJan2021")
     scenario.state.get_bus_demand()
+
+
+def _get_builder():
+    grid = MockGrid(
+        {
+            "bus": {
+                "bus_id": [1, 2],
+                "zone_id": [1, 2],
+                "interconnect": ["Western"] * 2,
+                "lat": [40.0, 41.0],
+                "lon": [-100.0, -101.0],
+                "baseKV": [230, 230],
+            },
+            "sub": {
+                "sub_id": [5],
+                "interconnect": ["Western"],
+                "interconnect_sub_id": [3],
+                "lat": [40.0],
+                "lon": [-100.0],
+            },
+            "bus2sub": {"bus_id": [1, 2], "sub_id": [5, 5]},
+            "plant": {
+                "plant_id": [1, 2],
+                "bus_id": [1, 2],
+                "type": ["coal", "solar"],
+                "zone_id": [1, 2],
+                "Pmax": [10.0, 20.0],
+                "Pmin": [1.0, 0.0],
+            },
+            "gencost_before": {
+                "plant_id": [1, 2],
+                "c0": [1.0, 0.0],
+                "c1": [2.0, 0.0],
+                "c2": [3.0, 0.0],
+            },
+            "branch": {
+                "branch_id": [1],
+                "from_bus_id": [1],
+                "to_bus_id": [2],
+                "rateA": [5.0],
+                "x": [1.0],
+            },
+            "dcline": {"dcline_id": [0], "Pmin": [-1.0], "Pmax": [1.0]},
+        }
+    )
+    grid.id2zone = {1: "a", 2: "b"}
+    grid.storage = storage_template()
+    builder = _Builder.__new__(_Builder)
+    builder.base_grid = grid
+    builder.change_table = SimpleNamespace(ct={})
+    builder._grid = None
+    builder._grid_ct = {}
+    return builder
+
+
+def test_builder_get_grid_is_incremental(monkeypatch):
+    builder = _get_builder()
+    ct = builder.change_table.ct
+    calls = []
+    transform = create.TransformGrid
+
+    class Spy(TransformGrid):
+        def __init__(self, grid, ct):
+            calls.append({t for t in self.tables if getattr(grid, t) is not None})
+            super().__init__(grid, ct)
+
+    monkeypatch.setattr(create, "TransformGrid", Spy)
+
+    def check(tables):
+        grid = builder.get_grid()
+        expected = transform(builder.base_grid, ct).get_grid()
+        for t in ["bus", "sub", "bus2sub", "branch", "dcline", "plant"]:
+            pd.testing.assert_frame_equal(getattr(grid, t), getattr(expected, t))
+        pd.testing.assert_frame_equal(
+            grid.gencost["before"], expected.gencost["before"]
+        )
+        for k in ["gen", "gencost", "StorageData"]:
+            pd.testing.assert_frame_equal(grid.storage[k], expected.storage[k])
+        assert grid.storage["genfuel"] == expected.storage["genfuel"]
+        assert calls.pop() >= tables if tables else not calls
+        assert not calls
+
+    check(set(TransformGrid.tables))
+    ct["coal"] = {"plant_id": {1: 2.0}}
+    check({"plant", "gencost"})
+    ct["demand"] = {"zone_id": {1: 1.1}}
+    check(set())
+    ct["dcline"] = {"dcline_id": {0: 0.5}}
+    check({"dcline"})
+    ct["storage"] = [
+        {
+            "bus_id": 1,
+            "capacity": 10,
+            "duration": 4,
+            "min_stor": 0.05,
+            "max_stor": 0.95,
+            "energy_value": 20,
+            "terminal_min": 0,
+            "terminal_max": 1,
+            "OutEff": 0.9,
+            "InEff": 0.9,
+            "LossFactor": 0,
+        }
+    ]
+    check({"storage"})
+    ct["new_bus"] = [{"zone_id": 2, "Pd": 0, "baseKV": 100, "lat": 50, "lon": -90}]
+    check({"bus", "sub", "bus2sub"})
+    ct["new_plant"] = [{"type": "solar", "bus_id": 3, "Pmin": 0, "Pmax": 5}]
+    check({"plant", "gencost", "storage"})
+    ct["coal"]["plant_id"][1] = 3.0
+    check({"plant", "gencost", "storage"})
+    del ct["storage"]
+    check({"storage"})
+    builder.get_grid().plant.loc[1, "Pmax"] = 0
+    check(set())
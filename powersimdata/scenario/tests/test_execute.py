@@ -0,0 +1,116 @@
+import os
+
+import fs as fs2
+import pytest
+
+from powersimdata.scenario import execute
+from powersimdata.scenario.execute import SimulationInput
+from powersimdata.tests.mock_grid import MockGrid
+from powersimdata.utility import server_setup
+
+
+class FakeDataAccess:
+    def __init__(self):
+        self.fs = fs2.open_fs("mem://")
+        self.join = fs2.path.join
+        self.moved = []
+
+    def tmp_folder(self, scenario_id):
+        return f"tmp/scenario_{scenario_id}"
+
+    def move_to(self, file_name, to_dir, change_name_to=None):
+        filepath = os.path.join(server_setup.LOCAL_DIR, file_name)
+        self.fs.makedirs(to_dir, recreate=True)
+        with open(filepath, "rb") as f:
+            self.fs.writebytes(self.join(to_dir, change_name_to), f.read())
+        os.remove(filepath)
+        self.moved.append(change_name_to)
+
+    def link(self, src, dest):
+        self.fs.makedirs(fs2.path.dirname(dest), recreate=True)
+        self.fs.copy(src, dest)
+
+
+class FakeTransformProfile:
+    def __init__(self, scenario_info, grid, ct):
+        self.ct = ct
+
+    def get_profile_key(self, name):
+        return f"{self.ct.get(name, 0)}"
+
+
+@pytest.fixture
+def simulation_input(tmp_path, monkeypatch):
+    monkeypatch.setattr(server_setup, "LOCAL_DIR", str(tmp_path))
+
+    def export_case_mat(grid, filepath, storage_filepath, do_compression=False):
+        open(filepath, "w").close()
+
+    def export_transformed_profile(kind, scenario_info, grid, ct, filepath):
+        if kind == "wind":
+            raise ValueError("wind")
+        with open(filepath, "w") as f:
+            f.write(f"{kind} {ct.get(kind, 0)}")
+
+    monkeypatch.setattr(execute, "export_case_mat", export_case_mat)
+    monkeypatch.setattr(execute, "TransformProfile", FakeTransformProfile)
+    monkeypatch.setattr(
+        execute, "export_transformed_profile", export_transformed_profile
+    )
+    return SimulationInput(FakeDataAccess(), {"id": "1"}, MockGrid({}), {})
+
+
+def test_prepare_all(simulation_input):
+    timings = simulation_input.prepare_all(["demand", "hydro", "solar"])
+    assert list(timings) == ["mpc", "demand", "hydro", "solar"]
+    assert all(t >= 0 for t in timings.values())
+    assert sorted(simulation_input._data_access.moved) == [
+        "case.mat",
+        "demand_0.csv.1.tmp",
+        "hydro_0.csv.1.tmp",
+        "solar_0.csv.1.tmp",
+    ]
+    data_access = simulation_input._data_access
+    assert data_access.fs.readtext("tmp/scenario_1/solar.csv") == "solar 0"
+
+
+def test_prepare_profile_is_reused(simulation_input):
+    data_access = simulation_input._data_access
+    simulation_input.prepare_profile("solar")
+    other = SimulationInput(data_access, {"id": "2"}, MockGrid({}), {})
+    other.prepare_profile("solar")
+    assert data_access.moved == ["solar_0.csv.1.tmp"]
+    assert data_access.fs.readtext("tmp/scenario_2/solar.csv") == "solar 0"
+
+    changed = SimulationInput(data_access, {"id": "3"}, MockGrid({}), {"solar": 2})
+    changed.prepare_profile("solar")
+    assert data_access.moved == ["solar_0.csv.1.tmp", "solar_2.csv.3.tmp"]
+    assert data_access.fs.readtext("tmp/scenario_3/solar.csv") == "solar 2"
+    assert sorted(data_access.fs.listdir(simulation_input.REL_PROFILE_DIR)) == [
+        "solar_0.csv",
+        "solar_2.csv",
+    ]
+
+
+def test_prepare_profile_stored_concurrently(simulation_input, monkeypatch):
+    data_access = simulation_input._data_access
+    other = SimulationInput(data_access, {"id": "2"}, MockGrid({}), {})
+    exists = data_access.fs.exists
+
+    def stored_by_other(path):
+        # Let the other scenario store the same profile after the first check
+        result = exists(path)
+        monkeypatch.setattr(data_access.fs, "exists", exists)
+        other.prepare_profile("solar")
+        return result
+
+    monkeypatch.setattr(data_access.fs, "exists", stored_by_other)
+    simulation_input.prepare_profile("solar")
+    assert data_access.moved == ["solar_0.csv.2.tmp", "solar_0.csv.1.tmp"]
+    assert data_access.fs.listdir(simulation_input.REL_PROFILE_DIR) == ["solar_0.csv"]
+    assert data_access.fs.readtext("tmp/scenario_1/solar.csv") == "solar 0"
+
+
+def test_prepare_all_failure(simulation_input):
+    with pytest.raises(ValueError, match="wind"):
+        simulation_input.prepare_all(["demand", "wind"])
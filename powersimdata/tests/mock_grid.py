@@ -1,3 +1,5 @@
+import copy
+
 import pandas as pd
 
 from powersimdata.input import const
@@ -145,6 +147,14 @@ class MockGrid:
             storage[storage_name] = df
         self.storage = storage
 
+    def view(self):
+        """Returns a copy of the mock grid, see :meth:`Grid.view`."""
+        return copy.deepcopy(self)
+
+    def mutable(self):
+        """Returns a copy of the mock grid, see :meth:`Grid.mutable`."""
+        return copy.deepcopy(self)
+
     @property
     def __class__(self):
         """If anyone asks, I'm a Grid object!"""
@@ -30,6 +30,7 @@ class Config:
     INPUT_DIR = ("data", "input")
     OUTPUT_DIR = ("data", "output")
     LOCAL_DIR = os.path.join(Path.home(), "ScenarioData", "")
+    MEMORY_CACHE_SIZE = int(os.getenv("MEMORY_CACHE_SIZE", 4 * 1024**3))  # bytes
 
 
 @dataclass(frozen=True)
@@ -1,25 +1,62 @@
 import copy
+import hashlib
 import importlib
 import os
+import pickle
 import sys
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+
+import numpy as np
+import pandas as pd
 
 
 class MemoryCache:
-    """Wrapper around a dict object that exposes a cache interface. Users should
-    create a separate instance for each distinct use case.
+    """Least recently used cache, with an optional size budget. Users should create a
+    separate instance for each distinct use case.
+
+    Numeric values of data frames, series and arrays are copied once when added and
+    made read-only. The cache then shares them with every caller, which gets a
+    shallow copy. Object columns are copied. Lists, tuples, sets and dicts are
+    rebuilt, other objects are deep copied.
+
+    :param int max_size: maximum size of the cached objects, in bytes. If None, the
+        cache is unbounded.
     """
 
-    def __init__(self):
+    def __init__(self, max_size=None):
         """Constructor"""
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._size = {}
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size(self):
+        """Total size of the cached objects.
+
+        :return: (*int*) -- size in bytes.
+        """
+        return sum(self._size.values())
 
     def put(self, key, obj):
-        """Add or set the value for the given key.
+        """Add or set the value for the given key. The cache keeps read-only copies of
+        the data frames, series and arrays enclosed in ``obj``, which is left
+        unchanged.
 
         :param tuple key: a tuple used to lookup the cached value
         :param Any obj: the object to cache
         """
-        self._cache[key] = copy.deepcopy(obj)
+        self._remove(key)
+        size = _get_size(obj)
+        if self.max_size is not None and size > self.max_size:
+            self.evictions += 1
+            return
+        self._cache[key] = _freeze(obj)
+        self._size[key] = size
+        self._evict()
 
     def get(self, key):
         """Retrieve the value associated with key if it exists.
@@ -27,8 +64,40 @@ class MemoryCache:
         :param tuple key: the cache key
         :return: (*Any* or *NoneType*) -- the cached value if found, or None
         """
-        if key in self._cache.keys():
-            return copy.deepcopy(self._cache[key])
+        if key not in self._cache:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._cache.move_to_end(key)
+        return read_only_copy(self._cache[key])
+
+    def resize(self, max_size):
+        """Set the size budget, evicting least recently used objects if needed.
+
+        :param int max_size: maximum size of the cached objects, in bytes. If None,
+            the cache is unbounded.
+        """
+        self.max_size = max_size
+        self._evict()
+
+    def clear(self):
+        """Remove all cached objects."""
+        self._cache.clear()
+        self._size.clear()
+
+    def stats(self):
+        """Return cache statistics.
+
+        :return: (*dict*) -- number of hits, misses, evictions and cached objects as
+            well as total size in bytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._cache),
+            "size": self.size,
+        }
 
     def list_keys(self):
         """Return and print the current cache keys.
@@ -39,6 +108,207 @@ class MemoryCache:
         print(keys)
         return keys
 
+    def _remove(self, key):
+        """Remove key from the cache, if present.
+
+        :param tuple key: the cache key
+        """
+        self._cache.pop(key, None)
+        self._size.pop(key, None)
+
+    def _evict(self):
+        """Evict least recently used objects until the size budget is met."""
+        if self.max_size is None:
+            return
+        total = self.size
+        while total > self.max_size:
+            key, _ = self._cache.popitem(last=False)
+            total -= self._size.pop(key)
+            self.evictions += 1
+
+
+class DiskCache:
+    """Cache persisting pickled objects in a directory. Users should create a
+    separate instance, i.e. directory, for each distinct use case.
+
+    :param str cache_dir: directory where objects are stored.
+    """
+
+    def __init__(self, cache_dir):
+        """Constructor"""
+        self.cache_dir = cache_dir
+
+    def _get_filepath(self, key):
+        """Return the path of the file associated with key.
+
+        :param tuple key: the cache key
+        :return: (*str*) -- path to file.
+        """
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".pkl")
+
+    def put(self, key, obj):
+        """Add or set the value for the given key. The file is written under a
+        temporary name and then renamed, such that readers never see partial files.
+
+        :param tuple key: a tuple used to lookup the cached value
+        :param Any obj: the object to cache
+        """
+        filepath = self._get_filepath(key)
+        tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(tmp_filepath, "wb") as f:
+            pickle.dump((key, obj), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filepath, filepath)
+
+    def get(self, key):
+        """Retrieve the value associated with key if it exists. Unreadable files, e.g.
+        written by an incompatible version of a dependency, are ignored.
+
+        :param tuple key: the cache key
+        :return: (*Any* or *NoneType*) -- the cached value if found, or None
+        """
+        try:
+            with open(self._get_filepath(key), "rb") as f:
+                cached_key, obj = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            print("Ignoring unreadable cache file for %s" % (key,))
+            return None
+        return obj if cached_key == key else None
+
+    def clear(self):
+        """Remove all cached objects."""
+        if os.path.isdir(self.cache_dir):
+            for f in os.listdir(self.cache_dir):
+                if f.endswith(".pkl"):
+                    os.remove(os.path.join(self.cache_dir, f))
+
+
+_immutable_types = (str, bytes, int, float, complex, bool, type(None), pd.Index)
+
+
+def _read_only_values(values, copy=False):
+    """Return read-only numeric values. Object arrays and extension arrays are copied
+    and left modifiable, since pandas can not compare read-only object arrays.
+
+    :param numpy.ndarray/pandas.api.extensions.ExtensionArray values: values.
+    :param bool copy: whether to copy numeric values which are already read-only.
+        Numeric values which are modifiable are always copied.
+    :return: (*numpy.ndarray/pandas.api.extensions.ExtensionArray*) -- values.
+    """
+    if not isinstance(values, np.ndarray) or values.dtype == object:
+        return values.copy()
+    values = values.copy() if copy or values.flags.writeable else values.view()
+    values.flags.writeable = False
+    return values
+
+
+def _column_values(series):
+    """Return the values of a series, without conversion of extension arrays.
+
+    :param pandas.Series series: series.
+    :return: (*numpy.ndarray/pandas.api.extensions.ExtensionArray*) -- values.
+    """
+    return series.to_numpy() if isinstance(series.dtype, np.dtype) else series.array
+
+
+def _share(obj, copy=False):
+    """Return a copy of a data frame, series or array whose numeric values are
+    read-only. Numeric values which are already read-only are shared with the
+    original unless copy is True, others are copied.
+
+    :param pandas.DataFrame/pandas.Series/numpy.ndarray obj: object to copy.
+    :param bool copy: whether to copy numeric values which are already read-only.
+    :return: (*pandas.DataFrame/pandas.Series/numpy.ndarray*) -- copy.
+    """
+    if isinstance(obj, np.ndarray):
+        return _read_only_values(obj, copy)
+    if isinstance(obj, pd.Series):
+        values = _read_only_values(_column_values(obj), copy)
+        return pd.Series(values, index=obj.index, name=obj.name, copy=False)
+    dtypes = set(obj.dtypes)
+    dtype = dtypes.pop() if len(dtypes) == 1 else None
+    if isinstance(dtype, np.dtype) and dtype != object:
+        values = _read_only_values(obj.to_numpy(), copy)
+        return pd.DataFrame(values, index=obj.index, columns=obj.columns, copy=False)
+    values = {
+        i: _read_only_values(_column_values(obj.iloc[:, i]), copy)
+        for i in range(obj.shape[1])
+    }
+    df = pd.DataFrame(values, index=obj.index, copy=False)
+    df.columns = obj.columns
+    return df
+
+
+def _freeze(obj):
+    """Make read-only copies of data frames, series and arrays and rebuild
+    containers, such that later modifications of the original object do not affect
+    the cache.
+
+    :param Any obj: object to freeze.
+    :return: (*Any*) -- frozen object.
+    """
+    if isinstance(obj, _immutable_types):
+        return obj
+    if isinstance(obj, (pd.DataFrame, pd.Series, np.ndarray)):
+        return _share(obj, copy=True)
+    if isinstance(obj, dict):
+        return {k: _freeze(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return type(obj)(_freeze(v) for v in obj)
+    return copy.deepcopy(obj)
+
+
+def read_only_copy(obj):
+    """Return a read-only copy of an object made of data frames, series, arrays and
+    containers. Numeric values of data frames, series and arrays which are already
+    read-only are shared with the original, others are copied once and made
+    read-only. Object columns are always copied and left modifiable, since pandas can
+    not compare read-only object arrays.
+    Containers are rebuilt, such that columns, tables or items of the copy can be
+    replaced without affecting the original.
+
+    :param Any obj: object to copy.
+    :return: (*Any*) -- read-only copy.
+    """
+    if isinstance(obj, _immutable_types):
+        return obj
+    if isinstance(obj, (pd.DataFrame, pd.Series, np.ndarray)):
+        return _share(obj)
+    if isinstance(obj, dict):
+        return {k: read_only_copy(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return type(obj)(read_only_copy(v) for v in obj)
+    return copy.deepcopy(obj)
+
+
+def _get_size(obj, seen=None):
+    """Estimate the memory used by an object.
+
+    :param Any obj: object.
+    :param set seen: identifiers of the objects already accounted for.
+    :return: (*int*) -- size in bytes.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=True))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(_get_size(v, seen) for v in obj.values())
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(_get_size(v, seen) for v in obj)
+    if hasattr(obj, "__dict__") and isinstance(vars(obj), dict):
+        return sys.getsizeof(obj) + _get_size(vars(obj), seen)
+    return sys.getsizeof(obj)
+
 
 def cache_key(*args):
     """Creates a cache key from the given args. The user should ensure that the
@@ -79,6 +349,18 @@ class CacheKeyBuilder:
         raise ValueError(f"unsupported type for cache key = {type(arg)}")
 
 
+def get_package_version():
+    """Returns the version of the installed powersimdata package.
+
+    :return: (*str*) -- version, or *'dev'* when running from a source tree that
+        is not installed.
+    """
+    try:
+        return version("powersimdata")
+    except PackageNotFoundError:
+        return "dev"
+
+
 class PrintManager:
     """Manages print messages."""
 
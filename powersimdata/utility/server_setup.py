@@ -13,6 +13,7 @@ OUTPUT_DIR = config.OUTPUT_DIR
 LOCAL_DIR = config.LOCAL_DIR
 MODEL_DIR = config.MODEL_DIR
 ENGINE_DIR = config.ENGINE_DIR
+MEMORY_CACHE_SIZE = config.MEMORY_CACHE_SIZE
 DEPLOYMENT_MODE = get_deployment_mode()
 
 os.makedirs(LOCAL_DIR, exist_ok=True)
@@ -1,6 +1,13 @@
+import numpy as np
+import pandas as pd
 import pytest
 
-from powersimdata.utility.helpers import MemoryCache, PrintManager, cache_key
+from powersimdata.utility.helpers import (
+    DiskCache,
+    MemoryCache,
+    PrintManager,
+    cache_key,
+)
 
 
 def test_print_is_disabled(capsys):
@@ -72,3 +79,107 @@ def test_mem_cache_put_version_never_changes():
     assert "key1" in cache.get(key)
     assert "key2" not in cache.get(key)
     assert "key2" in obj
+
+
+def test_mem_cache_data_frame_is_shared_and_read_only():
+    cache = MemoryCache()
+    key = cache_key("foo")
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    cache.put(key, {"df": df})
+    cached = cache.get(key)["df"]
+    assert cached is not df
+    assert not np.shares_memory(cached["a"].to_numpy(), df["a"].to_numpy())
+    assert np.shares_memory(
+        cached["a"].to_numpy(), cache.get(key)["df"]["a"].to_numpy()
+    )
+    with pytest.raises(ValueError):
+        cached.loc[0, "a"] = 42
+    cached["a"] = [5.0, 6.0]
+    assert df["a"].tolist() == [1.0, 2.0]
+
+
+def test_mem_cache_original_stays_modifiable():
+    cache = MemoryCache()
+    key = cache_key("foo")
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+    array = np.arange(3)
+    cache.put(key, {"df": df, "array": array})
+    df.loc[0, "a"] = 42
+    df.iloc[1, 0] *= 10
+    array[0] = 42
+    assert df["a"].tolist() == [42.0, 20.0]
+    cached = cache.get(key)
+    assert cached["df"]["a"].tolist() == [1.0, 2.0]
+    assert cached["array"].tolist() == [0, 1, 2]
+    with pytest.raises(ValueError):
+        cached["array"][0] = 0
+
+
+def test_mem_cache_object_column_is_copied():
+    cache = MemoryCache()
+    key = cache_key("foo")
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+    cache.put(key, df)
+    cached = cache.get(key)
+    assert (cached["b"] == "x").tolist() == [True, False]
+    cached.loc[0, "b"] = "z"
+    assert cache.get(key)["b"].tolist() == ["x", "y"]
+    assert df["b"].tolist() == ["x", "y"]
+
+
+def test_mem_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_size=2500)
+    for k in ["foo", "bar", "baz"]:
+        cache.put(cache_key(k), np.zeros(100))
+    assert cache.get(cache_key("foo")) is not None
+    cache.put(cache_key("qux"), np.zeros(100))
+    assert cache.get(cache_key("bar")) is None
+    assert cache.get(cache_key("baz")) is not None
+    assert cache.size <= 2500
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+        "entries": 3,
+        "size": 2400,
+    }
+
+
+def test_mem_cache_too_large_object_is_not_cached():
+    cache = MemoryCache(max_size=100)
+    key = cache_key("foo")
+    cache.put(key, np.zeros(100))
+    assert cache.get(key) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_mem_cache_resize():
+    cache = MemoryCache()
+    for k in ["foo", "bar"]:
+        cache.put(cache_key(k), np.zeros(100))
+    cache.resize(1000)
+    assert cache.list_keys() == [("bar",)]
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"))
+    key = cache_key("foo", 1)
+    assert cache.get(key) is None
+
+    df = pd.DataFrame({"a": [1, 2], "b": [3.0, 4.0]})
+    cache.put(key, {"df": df})
+    result = DiskCache(str(tmp_path / "cache")).get(key)
+    pd.testing.assert_frame_equal(result["df"], df)
+    assert cache.get(cache_key("foo", 2)) is None
+
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_disk_cache_unreadable_file(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    key = cache_key("foo")
+    cache.put(key, [1, 2, 3])
+    with open(cache._get_filepath(key), "wb") as f:
+        f.write(b"garbage")
+    assert cache.get(key) is None